@@ -479,6 +479,9 @@ def run_cli_wrapped() -> None:
         else:
             print("novem: -A requires a named computer, e.g. novem -c <name> -A", file=sys.stderr)
         sys.exit(1)
+    if args.get("forward") and not args.get("computer"):
+        print("novem: -L requires a named computer, e.g. novem -c <name> -L 8888:localhost:8888", file=sys.stderr)
+        sys.exit(1)
     if args.get("run_job") is not None and not (args.get("computer") or args.get("job")):
         print("novem: -R requires a named computer or job", file=sys.stderr)
         sys.exit(1)
@@ -77,6 +77,8 @@ CliArgs = TypedDict(
         "input": Optional[List[List[str]]],  # -w, action="append", nargs="+"
         "input_dir": Optional[List[str]],  # action="append"
         "output_dir": Optional[List[str]],  # action="append"
+        "archive": Optional[str],  # --archive tar.gz|tar.zst
+        "workers": Optional[int],  # --workers, for -j a,b,c -R
         "out": Optional[str],
         "edit": Optional[str],
         "filter": Optional[List[str]],  # action="append"
@@ -86,7 +88,9 @@ CliArgs = TypedDict(
         "run_job": Optional[List[str]],  # nargs="*"
         "argv": Optional[List[str]],  # the tail after `--`
         "attach": bool,
+        "forward": Optional[List[str]],  # -L, action="append"
         "connect_timeout": float,
+        "stats": bool,  # --stats, for -R/-A
         "events": Optional[List[str]],  # nargs="+"
         # raw http (post/put take PATH [DATA] -> nargs="+")
         "http_get": Optional[str],
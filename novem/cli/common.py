@@ -1,6 +1,8 @@
+import json
 import os
 import sys
-from typing import Any, Dict, Literal, Optional, cast
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, cast
 
 from novem import Computer, Doc, Grid, Image, Job, Mail, Plot, Repo, Space
 from novem.api_ref import Novem404, NovemAPI, NovemException
@@ -21,7 +23,9 @@ from novem.cli.vis import (
     list_vis_shares,
     list_vis_tags,
 )
-from novem.code import NovemCodeAPI
+from novem.code import NovemCodeAPI, SessionStats
+from novem.code.compute import _SIGNAL_NUMBERS
+from novem.job.runner import JobResult, JobRunner
 from novem.utils import API_ROOT, data_on_stdin, stream_on_stdin
 from novem.vis import NovemVisAPI
 
@@ -351,6 +355,111 @@ def plot(args: CliArgs) -> None:
     plot(args)
 
 
+def _transfer_progress(label: str) -> Optional[Callable[[int, Optional[int]], None]]:
+    """A stderr progress line for job transfers, or None when stderr is not a terminal."""
+    if not sys.stderr.isatty():
+        return None
+
+    last = [-1]
+    started = time.monotonic()
+
+    def report(done: int, total: Optional[int]) -> None:
+        mib = done / (1024 * 1024)
+        elapsed = time.monotonic() - started
+        rate = f", {mib / elapsed:.1f} MiB/s" if elapsed > 0 else ""
+        if total:
+            pct = done * 100 // total
+            if pct == last[0]:
+                return
+            last[0] = pct
+            line = f"{label}: {mib:.1f} / {total / (1024 * 1024):.1f} MiB ({pct}%{rate})"
+        else:
+            if int(mib) == last[0]:
+                return
+            last[0] = int(mib)
+            line = f"{label}: {mib:.1f} MiB{rate}"
+        end = "\n" if total and done >= total else ""
+        print(f"\r{line}", end=end, file=sys.stderr, flush=True)
+
+    return report
+
+
+def _split_job_io(args: CliArgs) -> Tuple[List[str], List[str], Optional[str], Optional[str]]:
+    """Split -i/-o into (input files, input dirs, output dir, output file)."""
+    inputs = args.get("input_dir") or []
+    outputs = args.get("output_dir") or []
+
+    # @file.ext is one file; a bare path is a directory of files
+    in_files = [i for i in inputs if i.startswith("@")]
+    in_dirs = [i for i in inputs if not i.startswith("@")]
+
+    if len(outputs) > 1:
+        print(
+            "-o can only be given once: a run returns a single output",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    out_dir: Optional[str] = None
+    out_file: Optional[str] = None
+    if outputs:
+        if outputs[0].startswith("@"):
+            out_file = outputs[0][1:]
+        else:
+            out_dir = outputs[0]
+    return in_files, in_dirs, out_dir, out_file
+
+
+def run_jobs(names: List[str], args: CliArgs) -> None:
+    """-j a,b,c -R: run several jobs concurrently and report each one."""
+    if args.get("run_job") or args.get("argv"):
+        print("-R does not take run arguments yet; each job runs its configured invocation.", file=sys.stderr)
+        sys.exit(1)
+
+    in_files, in_dirs, out_dir, out_file = _split_job_io(args)
+    if out_file:
+        print("-o @file names one file; give a directory to collect several jobs' outputs", file=sys.stderr)
+        sys.exit(1)
+
+    json_output = args.get("json_output", False)
+
+    def report(result: JobResult) -> None:
+        if json_output:
+            return
+        status = "ok" if result.ok else "FAIL"
+        detail = (result.output or "") if result.ok else (result.error or "")
+        print(f"{status:<4} {result.job:<{width}} {result.seconds:>8.2f}s  {detail}".rstrip(), flush=True)
+
+    if out_dir and len(set(names)) < len(names):
+        print("-o collects each job's output in a folder of its name; give each job only once", file=sys.stderr)
+        sys.exit(1)
+
+    width = max(len(n) for n in names)
+    runner = JobRunner(
+        names,
+        max_workers=max(args.get("workers") or 8, 1),
+        output_dir=out_dir,
+        input_dir=in_dirs or None,
+        files=in_files or None,
+        archive=args.get("archive"),
+        on_result=report,
+        ignore_ssl=args.get("ignore_ssl", False),
+        config_path=args["config_path"],
+        qpr=args.get("qpr"),
+        debug=args.get("debug"),
+        config_profile=args["profile"],
+        is_cli=True,
+    )
+    runner.run()
+
+    if json_output:
+        print(json.dumps(runner.manifest(), indent=2))
+    else:
+        done = sum(r.ok for r in runner.results)
+        print(f"{done}/{len(runner.results)} jobs succeeded in {runner.seconds:.2f}s", file=sys.stderr)
+    if not runner.ok:
+        sys.exit(1)
+
+
 def job(args: CliArgs) -> None:
     name = args["job"]
 
@@ -359,6 +468,11 @@ def job(args: CliArgs) -> None:
         list_jobs(args)
         return
 
+    # -j a,b,c -R: fan out over several jobs
+    if "," in name and args.get("run_job") is not None:
+        run_jobs([n for n in name.split(",") if n], args)
+        return
+
     # Delete job
     if args["delete"]:
         novem = NovemAPI(**config_from_args(args), is_cli=True)
@@ -414,32 +528,16 @@ def job(args: CliArgs) -> None:
                 )
             sys.exit(1)
 
-        inputs = args.get("input_dir") or []
-        outputs = args.get("output_dir") or []
-
-        # @file.ext is one file; a bare path is a directory of files
-        in_files = [i for i in inputs if i.startswith("@")]
-        in_dirs = [i for i in inputs if not i.startswith("@")]
-
-        if len(outputs) > 1:
-            print(
-                "-o can only be given once: a run returns a single output",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-        out_dir: Optional[str] = None
-        out_file: Optional[str] = None
-        if outputs:
-            if outputs[0].startswith("@"):
-                out_file = outputs[0][1:]
-            else:
-                out_dir = outputs[0]
+        in_files, in_dirs, out_dir, out_file = _split_job_io(args)
 
         j.run(
             files=in_files or None,
             input_dir=in_dirs or None,
             output=out_dir,
             output_file=out_file,
+            progress=_transfer_progress("uploading"),
+            archive=args.get("archive"),
+            download_progress=_transfer_progress("downloading"),
         )
         return
 
@@ -586,6 +684,11 @@ def code_resource(args: CliArgs, kind: str) -> None:
         list_code_vis(args, kind)
         return
 
+    # -c a,b,c -R: the same command on several computers
+    if kind == "computer" and "," in name and args.get("run_job") is not None:
+        _computer_fanout([n for n in name.split(",") if n], args)
+        return
+
     # Images are derived from their source repo: not creatable, not deletable
     if kind == "image" and (args["delete"] or args["create"]):
         print("Images are derived from their source repo and cannot be created or deleted directly")
@@ -670,7 +773,7 @@ def code_resource(args: CliArgs, kind: str) -> None:
         # --image REF sets config/image; a bare --image reads it back, the
         # same way a bare -s lists shares and a bare -t lists tags
         image_ref = args.get("image_ref")
-        has_session = args.get("run_job") is not None or args.get("attach")
+        has_session = args.get("run_job") is not None or args.get("attach") or args.get("forward")
         if image_ref is None and not has_session:
             print(obj.api_read("/config/image"), end="")
             return
@@ -756,8 +859,8 @@ def code_resource(args: CliArgs, kind: str) -> None:
     if tag_op is Tag.CHECK:
         check_membership(kind, name, args, "tags", tag_targets)
 
-    # -R (run) and -A (attach) open a live session on a computer
-    if args.get("run_job") is not None or args.get("attach"):
+    # -R (run), -A (attach) and -L (forward) open a live session on a computer
+    if args.get("run_job") is not None or args.get("attach") or args.get("forward"):
         _computer_session(args, obj, kind)
         return
 
@@ -775,10 +878,8 @@ def _computer_session(args: CliArgs, obj: NovemCodeAPI, kind: str) -> None:
     just been told to boot answers retryable states until its agent is
     reachable, so both wait rather than failing immediately.
     """
-    from novem.code.compute import NovemComputeError, NovemComputeTransportError
-
     if kind != "computer":
-        print(f"-R and -A are only available for computers, not {kind}s", file=sys.stderr)
+        print(f"-R, -A and -L are only available for computers, not {kind}s", file=sys.stderr)
         sys.exit(1)
 
     computer = cast(Computer, obj)
@@ -793,6 +894,39 @@ def _computer_session(args: CliArgs, obj: NovemCodeAPI, kind: str) -> None:
             wait_reported = True
 
     try:
+        code, signal = _computer_call(args, computer, argv, retry, on_retry)
+    finally:
+        if args.get("stats") and computer.last_stats is not None:
+            _print_session_stats(computer.last_stats)
+
+    # a signalled process has no exit code of its own; report it the way a
+    # shell does so callers can branch on it
+    if signal:
+        signal_number = _SIGNAL_NUMBERS.get(signal)
+        if signal_number is None:
+            print(f"novem: command ended with an unknown signal {signal!r}", file=sys.stderr)
+            sys.exit(255)
+        sys.exit(128 + signal_number)
+    sys.exit(code)
+
+
+def _computer_call(
+    args: CliArgs,
+    computer: Computer,
+    argv: Optional[List[str]],
+    retry: float,
+    on_retry: Callable[[NovemException], None],
+) -> Tuple[int, Optional[str]]:
+    """Run the -L / -A / -R session itself, exiting on anything but a result."""
+    from novem.code.compute import NovemComputeError, NovemComputeTransportError
+
+    try:
+        if args.get("forward"):
+            if args.get("attach") or args.get("run_job") is not None:
+                print("-L runs on its own; it cannot be combined with -R or -A", file=sys.stderr)
+                sys.exit(1)
+            _computer_forward(computer, args["forward"] or [], retry, on_retry)
+            sys.exit(0)
         if args.get("attach"):
             if args.get("run_job") is not None:
                 print("-A and -R cannot be combined; attach or run one command", file=sys.stderr)
@@ -826,19 +960,148 @@ def _computer_session(args: CliArgs, obj: NovemCodeAPI, kind: str) -> None:
     except NovemException as e:
         print(f"novem: {e.cli_message}", file=sys.stderr)
         sys.exit(255)
+    return code, signal
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f} ms"
+
+
+def _bytes(n: int) -> str:
+    if n < 1024:
+        return f"{n} B"
+    if n < 1024 * 1024:
+        return f"{n / 1024:.1f} KiB"
+    return f"{n / (1024 * 1024):.1f} MiB"
+
+
+def _print_session_stats(stats: SessionStats) -> None:
+    """--stats: where the time went, to tell a slow command from a slow link."""
+    conn, ch = stats.connection, stats.channel
+    setup = _ms(None if conn.handshake_seconds is None else conn.handshake_seconds + (conn.hello_seconds or 0.0))
+    rtt = f"rtt {_ms(conn.rtt_seconds)}"
+    if conn.pings > 1:
+        rtt += f" (min {_ms(conn.rtt_min_seconds)} over {conn.pings} pings)"
+    print(
+        f"novem: connect {setup} (upgrade {_ms(conn.handshake_seconds)}, hello {_ms(conn.hello_seconds)}), {rtt}",
+        file=sys.stderr,
+    )
+    print(
+        f"novem: channel ready in {_ms(ch.admission_seconds)}; "
+        f"sent {_bytes(ch.bytes_sent)} in {ch.frames_sent} frames, "
+        f"received {_bytes(ch.bytes_received)} in {ch.frames_received} frames",
+        file=sys.stderr,
+    )
 
-    # a signalled process has no exit code of its own; report it the way a
-    # shell does so callers can branch on it
-    if signal:
-        signal_number = _SIGNAL_NUMBERS.get(signal)
-        if signal_number is None:
-            print(f"novem: command ended with an unknown signal {signal!r}", file=sys.stderr)
-            sys.exit(255)
-        sys.exit(128 + signal_number)
-    sys.exit(code)
 
+def _forward_spec(spec: str) -> Tuple[str, int, str, int]:
+    """Parse an ssh-style ``[BIND:]PORT:HOST:HOSTPORT`` into its parts."""
+    parts = spec.rsplit(":", 3)
+    if len(parts) == 3:
+        parts.insert(0, "127.0.0.1")
+    if len(parts) != 4 or not parts[1].isdigit() or not parts[3].isdigit() or not parts[2]:
+        raise ValueError(f"-L {spec}: expected [BIND:]PORT:HOST:HOSTPORT, e.g. 8888:localhost:8888")
+    bind = parts[0].strip("[]") or "127.0.0.1"
+    return bind, int(parts[1]), parts[2].strip("[]"), int(parts[3])
+
+
+def _computer_forward(
+    computer: Computer,
+    specs: List[str],
+    retry: float,
+    on_retry: Callable[[NovemException], None],
+) -> None:
+    """-L: tunnel local ports to the computer until interrupted."""
+    try:
+        parsed = [_forward_spec(spec) for spec in specs]
+    except ValueError as e:
+        print(f"novem: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    def on_error(e: BaseException) -> None:
+        print(f"novem: forwarded connection failed: {getattr(e, 'cli_message', e)}", file=sys.stderr)
+
+    forwards = []
+    try:
+        for bind, port, host, host_port in parsed:
+            try:
+                fwd = computer.forward(
+                    port, host, host_port, local_host=bind, retry_seconds=retry, on_retry=on_retry, on_error=on_error
+                )
+            except OSError as e:
+                print(f"novem: cannot listen on {bind}:{port}: {e.strerror or e}", file=sys.stderr)
+                sys.exit(1)
+            forwards.append(fwd)
+            print(f"novem: forwarding {bind}:{fwd.port} -> {host}:{host_port}", file=sys.stderr)
+        print("novem: press Ctrl-C to stop", file=sys.stderr)
+        forwards[0].wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for fwd in forwards:
+            fwd.close()
+
+
+def _computer_fanout(names: List[str], args: CliArgs) -> None:
+    """-c a,b,c -R -- cmd: run one command on every computer at once.
+
+    Output is streamed with each line prefixed by its computer. The exit
+    status is 0 when every computer succeeded, otherwise the first failing
+    computer's own status (255 when it could not be reached).
+    """
+    from novem.code.compute import aggregate_status, run_on
+
+    argv = args.get("argv")
+    if args.get("attach"):
+        print("-A attaches to one computer; give a single name", file=sys.stderr)
+        sys.exit(1)
+    if not argv:
+        print(
+            f"-R on computers needs a command to run, e.g.\n  novem -c {','.join(names)} -R -- uptime", file=sys.stderr
+        )
+        sys.exit(1)
+
+    computers = [
+        Computer(
+            name,
+            user=args.get("for_user") or None,
+            ignore_ssl=args.get("ignore_ssl", False),
+            create=False,
+            config_path=args["config_path"],
+            qpr=args.get("qpr"),
+            debug=args.get("debug"),
+            config_profile=args["profile"],
+            is_cli=True,
+        )
+        for name in names
+    ]
+    waiting: List[str] = []
+
+    def on_retry(computer: Computer, _: NovemException) -> None:
+        if computer.id not in waiting:
+            waiting.append(computer.id)
+            print(f"novem: waiting for {computer.id}...", file=sys.stderr)
+
+    try:
+        results = run_on(
+            computers,
+            argv,
+            stream=True,
+            concurrency=max(args.get("workers") or len(computers), 1),
+            retry_seconds=float(args.get("connect_timeout", 90.0)),
+            on_retry=on_retry,
+        )
+    except KeyboardInterrupt:
+        print("novem: interrupted", file=sys.stderr)
+        sys.exit(130)
 
-_SIGNAL_NUMBERS = {"HUP": 1, "INT": 2, "QUIT": 3, "KILL": 9, "TERM": 15}
+    for result in results:
+        if result.error:
+            print(f"novem: {result.computer}: {result.error}", file=sys.stderr)
+    failed = [r.computer for r in results if not r.ok]
+    if failed:
+        print(f"novem: {len(failed)}/{len(results)} computers failed: {', '.join(failed)}", file=sys.stderr)
+    sys.exit(aggregate_status(results))
 
 
 def space(args: CliArgs) -> None:
@@ -96,6 +96,7 @@ _PROMOTION_BLOCKERS = {
 # when a new flag is added without deciding whether it claims the invocation.
 _PROMOTION_NEUTRAL = {
     "--api-url",
+    "--archive",
     "--bcc",
     "--cc",
     "--color",
@@ -117,12 +118,14 @@ _PROMOTION_NEUTRAL = {
     "--output",
     "--profile",
     "--qpr",
+    "--stats",
     "--subject",
     "--to",
     "--token",
     "--token-name",
     "--tree",
     "--type",
+    "--workers",
 }
 
 # Short flags that take a value, for recognising the attached form (-pmyplot).
@@ -313,7 +316,7 @@ def setup(raw_args: Any = None) -> Tuple[Any, CliArgs]:
         action="store_true",
         required=False,
         default=False,
-        help="output events as JSON lines (default is human-readable)",
+        help="output events as JSON lines, or a -j a,b,c -R run as a JSON manifest (default is human-readable)",
     )
 
     parser.add_argument(
@@ -826,6 +829,25 @@ an inline string, @filename to read from a file, or piped via stdin.""",
         "into that directory (created if needed)",
     )
 
+    job.add_argument(
+        "--archive",
+        dest="archive",
+        action="store",
+        choices=["tar.gz", "tar.zst"],
+        default=None,
+        metavar="FORMAT",
+        help="send the -i inputs with -R as one compressed tarball (tar.gz or tar.zst) packed while it uploads",
+    )
+
+    job.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="how many of -j a,b,c -R or -c a,b,c -R run at once (default: 8 jobs, every computer)",
+    )
+
     code = parser.add_argument_group(
         "coding resources",
         description="""\
@@ -901,6 +923,23 @@ resource is selected they keep their usual meaning:
         help="attach an interactive shell to the selected computer",
     )
 
+    code.add_argument(
+        "-L",
+        dest="forward",
+        action="append",
+        default=None,
+        metavar="[BIND:]PORT:HOST:HOSTPORT",
+        help="forward local PORT to HOST:HOSTPORT as seen from the selected computer, until Ctrl-C. Repeatable",
+    )
+
+    code.add_argument(
+        "--stats",
+        dest="stats",
+        action="store_true",
+        default=False,
+        help="after -R/-A, print connection and channel latency and traffic to stderr",
+    )
+
     code.add_argument(
         "--connect-timeout",
         dest="connect_timeout",
@@ -13,7 +13,7 @@ subclasses set ``_collection``/``_label`` and add their own properties.
 """
 
 import sys
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, cast
+from typing import IO, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 from novem.exceptions import Novem403, Novem404, NovemException, raise_on_response
 
@@ -24,11 +24,16 @@ from ..tags import NovemTags
 from ..utils import cl
 from ..utils import colors as clrs
 from .compute import (
+    Channel,
     ComputeConnection,
+    ComputePool,
     ExecResult,
+    HostResult,
     NovemComputeError,
     NovemComputeTransportError,
+    SessionStats,
     StdinSource,
+    _connected,
     _exec_collect_channel,
     _exec_stream_channel,
     _open_interactive_pty,
@@ -36,10 +41,15 @@ from .compute import (
     _run_sync,
     _split_argv,
     _with_retry,
+    aggregate_status,
+    run_on,
+    shared_pool,
     target_for,
     ws_url,
 )
+from .forward import PortForward
 from .space_content import SpaceChange, SpaceContent, SpaceDir, SpaceEntry, SpaceFileInfo, SpacePath, space_changes
+from .transfer import NovemTransferError, TransferStats, download, download_tree, upload, upload_tree
 
 
 class NovemCodeConfig:
@@ -497,6 +507,14 @@ class Computer(NovemCodeAPI):
 
     Config leaves: ``config/{type,image,cpu,memory,disk,idle,ttl}``.
     ``status`` accepts the verbs ``online``, ``offline`` and ``reboot``.
+
+    With ``keepalive=True``, :meth:`run` and :meth:`stream` share one
+    long-lived connection (see :func:`shared_pool`) instead of connecting
+    for every call.
+
+    After :meth:`run`, :meth:`stream` or :meth:`shell`, ``last_stats`` holds
+    the :class:`SessionStats` of the connection and channel it used: setup
+    and admission latency, traffic and round-trip time.
     """
 
     _collection = "computers"
@@ -506,6 +524,8 @@ class Computer(NovemCodeAPI):
 
     def __init__(self, id: str, **kwargs: Any) -> None:
         self.id = id
+        self.keepalive = bool(kwargs.pop("keepalive", False))
+        self.last_stats: Optional[SessionStats] = None
         super().__init__(**kwargs)
 
     @property
@@ -559,6 +579,32 @@ class Computer(NovemCodeAPI):
     def compute_target(self) -> str:
         return self._compute_target()
 
+    def _observed(
+        self, open_channel: Callable[[ComputeConnection], Awaitable[Channel]]
+    ) -> Callable[[ComputeConnection], Awaitable[Channel]]:
+        """Wrap ``open_channel`` to record the admitted channel's stats."""
+
+        async def opened(conn: ComputeConnection) -> Channel:
+            ch = await open_channel(conn)
+            self.last_stats = SessionStats(conn.stats, ch.stats)
+            return ch
+
+        return opened
+
+    def _exec(
+        self,
+        open_channel: Callable[[ComputeConnection], Awaitable[Channel]],
+        use_channel: Callable[[Channel], Awaitable[Any]],
+        retry_seconds: float,
+        on_retry: Optional[Callable[[NovemException], None]],
+        own_loop: bool = False,
+    ) -> Any:
+        """Admit and use one channel, on the shared pool when keepalive is on."""
+        open_channel = self._observed(open_channel)
+        if self.keepalive:
+            return shared_pool().call(self.connect, open_channel, use_channel, retry_seconds, on_retry)
+        return _run_sync(_with_retry(open_channel, use_channel, self.connect, retry_seconds, on_retry), own_loop)
+
     def run(
         self,
         argv: Union[str, List[str]],
@@ -568,6 +614,9 @@ class Computer(NovemCodeAPI):
         timeout: int = 600,
         retry_seconds: float = 0.0,
         on_retry: Optional[Callable[[NovemException], None]] = None,
+        stdout: Optional[IO[bytes]] = None,
+        stderr: Optional[IO[bytes]] = None,
+        spill_bytes: Optional[int] = None,
     ) -> "ExecResult":
         """Run one command and return its buffered output and exit status.
 
@@ -576,11 +625,16 @@ class Computer(NovemCodeAPI):
         file-like object; file input is forwarded incrementally while output
         is collected. ``retry_seconds`` retries the open while the computer
         reports a retryable state.
+
+        For large output, pass binary ``stdout``/``stderr`` sinks to receive
+        it as it arrives, or ``spill_bytes`` to collect it in temporary files
+        that move to disk past that size (``ExecResult.stdout_file``).
         """
         command, args = _split_argv(argv, mode)
         target = self._compute_target()
-        return _run_sync(
-            _with_retry(
+        return cast(
+            ExecResult,
+            self._exec(
                 lambda conn: conn.open_exec(
                     target,
                     command,
@@ -589,13 +643,223 @@ class Computer(NovemCodeAPI):
                     cwd=cwd,
                     timeout_seconds=timeout,
                 ),
-                lambda channel: _exec_collect_channel(channel, stdin),
-                self.connect,
+                lambda channel: _exec_collect_channel(channel, stdin, stdout, stderr, spill_bytes),
+                retry_seconds,
+                on_retry,
+            ),
+        )
+
+    def run_many(
+        self,
+        commands: Sequence[Union[str, List[str]]],
+        concurrency: Optional[int] = None,
+        mode: str = "argv",
+        cwd: str = "",
+        timeout: int = 600,
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+    ) -> List["ExecResult"]:
+        """Run several commands concurrently on one connection.
+
+        Each command gets its own exec channel; up to ``concurrency`` of them
+        (capped by the server's ``max_channels``) run at once and the rest
+        are queued. Returns one :class:`ExecResult` per command, in order,
+        each with its ``seconds``. See :meth:`ComputeConnection.exec_many`
+        for the async equivalent.
+        """
+        target = self._compute_target()
+        return cast(
+            List[ExecResult],
+            _run_sync(
+                _with_retry(
+                    _connected,
+                    lambda conn: conn.exec_many(
+                        target,
+                        commands,
+                        concurrency=concurrency,
+                        mode=mode,
+                        cwd=cwd,
+                        timeout_seconds=timeout,
+                        retry_seconds=retry_seconds,
+                        on_retry=on_retry,
+                    ),
+                    self.connect,
+                    retry_seconds,
+                    on_retry,
+                )
+            ),
+        )
+
+    def _transfer(
+        self,
+        work: Callable[[ComputeConnection, str], Awaitable[Any]],
+        retry_seconds: float,
+        on_retry: Optional[Callable[[NovemException], None]],
+    ) -> Any:
+        """Run transfer work on a connection of its own."""
+        target = self._compute_target()
+        return _run_sync(
+            _with_retry(_connected, lambda conn: work(conn, target), self.connect, retry_seconds, on_retry)
+        )
+
+    def put(
+        self,
+        local: str,
+        remote: str,
+        compress: bool = False,
+        verify: bool = True,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        timeout: int = 3600,
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+    ) -> "TransferStats":
+        """Upload the local file ``local`` to the absolute path ``remote``.
+
+        ``compress`` gzips the data in transit (worth it for text over a slow
+        link, not for already-compressed formats). ``verify`` compares
+        SHA-256 digests on both ends before the file is moved into place.
+        Returns :class:`TransferStats` with the size, time and throughput.
+        Transfers open a connection of their own, even with keepalive.
+        """
+        return cast(
+            TransferStats,
+            self._transfer(
+                lambda conn, target: upload(
+                    conn, target, local, remote, compress, verify, progress, timeout, retry_seconds, on_retry
+                ),
+                retry_seconds,
+                on_retry,
+            ),
+        )
+
+    def get(
+        self,
+        remote: str,
+        local: str,
+        compress: bool = False,
+        verify: bool = True,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        timeout: int = 3600,
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+    ) -> "TransferStats":
+        """Download the remote file ``remote`` to the local path ``local``.
+
+        The options match :meth:`put`; ``local`` is only replaced once the
+        whole file has arrived and verified.
+        """
+        return cast(
+            TransferStats,
+            self._transfer(
+                lambda conn, target: download(
+                    conn, target, remote, local, compress, verify, progress, timeout, retry_seconds, on_retry
+                ),
+                retry_seconds,
+                on_retry,
+            ),
+        )
+
+    def put_dir(
+        self,
+        local: str,
+        remote: str,
+        concurrency: int = 4,
+        compress: bool = False,
+        verify: bool = True,
+        timeout: int = 3600,
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+    ) -> List["TransferStats"]:
+        """Upload every file under ``local`` to the same place under ``remote``.
+
+        Up to ``concurrency`` files are sent at once, each on its own channel
+        of one connection. Returns one :class:`TransferStats` per file.
+        """
+        return cast(
+            List[TransferStats],
+            self._transfer(
+                lambda conn, target: upload_tree(
+                    conn,
+                    target,
+                    local,
+                    remote,
+                    concurrency,
+                    compress=compress,
+                    verify=verify,
+                    timeout_seconds=timeout,
+                    retry_seconds=retry_seconds,
+                    on_retry=on_retry,
+                ),
                 retry_seconds,
                 on_retry,
-            )
+            ),
         )
 
+    def get_dir(
+        self,
+        remote: str,
+        local: str,
+        concurrency: int = 4,
+        compress: bool = False,
+        verify: bool = True,
+        timeout: int = 3600,
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+    ) -> List["TransferStats"]:
+        """Download every file under ``remote`` to the same place under ``local``.
+
+        The counterpart of :meth:`put_dir`.
+        """
+        return cast(
+            List[TransferStats],
+            self._transfer(
+                lambda conn, target: download_tree(
+                    conn,
+                    target,
+                    remote,
+                    local,
+                    concurrency,
+                    compress=compress,
+                    verify=verify,
+                    timeout_seconds=timeout,
+                    retry_seconds=retry_seconds,
+                    on_retry=on_retry,
+                ),
+                retry_seconds,
+                on_retry,
+            ),
+        )
+
+    def forward(
+        self,
+        local_port: int,
+        remote_host: str,
+        remote_port: int,
+        local_host: str = "127.0.0.1",
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> "PortForward":
+        """Forward a local port to ``remote_host:remote_port`` as seen from the computer.
+
+        Returns a listening :class:`PortForward`; close it (or use it as a
+        context manager) to stop. ``local_port=0`` picks a free port, readable
+        as ``.port``. Every accepted connection is tunnelled as its own
+        channel on one shared connection from :func:`shared_pool`.
+        """
+        return PortForward(
+            shared_pool(),
+            self.connect,
+            self._compute_target(),
+            remote_host,
+            remote_port,
+            local_port=local_port,
+            local_host=local_host,
+            retry_seconds=retry_seconds,
+            on_retry=on_retry,
+            on_error=on_error,
+        ).start()
+
     def stream(
         self,
         argv: Union[str, List[str]],
@@ -612,27 +876,27 @@ class Computer(NovemCodeAPI):
         ``stdin`` accepts text, bytes, or a readable file-like object. File
         input and command output are handled concurrently. Returns ``(code,
         signal)``; the code is the workload's own, so a non-zero value is a
-        successful call reporting a failed command.
+        successful call reporting a failed command. ``forward_signals`` needs
+        the call to own the event loop on the main thread, so it has no effect
+        with keepalive or inside an already running loop.
         """
         command, args = _split_argv(argv, mode)
         target = self._compute_target()
         return cast(
             Tuple[int, Optional[str]],
-            _run_sync(
-                _with_retry(
-                    lambda conn: conn.open_exec(
-                        target,
-                        command,
-                        args,
-                        mode=mode,
-                        cwd=cwd,
-                        timeout_seconds=timeout,
-                    ),
-                    lambda channel: _exec_stream_channel(channel, stdin, forward_signals=forward_signals),
-                    self.connect,
-                    retry_seconds,
-                    on_retry,
-                )
+            self._exec(
+                lambda conn: conn.open_exec(
+                    target,
+                    command,
+                    args,
+                    mode=mode,
+                    cwd=cwd,
+                    timeout_seconds=timeout,
+                ),
+                lambda channel: _exec_stream_channel(channel, stdin, forward_signals=forward_signals),
+                retry_seconds,
+                on_retry,
+                own_loop=forward_signals,
             ),
         )
 
@@ -647,12 +911,13 @@ class Computer(NovemCodeAPI):
             Tuple[int, Optional[str]],
             _run_sync(
                 _with_retry(
-                    lambda conn: _open_interactive_pty(conn, target),
+                    self._observed(lambda conn: _open_interactive_pty(conn, target)),
                     _pty_interactive,
                     self.connect,
                     retry_seconds,
                     on_retry,
-                )
+                ),
+                own_loop=True,
             ),
         )
 
@@ -708,7 +973,15 @@ __all__ = [
     "SpaceFileInfo",
     "SpaceChange",
     "ComputeConnection",
+    "ComputePool",
     "ExecResult",
+    "HostResult",
+    "run_on",
+    "aggregate_status",
     "NovemComputeError",
     "NovemComputeTransportError",
+    "SessionStats",
+    "NovemTransferError",
+    "TransferStats",
+    "PortForward",
 ]
@@ -16,6 +16,11 @@ client side of that protocol:
     # interactive shell (takes over the terminal)
     c.shell()
 
+    # many short commands: keep one connection open between calls
+    c = Computer("box", keepalive=True)
+    for _ in range(60):
+        c.run(["uptime"])
+
 Text control messages are strict JSON, and byte data uses a single binary
 layout::
 
@@ -31,16 +36,35 @@ leaves sibling channels usable; a protocol violation closes the connection.
 
 import asyncio
 import base64
+import codecs
+import functools
 import json
 import os
 import secrets
 import sys
+import tempfile
 import threading
 from dataclasses import dataclass
-from typing import IO, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from urllib.parse import urlparse
 
 from novem.exceptions import NovemException
+from novem.loop import _LoopThread, shared_loop
 
 PROTOCOL = "novem.compute.v1"
 PATH = "/ws-cu"
@@ -48,6 +72,11 @@ MAX_DATA_BYTES = 64 * 1024
 BINARY_HEADER = 17
 MAX_MESSAGE_BYTES = 128 * 1024
 HELLO_TIMEOUT_SECONDS = 10.0
+# Unconsumed output held in memory per channel; past it a channel spills to
+# a temporary file, so one slow consumer never stops the shared socket.
+CHANNEL_BUFFER_BYTES = 4 * 1024 * 1024
+# queued in place of the output a channel spilled, read back in order
+_SPILLED: Tuple[int, bytes] = (-1, b"")
 
 # stream discriminators
 STREAM_DATA = 0  # pty/tcp bytes, and every client-to-server frame
@@ -215,34 +244,114 @@ class Hello:
 
 @dataclass
 class ExecResult:
-    """The outcome of a buffered :meth:`Computer.run`."""
+    """The outcome of a buffered :meth:`Computer.run`.
+
+    With ``spill_bytes`` the output is not decoded into ``stdout``/``stderr``
+    but left in ``stdout_file``/``stderr_file``: spooled temporary files,
+    rewound, that only touch the disk past the threshold. Output sent to
+    caller-supplied sinks appears in neither. ``stdout_bytes`` and
+    ``stderr_bytes`` count the output either way; ``high_water`` is the most
+    that was waiting in the channel's buffer at once.
+    """
 
     code: int
     signal: Optional[str]
     stdout: str
     stderr: str
+    seconds: Optional[float] = None  # from ready to exit
+    stdout_file: Optional[IO[bytes]] = None
+    stderr_file: Optional[IO[bytes]] = None
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    high_water: int = 0
 
     @property
     def ok(self) -> bool:
         return self.code == 0 and self.signal is None
 
 
+@dataclass
+class ChannelStats:
+    """Admission latency and traffic for one channel.
+
+    Bytes count payload only; frames count binary frames.
+    """
+
+    admission_seconds: Optional[float] = None  # from sending open to receiving ready
+    bytes_sent: int = 0
+    frames_sent: int = 0
+    bytes_received: int = 0
+    frames_received: int = 0
+
+
+@dataclass
+class ConnectionStats:
+    """Setup latency, traffic and round-trip time for one connection.
+
+    Traffic counts every WebSocket message, control messages included, with
+    binary frames counted whole (header and payload). The round trip is
+    measured with WebSocket pings: one right after ``hello`` and one per
+    heartbeat interval after that.
+    """
+
+    handshake_seconds: Optional[float] = None  # TCP, TLS and the WebSocket upgrade
+    hello_seconds: Optional[float] = None  # from the upgrade to a valid hello
+    channels: int = 0  # channels admitted
+    bytes_sent: int = 0
+    frames_sent: int = 0
+    bytes_received: int = 0
+    frames_received: int = 0
+    rtt_seconds: Optional[float] = None  # the latest ping round trip
+    rtt_min_seconds: Optional[float] = None
+    pings: int = 0  # pings answered
+
+
+@dataclass
+class SessionStats:
+    """The connection and channel behind one :class:`Computer` call.
+
+    On a pooled connection the connection figures cover its whole life, not
+    just this call.
+    """
+
+    connection: ConnectionStats
+    channel: ChannelStats
+
+
+# Channel ids are converted once per channel, not once per frame: the
+# connection keys its channels by the raw bytes that binary frames carry, and
+# these caches cover callers of the public encode/decode helpers.
+
+
+@functools.lru_cache(maxsize=1024)
 def _channel_bytes(channel: str) -> bytes:
     """22-char unpadded base64url -> the raw 16 bytes."""
     return base64.urlsafe_b64decode(channel + "==")
 
 
+@functools.lru_cache(maxsize=1024)
 def _channel_str(raw: bytes) -> str:
     """The raw 16 bytes -> 22-char unpadded base64url."""
     return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
 
 
-def encode_frame(channel: str, payload: bytes, stream: int = STREAM_DATA) -> bytes:
+def _channel_key(channel: Any) -> bytes:
+    """The raw id of a channel named in a control message; empty if invalid."""
+    if not isinstance(channel, str):
+        return b""
+    try:
+        raw = _channel_bytes(channel)
+    except (ValueError, TypeError):
+        return b""
+    return raw if len(raw) == 16 else b""
+
+
+def encode_frame(channel: str, payload: Union[bytes, memoryview], stream: int = STREAM_DATA) -> bytes:
     if not payload:
         raise ValueError("empty data frames are invalid")
     if len(payload) > MAX_DATA_BYTES:
         raise ValueError(f"payload exceeds {MAX_DATA_BYTES} bytes")
-    return bytes([stream]) + _channel_bytes(channel) + payload
+    return b"".join((bytes((stream,)), _channel_bytes(channel), payload))
 
 
 def decode_frame(data: bytes) -> Tuple[int, str, bytes]:
@@ -273,20 +382,77 @@ def target_for(owner: str, computer: str) -> str:
 
 
 class Channel:
-    """One open channel on a :class:`ComputeConnection`."""
+    """One open channel on a :class:`ComputeConnection`.
+
+    Output waits in memory until it is consumed by iterating the channel.
+    Past the connection's ``buffer_bytes`` the rest is written to a temporary
+    file and read back once the consumer gets to it, so the connection keeps
+    reading (and answering pings) for every other channel on the socket.
+    ``buffered``, ``high_water`` and ``spills`` show how far behind it fell.
+    """
 
     def __init__(self, conn: "ComputeConnection", channel: str, kind: str) -> None:
         self._conn = conn
         self.id = channel
+        self.key = _channel_bytes(channel)  # the raw id binary frames carry
         self.kind = kind
+        # every client-to-server frame is stream 0, so the header is fixed
+        self._header = bytes((STREAM_DATA,)) + self.key
         self._queue: "asyncio.Queue[Optional[Tuple[int, bytes]]]" = asyncio.Queue()
         self._exit: "asyncio.Future[Tuple[int, Optional[str]]]" = asyncio.get_event_loop().create_future()
         self._closed = False
+        self._limit: int = getattr(conn, "buffer_bytes", CHANNEL_BUFFER_BYTES)
+        self._spill: Optional[IO[bytes]] = None  # output past the limit, oldest first
+        self._discarding = False
+        self.buffered = 0  # bytes received but not yet consumed, in memory or spilled
+        self.high_water = 0  # the most that was ever buffered
+        self.spills = 0  # how often output overflowed to a temporary file
+        self.stats = ChannelStats()
 
     # -- inbound, driven by the connection's read loop ---------------------
 
     def _feed(self, stream: int, data: bytes) -> None:
-        self._queue.put_nowait((stream, data))
+        """Buffer output, spilling it to disk once the memory limit is reached."""
+        self.stats.bytes_received += len(data)
+        self.stats.frames_received += 1
+        if self._discarding:
+            return
+        if self._spill is None and self.buffered + len(data) <= self._limit:
+            self._queue.put_nowait((stream, data))
+        else:
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile()
+                self.spills += 1
+                self._queue.put_nowait(_SPILLED)
+            # records of stream, length and payload; reads seek back to their place
+            self._spill.seek(0, os.SEEK_END)
+            self._spill.write(bytes((stream,)) + len(data).to_bytes(4, "big") + data)
+        self.buffered += len(data)
+        if self.buffered > self.high_water:
+            self.high_water = self.buffered
+
+    def _unspill(self) -> Iterator[Tuple[int, bytes]]:
+        """Read spilled output back until it is caught up, then drop the file."""
+        spill = self._spill
+        offset = 0
+        while spill is not None and self._spill is spill:
+            spill.seek(offset)
+            head = spill.read(5)
+            if len(head) < 5:
+                # caught up: what arrives next is queued in memory again
+                self._spill = None
+                spill.close()
+                return
+            data = spill.read(int.from_bytes(head[1:], "big"))
+            offset += len(head) + len(data)
+            yield head[0], data
+
+    def _release(self) -> None:
+        """Stop buffering: nobody will consume what arrives from now on."""
+        self._discarding = True
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
 
     def _finish(self, code: int, signal: Optional[str]) -> None:
         if not self._exit.done():
@@ -306,11 +472,21 @@ class Channel:
 
     # -- outbound ----------------------------------------------------------
 
-    async def send(self, payload: bytes) -> None:
-        """Write bytes to the channel's stdin (or the TCP stream)."""
+    async def send(self, payload: Union[bytes, bytearray, memoryview]) -> None:
+        """Write bytes to the channel's stdin (or the TCP stream).
+
+        Large payloads are split into frames through a memoryview, so the
+        only copy is the one into each outgoing frame.
+        """
+        view = memoryview(payload).cast("B")
         chunk_size = self._conn.max_data_bytes
-        for i in range(0, len(payload), chunk_size):
-            await self._conn._send_binary(encode_frame(self.id, payload[i : i + chunk_size]))
+        header = self._header
+        stats = self.stats
+        for i in range(0, len(view), chunk_size):
+            frame = header + view[i : i + chunk_size]
+            await self._conn._send_binary(frame)
+            stats.bytes_sent += len(frame) - BINARY_HEADER
+            stats.frames_sent += 1
 
     async def stdin_eof(self) -> None:
         """Close stdin without closing the channel.
@@ -334,6 +510,7 @@ class Channel:
         if self._closed:
             return
         self._closed = True
+        self._release()
         await self._conn._send_json({"type": "close", "channel": self.id})
 
     # -- consumption -------------------------------------------------------
@@ -343,7 +520,9 @@ class Channel:
             item = await self._queue.get()
             if item is None:
                 return
-            yield item
+            for stream, data in self._unspill() if item is _SPILLED else (item,):
+                self.buffered -= len(data)
+                yield stream, data
 
     async def wait(self) -> Tuple[int, Optional[str]]:
         """Await termination, returning ``(code, signal)``.
@@ -361,11 +540,19 @@ class ComputeConnection:
     over the single socket.
     """
 
-    def __init__(self, url: str, token: str, ignore_ssl: bool = False, debug: bool = False) -> None:
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        ignore_ssl: bool = False,
+        debug: bool = False,
+        buffer_bytes: int = CHANNEL_BUFFER_BYTES,
+    ) -> None:
         self._url = url
         self._token = token
         self._ignore_ssl = ignore_ssl
         self._debug = debug
+        self.buffer_bytes = buffer_bytes
         self._ws: Any = None
         self._session: Any = None
         self._reader: Optional["asyncio.Task[None]"] = None
@@ -374,10 +561,12 @@ class ComputeConnection:
         self.max_data_bytes = MAX_DATA_BYTES
         self._receive_max_data_bytes = MAX_DATA_BYTES
         self._last_inbound = 0.0
-        self._channels: Dict[str, Channel] = {}
+        self._channels: Dict[bytes, Channel] = {}  # by raw 16-byte id
         self._pending: Dict[str, "asyncio.Future[Channel]"] = {}
         self._fatal: Optional[BaseException] = None
         self._hello_event: Optional[asyncio.Event] = None
+        self._ping_sent: Optional[float] = None
+        self.stats = ConnectionStats()
 
     # -- lifecycle ---------------------------------------------------------
 
@@ -398,6 +587,8 @@ class ComputeConnection:
         # A native client must not send Origin: it is self-asserted and
         # therefore neither required nor trusted by the server.
         self._session = aiohttp.ClientSession()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         try:
             self._ws = await self._session.ws_connect(
                 self._url,
@@ -409,6 +600,8 @@ class ComputeConnection:
             )
             if self._ws.protocol != PROTOCOL:
                 raise NovemComputeTransportError("compute connection did not negotiate the expected protocol")
+            upgraded = loop.time()
+            self.stats.handshake_seconds = upgraded - started
 
             if self._debug:
                 print(f"WS: {self._url} ({PROTOCOL})", file=sys.stderr)
@@ -417,6 +610,7 @@ class ComputeConnection:
             self._last_inbound = asyncio.get_running_loop().time()
             self._reader = asyncio.create_task(self._read_loop())
             await self._await_hello()
+            self.stats.hello_seconds = loop.time() - upgraded
             self._watchdog = asyncio.create_task(self._watch_liveness())
             if self._fatal is not None:
                 raise self._fatal
@@ -488,31 +682,45 @@ class ComputeConnection:
     async def _send_json(self, message: Dict[str, Any]) -> None:
         if self._fatal is not None:
             raise self._fatal
-        await self._ws.send_str(json.dumps(message))
+        data = json.dumps(message)
+        await self._ws.send_str(data)
+        self.stats.bytes_sent += len(data)
+        self.stats.frames_sent += 1
 
     async def _send_binary(self, frame: bytes) -> None:
         if self._fatal is not None:
             raise self._fatal
         await self._ws.send_bytes(frame)
+        self.stats.bytes_sent += len(frame)
+        self.stats.frames_sent += 1
 
     async def _read_loop(self) -> None:
         aiohttp = self._aiohttp()
         try:
+            stats = self.stats
             async for msg in self._ws:
                 self._last_inbound = asyncio.get_running_loop().time()
                 if msg.type == aiohttp.WSMsgType.TEXT:
+                    stats.bytes_received += len(msg.data)
+                    stats.frames_received += 1
                     self._on_text(json.loads(msg.data))
                 elif msg.type == aiohttp.WSMsgType.BINARY:
-                    stream, channel, payload = decode_frame(msg.data)
-                    if len(payload) > self._receive_max_data_bytes:
+                    data = msg.data
+                    stats.bytes_received += len(data)
+                    stats.frames_received += 1
+                    size = len(data) - BINARY_HEADER
+                    if size <= 0:
+                        raise ValueError("binary frame is too short")
+                    if size > self._receive_max_data_bytes:
                         raise ValueError("binary frame exceeds the negotiated payload limit")
-                    ch = self._channels.get(channel)
+                    # look the channel up by its raw id, no base64 round trip
+                    ch = self._channels.get(data[1:BINARY_HEADER])
                     if ch is not None:
-                        ch._feed(stream, payload)
+                        ch._feed(data[0], data[BINARY_HEADER:])
                 elif msg.type == aiohttp.WSMsgType.PING:
                     await self._ws.pong(msg.data)
                 elif msg.type == aiohttp.WSMsgType.PONG:
-                    continue
+                    self._on_pong()
                 elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
                     break
         except asyncio.CancelledError:
@@ -535,6 +743,7 @@ class ComputeConnection:
         interval = max(0.05, heartbeat)
         loop = asyncio.get_running_loop()
         while True:
+            await self._ping()
             await asyncio.sleep(interval)
             if loop.time() - self._last_inbound <= heartbeat * 2:
                 continue
@@ -543,6 +752,27 @@ class ComputeConnection:
                 await self._ws.close()
             return
 
+    async def _ping(self) -> None:
+        """Send a WebSocket ping to time the round trip, one at a time."""
+        if self._ping_sent is not None or self._fatal is not None:
+            return
+        self._ping_sent = asyncio.get_running_loop().time()
+        try:
+            await self._ws.ping()
+        except Exception:  # measurement only: the read loop reports a dead socket
+            self._ping_sent = None
+
+    def _on_pong(self) -> None:
+        if self._ping_sent is None:
+            return
+        rtt = asyncio.get_running_loop().time() - self._ping_sent
+        self._ping_sent = None
+        stats = self.stats
+        stats.rtt_seconds = rtt
+        if stats.rtt_min_seconds is None or rtt < stats.rtt_min_seconds:
+            stats.rtt_min_seconds = rtt
+        stats.pings += 1
+
     def _abort(self, err: BaseException) -> None:
         if self._fatal is not None:
             return
@@ -556,6 +786,7 @@ class ComputeConnection:
         for ch in list(self._channels.values()):
             if not ch._exit.done():
                 ch._exit.set_exception(err)
+            # what was already received, spilled or not, can still be read
             ch._queue.put_nowait(None)
 
     def _on_text(self, msg: Dict[str, Any]) -> None:
@@ -597,16 +828,12 @@ class ComputeConnection:
             if not isinstance(channel_id, str):
                 self._abort(NovemComputeTransportError("compute connection sent an invalid ready message"))
                 return
-            try:
-                valid_channel = len(_channel_bytes(channel_id)) == 16
-            except Exception:
-                valid_channel = False
-            if not valid_channel:
+            if not _channel_key(channel_id):
                 self._abort(NovemComputeTransportError("compute connection sent an invalid ready message"))
                 return
             self._pending.pop(request_id, None)
             channel = Channel(self, channel_id, msg.get("kind", ""))
-            self._channels[channel.id] = channel
+            self._channels[channel.key] = channel
             fut.set_result(channel)
             return
 
@@ -620,24 +847,24 @@ class ComputeConnection:
                 if fut is not None and not fut.done():
                     fut.set_exception(err)
                 return
-            ch = self._channels.get(msg.get("channel", ""))
+            ch = self._channels.get(_channel_key(msg.get("channel")))
             if ch is not None:
                 ch._fail(err)
-                self._channels.pop(ch.id, None)
+                self._channels.pop(ch.key, None)
             return
 
         if kind == "exit":
-            ch = self._channels.get(msg.get("channel", ""))
+            ch = self._channels.get(_channel_key(msg.get("channel")))
             if ch is not None:
                 ch._finish(int(msg.get("code", 0)), msg.get("signal"))
-                self._channels.pop(ch.id, None)
+                self._channels.pop(ch.key, None)
             return
 
         if kind == "closed":
-            ch = self._channels.get(msg.get("channel", ""))
+            ch = self._channels.get(_channel_key(msg.get("channel")))
             if ch is not None:
                 ch._closed_by_server()
-                self._channels.pop(ch.id, None)
+                self._channels.pop(ch.key, None)
             return
 
     # -- opening channels --------------------------------------------------
@@ -646,11 +873,16 @@ class ComputeConnection:
         if self.hello is not None and len(self._channels) + len(self._pending) >= self.hello.max_channels:
             raise NovemComputeError("limit_exceeded", "The connection has reached its channel limit")
         request_id = spec["request_id"]
-        fut: "asyncio.Future[Channel]" = asyncio.get_event_loop().create_future()
+        loop = asyncio.get_running_loop()
+        fut: "asyncio.Future[Channel]" = loop.create_future()
         self._pending[request_id] = fut
+        started = loop.time()
         try:
             await self._send_json(spec)
-            return await fut
+            channel = await fut
+            channel.stats.admission_seconds = loop.time() - started
+            self.stats.channels += 1
+            return channel
         except BaseException:
             self._pending.pop(request_id, None)
             if not fut.done():
@@ -707,6 +939,95 @@ class ComputeConnection:
             }
         )
 
+    async def open_tcp(self, target: str, host: str, port: int) -> Channel:
+        """Open a TCP connection from the computer to ``host:port``.
+
+        Bytes travel on stream 0 both ways; ``stdin_eof`` half-closes the
+        remote socket and the channel ends with ``closed`` when the far side
+        is done.
+        """
+        if not 0 < port < 65536:
+            raise ValueError("port must be between 1 and 65535")
+        if not host:
+            raise ValueError("a host is required")
+        return await self._open(
+            {
+                "type": "open",
+                "request_id": _request_id(),
+                "target": target,
+                "kind": "tcp",
+                "host": host,
+                "port": port,
+            }
+        )
+
+    async def exec_many(
+        self,
+        target: str,
+        commands: Sequence[Union[str, List[str]]],
+        concurrency: Optional[int] = None,
+        mode: str = "argv",
+        cwd: str = "",
+        timeout_seconds: int = 600,
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+    ) -> List[ExecResult]:
+        """Run ``commands`` as concurrent exec channels on this connection.
+
+        At most ``concurrency`` channels (capped by ``hello.max_channels``)
+        are open at once; the rest wait for a free slot. Output is buffered
+        per command and the results come back in the order given. The first
+        command that fails to start cancels the rest.
+        """
+        assert self.hello is not None
+        limit = min(concurrency or self.hello.max_channels, self.hello.max_channels)
+        if limit < 1:
+            raise ValueError("concurrency must be at least 1")
+        split = [_split_argv(argv, mode) for argv in commands]
+        slots = asyncio.Semaphore(limit)
+
+        async def one(command: str, args: List[str]) -> ExecResult:
+            async with slots:
+                return cast(
+                    ExecResult,
+                    await _with_retry(
+                        lambda conn: conn.open_exec(
+                            target, command, args, mode=mode, cwd=cwd, timeout_seconds=timeout_seconds
+                        ),
+                        lambda ch: _closing(ch, _exec_collect_channel(ch, None)),
+                        lambda: _Borrowed(self),
+                        retry_seconds,
+                        on_retry,
+                    ),
+                )
+
+        tasks = [asyncio.ensure_future(one(command, args)) for command, args in split]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _Borrowed:
+    """An already-open connection in the shape ``_with_retry`` connects with."""
+
+    def __init__(self, conn: ComputeConnection) -> None:
+        self._conn = conn
+
+    async def __aenter__(self) -> ComputeConnection:
+        return self._conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+
+async def _connected(conn: ComputeConnection) -> ComputeConnection:
+    """``open_channel`` for work that opens its own channels on the connection."""
+    return conn
+
 
 def _request_id() -> str:
     return f"np-{secrets.token_hex(8)}"
@@ -715,16 +1036,22 @@ def _request_id() -> str:
 # ── sync helpers used by the CLI and by simple library callers ────────────
 
 
-def _run_sync(coro: Any) -> Any:
-    """Drive a coroutine from synchronous code."""
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
-    coro.close()
-    raise NovemException(
-        "A compute call was made from inside a running event loop. Use the async API (Computer.connect()) instead."
-    )
+def _run_sync(coro: Any, own_loop: bool = False) -> Any:
+    """Drive a coroutine from synchronous code.
+
+    It runs on the library's background loop (see :func:`novem.loop.shared_loop`),
+    which works the same from a plain script and from inside a running loop
+    such as Jupyter's. ``own_loop`` runs it on a fresh loop in the calling
+    thread instead, for work that installs signal handlers or reads the
+    terminal and so must run on the main thread; inside a running loop that
+    is not possible and the background loop is used.
+    """
+    if own_loop:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+    return shared_loop().run(coro)
 
 
 def _split_argv(argv: Any, mode: str) -> Tuple[str, List[str]]:
@@ -895,8 +1222,20 @@ async def _use_channel_with_stdin(
     consume: Callable[[], Awaitable[_T]],
 ) -> _T:
     """Pump input and consume output concurrently for one exec channel."""
+    return await _use_channel(lambda: _pump_stdin(ch, stdin), consume)
+
+
+async def _use_channel(
+    produce: Callable[[], Awaitable[None]],
+    consume: Callable[[], Awaitable[_T]],
+) -> _T:
+    """Run a channel's input and output sides together.
+
+    The result is ``consume``'s; an input failure cancels it, and output
+    finishing first (the command exited) cancels whatever input remains.
+    """
 
-    pump: "asyncio.Task[None]" = asyncio.create_task(_pump_stdin(ch, stdin))
+    pump: "asyncio.Task[None]" = asyncio.ensure_future(produce())
     output: "asyncio.Future[_T]" = asyncio.ensure_future(consume())
     try:
         done, _ = await asyncio.wait((pump, output), return_when=asyncio.FIRST_COMPLETED)
@@ -964,23 +1303,82 @@ async def _with_sigint_forwarding(ch: Channel, operation: Callable[[], Awaitable
         await asyncio.gather(sender, command, return_exceptions=True)
 
 
-async def _exec_collect_channel(ch: Channel, stdin: Optional[StdinSource]) -> ExecResult:
-    """Collect output from an admitted exec channel."""
+class _Collector:
+    """Where one output stream of a collected command goes."""
+
+    def __init__(self, sink: Optional[IO[bytes]], spill_bytes: Optional[int]) -> None:
+        self.chunks: List[bytes] = []
+        self.spool: Optional[IO[bytes]] = None
+        self.sink = sink
+        if sink is None and spill_bytes is not None:
+            self.spool = cast(IO[bytes], tempfile.SpooledTemporaryFile(max_size=spill_bytes))
+            self.sink = self.spool
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.sink is not None:
+            self.sink.write(data)
+        else:
+            self.chunks.append(data)
+
+    def text(self) -> str:
+        return b"".join(self.chunks).decode("utf-8", "replace")
+
+    def file(self) -> Optional[IO[bytes]]:
+        if self.spool is not None:
+            self.spool.seek(0)
+        return self.spool
+
+    def close(self) -> None:
+        if self.spool is not None:
+            self.spool.close()
+
+
+async def _exec_collect_channel(
+    ch: Channel,
+    stdin: Optional[StdinSource],
+    stdout: Optional[IO[bytes]] = None,
+    stderr: Optional[IO[bytes]] = None,
+    spill_bytes: Optional[int] = None,
+    produce: Optional[Callable[[], Awaitable[None]]] = None,
+) -> ExecResult:
+    """Collect output from an admitted exec channel.
+
+    Output goes to ``stdout``/``stderr`` sinks when given, to spooled
+    temporary files with ``spill_bytes``, and is buffered in memory
+    otherwise. ``produce``, when given, writes the channel's input in place
+    of ``stdin`` and must end it with ``stdin_eof``.
+    """
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    out = _Collector(stdout, spill_bytes)
+    err = _Collector(stderr, spill_bytes)
 
     async def collect() -> ExecResult:
-        out: List[bytes] = []
-        err: List[bytes] = []
         async for stream, data in ch:
-            (err if stream == STREAM_STDERR else out).append(data)
+            (err if stream == STREAM_STDERR else out).write(data)
         code, signal = await ch.wait()
         return ExecResult(
             code=code,
             signal=signal,
-            stdout=b"".join(out).decode("utf-8", "replace"),
-            stderr=b"".join(err).decode("utf-8", "replace"),
+            stdout=out.text(),
+            stderr=err.text(),
+            seconds=round(loop.time() - started, 6),
+            stdout_file=out.file(),
+            stderr_file=err.file(),
+            stdout_bytes=out.size,
+            stderr_bytes=err.size,
+            high_water=ch.high_water,
         )
 
-    return await _use_channel_with_stdin(ch, stdin, collect)
+    try:
+        return await _use_channel(produce or (lambda: _pump_stdin(ch, stdin)), collect)
+    except BaseException:
+        out.close()
+        err.close()
+        raise
 
 
 async def _exec_collect(
@@ -997,6 +1395,30 @@ async def _exec_collect(
     return await _exec_collect_channel(ch, stdin)
 
 
+class _Output:
+    """Write remote output to local stdout/stderr.
+
+    Bytes go to the streams' binary buffers. Text-only streams (Jupyter,
+    captured output) have none and get the bytes decoded as UTF-8 instead,
+    incrementally so a character split across frames stays whole.
+    """
+
+    def __init__(self) -> None:
+        self._decoders: Dict[int, Any] = {}
+
+    def write(self, stream: int, data: bytes) -> None:
+        out = sys.stderr if stream == STREAM_STDERR else sys.stdout
+        buffer = getattr(out, "buffer", None)
+        if buffer is not None:
+            buffer.write(data)
+            buffer.flush()
+            return
+        if stream not in self._decoders:
+            self._decoders[stream] = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        out.write(self._decoders[stream].decode(data))
+        out.flush()
+
+
 async def _exec_stream_channel(
     ch: Channel,
     stdin: Optional[StdinSource],
@@ -1004,11 +1426,11 @@ async def _exec_stream_channel(
 ) -> Tuple[int, Optional[str]]:
     """Stream output from an admitted exec channel to local stdout/stderr."""
 
+    output = _Output()
+
     async def stream_output() -> Tuple[int, Optional[str]]:
         async for stream, data in ch:
-            sink = sys.stderr.buffer if stream == STREAM_STDERR else sys.stdout.buffer
-            sink.write(data)
-            sink.flush()
+            output.write(stream, data)
         return await ch.wait()
 
     async def transfer() -> Tuple[int, Optional[str]]:
@@ -1034,6 +1456,185 @@ async def _exec_stream(
     return await _exec_stream_channel(ch, stdin)
 
 
+# ── one command on many computers ──────────────────────────────────────────
+
+
+@dataclass
+class HostResult:
+    """The outcome of one computer's command in :func:`run_on`.
+
+    ``error`` is set, and ``code`` is 255, when the command never produced an
+    exit status: the connection failed or the computer refused the open.
+    """
+
+    computer: str
+    code: int
+    signal: Optional[str]
+    stdout: str = ""
+    stderr: str = ""
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.code == 0 and self.signal is None
+
+    @property
+    def status(self) -> int:
+        """The exit status a shell would report for this computer."""
+        if self.error is not None:
+            return 255
+        if self.signal:
+            return 128 + _SIGNAL_NUMBERS.get(self.signal, 127)
+        return self.code
+
+
+# signal names as the gateway reports them, and their POSIX numbers
+_SIGNAL_NUMBERS = {"HUP": 1, "INT": 2, "QUIT": 3, "KILL": 9, "TERM": 15}
+
+
+def aggregate_status(results: List[HostResult]) -> int:
+    """0 when every computer succeeded, else the first failure's status."""
+    for result in results:
+        if not result.ok:
+            return result.status or 1
+    return 0
+
+
+class _PrefixedLines:
+    """Write a computer's output line by line, each line tagged with its name.
+
+    Lines from concurrent computers interleave but are never split; a
+    trailing partial line is held until it is completed or the command ends.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix.encode("utf-8")
+        self._pending = {STREAM_STDOUT: b"", STREAM_STDERR: b""}
+        self._output = _Output()
+
+    def write(self, stream: int, data: bytes) -> None:
+        key = STREAM_STDERR if stream == STREAM_STDERR else STREAM_STDOUT
+        *lines, self._pending[key] = (self._pending[key] + data).split(b"\n")
+        if lines:
+            self._output.write(key, b"".join(self._prefix + line + b"\n" for line in lines))
+
+    def close(self) -> None:
+        for key, rest in self._pending.items():
+            if rest:
+                self._output.write(key, self._prefix + rest + b"\n")
+            self._pending[key] = b""
+
+
+async def run_on_async(
+    computers: Sequence[Any],
+    argv: Union[str, List[str]],
+    mode: str = "argv",
+    cwd: str = "",
+    timeout: int = 600,
+    stream: bool = False,
+    concurrency: Optional[int] = None,
+    retry_seconds: float = 0.0,
+    on_retry: Optional[Callable[[Any, NovemException], None]] = None,
+) -> List[HostResult]:
+    """Async :func:`run_on`."""
+    command, args = _split_argv(argv, mode)
+    width = max((len(c.id) for c in computers), default=0)
+    slots = asyncio.Semaphore(concurrency or max(len(computers), 1))
+
+    async def one(computer: Any) -> HostResult:
+        async with slots:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            lines = _PrefixedLines(f"{computer.id:<{width}}: ") if stream else None
+
+            async def use(ch: Channel) -> ExecResult:
+                if lines is None:
+                    return await _exec_collect_channel(ch, None)
+
+                async def relay() -> ExecResult:
+                    async for kind, data in ch:
+                        lines.write(kind, data)
+                    code, signal = await ch.wait()
+                    return ExecResult(code=code, signal=signal, stdout="", stderr="")
+
+                try:
+                    return await _use_channel_with_stdin(ch, None, relay)
+                finally:
+                    lines.close()
+
+            try:
+                # resolving the target may read whoami over HTTP: keep it off the loop
+                target = await asyncio.to_thread(lambda: computer.compute_target)
+                res = await _with_retry(
+                    lambda conn: conn.open_exec(target, command, args, mode=mode, cwd=cwd, timeout_seconds=timeout),
+                    use,
+                    computer.connect,
+                    retry_seconds,
+                    (lambda e: on_retry(computer, e)) if on_retry else None,
+                )
+            except Exception as e:
+                # any failure stays with its computer, the others carry on
+                message = getattr(e, "cli_message", None) or str(e) or type(e).__name__
+                return HostResult(
+                    computer=computer.id,
+                    code=255,
+                    signal=None,
+                    seconds=round(loop.time() - started, 6),
+                    error=message,
+                )
+            return HostResult(
+                computer=computer.id,
+                code=res.code,
+                signal=res.signal,
+                stdout=res.stdout,
+                stderr=res.stderr,
+                seconds=round(loop.time() - started, 6),
+            )
+
+    return list(await asyncio.gather(*(one(c) for c in computers)))
+
+
+def run_on(
+    computers: Sequence[Any],
+    argv: Union[str, List[str]],
+    mode: str = "argv",
+    cwd: str = "",
+    timeout: int = 600,
+    stream: bool = False,
+    concurrency: Optional[int] = None,
+    retry_seconds: float = 0.0,
+    on_retry: Optional[Callable[[Any, NovemException], None]] = None,
+) -> List[HostResult]:
+    """Run one command on several computers at once.
+
+    ``computers`` are :class:`~novem.code.Computer` objects. Every target is
+    connected concurrently (at most ``concurrency`` at a time when given),
+    each with the same bounded admission retry as :meth:`Computer.run`. With
+    ``stream=True`` output is written to local stdout/stderr as it arrives,
+    one line at a time and prefixed with the computer's name; otherwise it
+    is collected into the results. A computer that fails does not stop the
+    others: its result carries the error. :func:`aggregate_status` reduces
+    the results to one exit status.
+    """
+    return cast(
+        List[HostResult],
+        _run_sync(
+            run_on_async(
+                computers,
+                argv,
+                mode=mode,
+                cwd=cwd,
+                timeout=timeout,
+                stream=stream,
+                concurrency=concurrency,
+                retry_seconds=retry_seconds,
+                on_retry=on_retry,
+            )
+        ),
+    )
+
+
 async def _open_interactive_pty(conn: ComputeConnection, target: str) -> Channel:
     """Validate the local terminal and request an interactive PTY channel."""
     if os.name == "nt":  # pragma: no cover - platform guard
@@ -1143,11 +1744,200 @@ async def _pty_interactive(ch: Channel) -> Tuple[int, Optional[str]]:
             pass
 
 
+# ── persistent connections for repeated sync calls ──────────────────────────
+
+
+class _Pooled:
+    """A pooled connection with its channel slots and idle timer."""
+
+    def __init__(self, conn: ComputeConnection) -> None:
+        assert conn.hello is not None
+        self.conn = conn
+        self.slots = asyncio.Semaphore(conn.hello.max_channels)
+        self.users = 0
+        self.idle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.conn._fatal is None
+
+
+class _Lease:
+    """Borrow the pool's connection for one channel (see ``_with_retry``)."""
+
+    def __init__(self, pool: "ComputePool", connect: Callable[[], ComputeConnection]) -> None:
+        self._pool = pool
+        self._connect = connect
+        self._entry: Optional[_Pooled] = None
+
+    async def __aenter__(self) -> ComputeConnection:
+        self._entry = await self._pool._acquire(self._connect)
+        return self._entry.conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._entry is not None:
+            self._pool._release(self._entry)
+            self._entry = None
+
+
+async def _closing(ch: Channel, work: Awaitable[_T]) -> _T:
+    """Close a channel that is abandoned before it exits.
+
+    A shared connection outlives the command, so an interrupted call must
+    end its channel explicitly rather than by dropping the socket.
+    """
+    try:
+        return await work
+    finally:
+        if not ch._exit.done() and ch._conn._fatal is None:
+            try:
+                await ch.close()
+            except Exception:  # pragma: no cover - the connection is going away anyway
+                pass
+
+
+class ComputePool:
+    """Long-lived compute connections for synchronous callers.
+
+    Each :meth:`Computer.run` otherwise opens a WebSocket, waits for
+    ``hello`` and tears everything down again, so for short commands the
+    handshake is most of the cost. A pool keeps one ``novem.compute.v1``
+    connection per endpoint and token open on a background event-loop thread
+    and multiplexes calls onto it as channels, up to the server's
+    ``max_channels`` (further calls wait for a free slot). A connection the
+    server has closed is replaced on the next call, and one left unused for
+    ``idle_seconds`` is closed locally.
+    """
+
+    def __init__(self, idle_seconds: float = 60.0, loop: Optional[_LoopThread] = None) -> None:
+        self.idle_seconds = idle_seconds
+        # a pool of its own gets a loop of its own; the shared pool uses shared_loop()
+        self._owns_loop = loop is None
+        self._thread = loop or _LoopThread("novem-compute")
+        self._entries: Dict[Tuple[str, str, bool], _Pooled] = {}
+        self._connecting: Optional[asyncio.Lock] = None
+
+    @property
+    def connections(self) -> int:
+        """How many pooled connections are currently open."""
+        return sum(1 for e in self._entries.values() if e.alive)
+
+    def call(
+        self,
+        connect: Callable[[], ComputeConnection],
+        open_channel: Callable[[ComputeConnection], Awaitable[Channel]],
+        use_channel: Callable[[Channel], Awaitable[_T]],
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+    ) -> _T:
+        """Open and use one channel on a pooled connection, blocking until done.
+
+        The arguments match ``_with_retry``; ``connect`` returns an unopened
+        :class:`ComputeConnection` and is only opened when the pool has no
+        live connection for its endpoint and token.
+        """
+        return cast(
+            _T,
+            self._thread.run(
+                _with_retry(
+                    open_channel,
+                    lambda ch: _closing(ch, use_channel(ch)),
+                    lambda: _Lease(self, connect),
+                    retry_seconds,
+                    on_retry,
+                )
+            ),
+        )
+
+    def close(self) -> None:
+        """Close every pooled connection, and the background loop if the pool owns it."""
+        if self._thread._loop is not None:
+            try:
+                self._thread.run(self._close_all())
+            except RuntimeError:  # pragma: no cover - loop already stopped at exit
+                pass
+        if self._owns_loop:
+            self._thread.stop()
+        self._connecting = None
+
+    async def _close_all(self) -> None:
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            await self._expire(entry)
+
+    async def _acquire(self, connect: Callable[[], ComputeConnection]) -> _Pooled:
+        fresh = connect()
+        key = (fresh._url, fresh._token, fresh._ignore_ssl)
+        if self._connecting is None:
+            self._connecting = asyncio.Lock()
+        async with self._connecting:
+            entry = self._entries.get(key)
+            if entry is None or not entry.alive:
+                if entry is not None:
+                    self._discard(entry)
+                await fresh.__aenter__()
+                entry = self._entries[key] = _Pooled(fresh)
+            if entry.idle is not None:
+                entry.idle.cancel()
+                entry.idle = None
+            entry.users += 1
+        try:
+            await entry.slots.acquire()
+        except BaseException:
+            self._release(entry, holds_slot=False)
+            raise
+        return entry
+
+    def _release(self, entry: _Pooled, holds_slot: bool = True) -> None:
+        if holds_slot:
+            entry.slots.release()
+        entry.users -= 1
+        if entry.users:
+            return
+        if not entry.alive:
+            self._discard(entry)
+            return
+        loop = asyncio.get_running_loop()
+        entry.idle = loop.call_later(self.idle_seconds, self._discard, entry)
+
+    def _discard(self, entry: _Pooled) -> None:
+        for key, current in list(self._entries.items()):
+            if current is entry:
+                del self._entries[key]
+        if entry.users == 0:
+            asyncio.ensure_future(self._expire(entry))
+
+    @staticmethod
+    async def _expire(entry: _Pooled) -> None:
+        if entry.idle is not None:
+            entry.idle.cancel()
+            entry.idle = None
+        await entry.conn.aclose()
+
+
+_shared_pool: Optional[ComputePool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool() -> ComputePool:
+    """The process-wide :class:`ComputePool`, closed at interpreter exit."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            import atexit
+
+            _shared_pool = ComputePool(loop=shared_loop())
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
 __all__ = [
     "PROTOCOL",
     "PATH",
     "MAX_DATA_BYTES",
     "MAX_MESSAGE_BYTES",
+    "CHANNEL_BUFFER_BYTES",
     "STREAM_DATA",
     "STREAM_STDOUT",
     "STREAM_STDERR",
@@ -1158,8 +1948,17 @@ __all__ = [
     "StdinSource",
     "Hello",
     "ExecResult",
+    "ChannelStats",
+    "ConnectionStats",
+    "SessionStats",
+    "HostResult",
     "Channel",
     "ComputeConnection",
+    "ComputePool",
+    "shared_pool",
+    "run_on",
+    "run_on_async",
+    "aggregate_status",
     "encode_frame",
     "decode_frame",
     "ws_url",
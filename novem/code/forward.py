@@ -0,0 +1,183 @@
+"""Local TCP port forwarding to a running novem computer.
+
+A forward listens on a local port and tunnels every connection it accepts to
+a host and port as seen from the computer — a database, a Jupyter server —
+the way ``ssh -L`` does:
+
+    c = Computer("box")
+    with c.forward(5432, "localhost", 5432) as fwd:
+        conn = psycopg.connect(host="127.0.0.1", port=fwd.port)
+
+Each accepted connection becomes its own ``tcp`` channel, multiplexed with
+the others on one compute connection held by a :class:`ComputePool`. Only
+the first connection pays for the WebSocket handshake, and the pool replaces
+a connection the server has closed. The forward runs on the pool's
+background event loop, so the calling thread is free until it closes it.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Optional, Set
+
+from novem.exceptions import NovemException
+
+from .compute import (
+    Channel,
+    ComputeConnection,
+    ComputePool,
+    _closing,
+    _connected,
+    _Lease,
+    _use_channel,
+    _with_retry,
+)
+
+# how much one local read may take; Channel.send splits it into frames
+_READ_BYTES = 256 * 1024
+
+
+class PortForward:
+    """A listening local port whose connections are tunnelled to the computer.
+
+    Use :meth:`Computer.forward` rather than constructing one directly.
+    ``port`` is the bound local port (useful with ``local_port=0``).
+    ``on_error`` is called from the background loop when a forwarded
+    connection cannot be opened or breaks; that connection is closed and the
+    forward keeps listening.
+    """
+
+    def __init__(
+        self,
+        pool: ComputePool,
+        connect: Callable[[], ComputeConnection],
+        target: str,
+        remote_host: str,
+        remote_port: int,
+        local_port: int = 0,
+        local_host: str = "127.0.0.1",
+        retry_seconds: float = 0.0,
+        on_retry: Optional[Callable[[NovemException], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> None:
+        self.remote_host = remote_host
+        self.remote_port = remote_port
+        self.local_host = local_host
+        self.port = local_port
+        self.accepted = 0  # local connections accepted so far
+        self.active = 0  # local connections currently tunnelled
+        self.bytes_sent = 0  # local to remote
+        self.bytes_received = 0  # remote to local
+        self.retry_seconds = retry_seconds
+        self.on_retry = on_retry
+        self.on_error = on_error
+        self._pool = pool
+        self._connect = connect
+        self._target = target
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tunnels: Set["asyncio.Task[None]"] = set()
+        self._closed = threading.Event()
+
+    def __enter__(self) -> "PortForward":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def start(self) -> "PortForward":
+        """Connect to the computer and start listening; returns ``self``.
+
+        The compute connection is opened up front so a bad token or a
+        stopped computer is reported here rather than on the first client.
+        """
+        self._pool._thread.run(self._start())
+        return self
+
+    def close(self) -> None:
+        """Stop listening and close every forwarded connection."""
+        if self._closed.is_set():
+            return
+        try:
+            self._pool._thread.run(self._stop())
+        finally:
+            self._closed.set()
+
+    def wait(self) -> None:
+        """Block until :meth:`close` is called from another thread."""
+        while not self._closed.wait(0.5):
+            pass
+
+    # -- on the pool's loop ------------------------------------------------
+
+    async def _start(self) -> None:
+        async def ready(conn: ComputeConnection) -> None:
+            return None
+
+        await _with_retry(
+            _connected,
+            ready,
+            lambda: _Lease(self._pool, self._connect),
+            self.retry_seconds,
+            self.on_retry,
+        )
+        self._server = await asyncio.start_server(self._accept, self.local_host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._tunnels):
+            task.cancel()
+        await asyncio.gather(*self._tunnels, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._tunnels.add(task)
+        self.accepted += 1
+        self.active += 1
+        try:
+            await _with_retry(
+                lambda conn: conn.open_tcp(self._target, self.remote_host, self.remote_port),
+                lambda ch: _closing(ch, self._splice(ch, reader, writer)),
+                lambda: _Lease(self._pool, self._connect),
+                self.retry_seconds,
+                self.on_retry,
+            )
+        except asyncio.CancelledError:
+            pass
+        except (NovemException, OSError) as e:
+            if self.on_error is not None:
+                self.on_error(e)
+        finally:
+            self.active -= 1
+            self._tunnels.discard(task)
+            writer.close()
+
+    async def _splice(self, ch: Channel, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Copy bytes both ways until the computer's side closes."""
+
+        async def upstream() -> None:
+            while True:
+                data = await reader.read(_READ_BYTES)
+                if not data:
+                    break
+                await ch.send(data)
+                self.bytes_sent += len(data)
+            # half-close, like the local client did; replies may still follow
+            await ch.stdin_eof()
+
+        async def downstream() -> None:
+            async for _, data in ch:
+                writer.write(data)
+                self.bytes_received += len(data)
+                await writer.drain()
+            await ch.wait()
+            if writer.can_write_eof():
+                writer.write_eof()
+
+        await _use_channel(upstream, downstream)
+
+
+__all__ = ["PortForward"]
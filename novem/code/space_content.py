@@ -27,9 +27,11 @@ Text in, text out by default (UTF-8), matching the rest of the library;
 ``read_bytes``/``write_bytes`` handle binary content. Explicit methods
 expose the API's optimistic-concurrency machinery (``if_match`` /
 ``no_clobber``) for careful writers — plain dict assignment is
-last-write-wins.
+last-write-wins. ``write(..., skip_if_unchanged=True)`` compares the body
+with the remote ETag first and only uploads when the bytes differ.
 """
 
+import hashlib
 import json
 import mimetypes
 from dataclasses import dataclass
@@ -47,6 +49,24 @@ def _norm(path: str) -> str:
     return path.lstrip("/")
 
 
+# content ETags are hex digests of the body; the length tells us which one
+_ETAG_DIGESTS = {32: "md5", 40: "sha1", 64: "sha256"}
+
+
+def _etag_matches(etag: Optional[str], body: bytes) -> bool:
+    """True when ``etag`` is a hex digest of exactly ``body``."""
+    if not etag:
+        return False
+    tag = etag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"').lower()
+    algo = _ETAG_DIGESTS.get(len(tag))
+    if algo is None:
+        return False
+    return hashlib.new(algo, body).hexdigest() == tag
+
+
 @dataclass
 class SpaceFileInfo:
     """Metadata for a single content path (no body download)."""
@@ -196,6 +216,9 @@ class SpaceContent:
 
     def __init__(self, api: "NovemCodeAPI") -> None:
         self._api = api
+        # parent folder ('' for the root) -> {file name: entry}, filled by
+        # skip_if_unchanged writes so a batch of files costs one ls per folder
+        self._listings: Dict[str, Dict[str, SpaceEntry]] = {}
 
     # -- transport ---------------------------------------------------------
 
@@ -333,6 +356,41 @@ class SpaceContent:
         for d in dirs:
             yield from self.walk(f"{prefix}{d}")
 
+    # -- listing cache ---------------------------------------------------------
+
+    def _cached_entry(self, npath: str) -> Optional[SpaceEntry]:
+        """The remote entry for a file, from a cached listing of its folder."""
+        parent, _, name = npath.rpartition("/")
+        listing = self._listings.get(parent)
+        if listing is None:
+            try:
+                entries = self.ls(parent or "/")
+            except Novem404:
+                # the folder does not exist yet, so neither does the file
+                entries = []
+            listing = {e.name: e for e in entries if e.kind == "file"}
+            self._listings[parent] = listing
+        return listing.get(name)
+
+    def _remember_write(self, npath: str, body: bytes, etag: Optional[str]) -> None:
+        """Keep a cached listing in step with a PUT we just made."""
+        parent, _, name = npath.rpartition("/")
+        listing = self._listings.get(parent)
+        if listing is None:
+            return
+        if etag:
+            listing[name] = SpaceEntry(name=name, kind="file", path=npath, size=len(body), etag=etag)
+        else:
+            listing.pop(name, None)
+
+    def clear_cache(self) -> None:
+        """Forget the folder listings cached by ``skip_if_unchanged`` writes.
+
+        Call this when other writers may have changed the space since the
+        listings were fetched.
+        """
+        self._listings.clear()
+
     # -- writes ---------------------------------------------------------------
 
     def write(
@@ -342,18 +400,33 @@ class SpaceContent:
         if_match: Optional[str] = None,
         no_clobber: bool = False,
         content_type: Optional[str] = None,
-    ) -> None:
+        skip_if_unchanged: bool = False,
+    ) -> bool:
         """Write a file (create or replace); parent folders are auto-created.
 
         ``if_match`` writes only when the file's current ETag matches;
         ``no_clobber`` refuses to replace an existing file. Both surface a
         412 as a NovemException when the condition fails.
+
+        ``skip_if_unchanged`` compares a digest of the body with the remote
+        ETag and skips the upload when they match. The ETags come from one
+        cached ``ls`` per parent folder, so publishing many files costs one
+        listing per folder rather than one ``stat`` per file (see
+        :meth:`clear_cache`). A write with ``if_match`` or ``no_clobber`` is
+        always sent, so the server checks its precondition rather than a
+        possibly stale cached listing. Returns whether the body was sent.
         """
         npath = _norm(path)
         if npath.endswith("/"):
             raise NovemException("write() takes a file path — use mkdir() for folders")
 
         body = data.encode("utf-8") if isinstance(data, str) else data
+
+        if skip_if_unchanged and not if_match and not no_clobber:
+            entry = self._cached_entry(npath)
+            if entry is not None and _etag_matches(entry.etag, body):
+                return False
+
         headers: Dict[str, str] = {
             "Content-Type": content_type
             or mimetypes.guess_type(npath)[0]
@@ -364,7 +437,9 @@ class SpaceContent:
         if no_clobber:
             headers["If-None-Match"] = "*"
 
-        self._request("PUT", npath, headers=headers, data=body)
+        r = self._request("PUT", npath, headers=headers, data=body)
+        self._remember_write(npath, body, r.headers.get("ETag"))
+        return True
 
     def write_bytes(
         self,
@@ -373,9 +448,17 @@ class SpaceContent:
         if_match: Optional[str] = None,
         no_clobber: bool = False,
         content_type: Optional[str] = None,
-    ) -> None:
+        skip_if_unchanged: bool = False,
+    ) -> bool:
         """Write raw bytes to a file (see :meth:`write`)."""
-        self.write(path, data, if_match=if_match, no_clobber=no_clobber, content_type=content_type)
+        return self.write(
+            path,
+            data,
+            if_match=if_match,
+            no_clobber=no_clobber,
+            content_type=content_type,
+            skip_if_unchanged=skip_if_unchanged,
+        )
 
     def mkdir(self, path: str) -> None:
         """Create a folder (idempotent; parents are auto-created)."""
@@ -412,11 +495,13 @@ class SpaceContent:
             headers["If-None-Match"] = "*"
 
         self._request("PATCH", _norm(src), headers=headers, data=json.dumps({"to": _norm(dst)}).encode("utf-8"))
+        self.clear_cache()
 
     def remove(self, path: str, recursive: bool = False) -> None:
         """Delete a file or folder; non-empty folders need ``recursive``."""
         params = {"recursive": "true"} if recursive else None
         self._request("DELETE", _norm(path).rstrip("/"), params=params)
+        self.clear_cache()
 
 
 def space_changes(
@@ -0,0 +1,469 @@
+"""File transfer to and from a running novem computer.
+
+Files travel over ordinary exec channels on the compute connection — ``cat``
+on the far side, ``gzip`` when compression is asked for and ``sha256sum`` to
+check the result — so the computer needs nothing beyond a POSIX shell and
+coreutils:
+
+    c = Computer("box")
+    stats = c.put("data.parquet", "/home/user/data.parquet")
+    print(f"{stats.bytes} bytes at {stats.throughput / 2**20:.1f} MiB/s")
+
+    c.get("/home/user/out.csv", "out.csv", compress=True)
+    c.put_dir("inputs", "/home/user/inputs")      # one channel per file,
+    c.get_dir("/home/user/results", "results")    # several files at once
+
+An upload reads the local file on a worker thread that stays a few blocks
+ahead of the socket, so disk reads, compression and hashing overlap with
+sending, and each block goes out as frames of the negotiated
+``max_data_bytes``. Both directions write to a temporary name next to the
+destination and rename it into place only once the transfer is complete and
+verified, so an interrupted or corrupted copy never replaces a good file.
+"""
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
+import os
+import posixpath
+import re
+import shlex
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar, cast
+
+from novem.exceptions import NovemException
+
+from .compute import (
+    STREAM_STDERR,
+    Channel,
+    ComputeConnection,
+    ExecResult,
+    _Borrowed,
+    _closing,
+    _exec_collect_channel,
+    _use_channel,
+    _with_retry,
+)
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+# how much of the file one read takes, and how many reads may run ahead
+# of the socket
+_BLOCK_BYTES = 1024 * 1024
+_READ_AHEAD = 4
+_PART_SUFFIX = ".novem-part"
+_SHA256 = re.compile(r"\b([0-9a-f]{64})\b")
+
+_T = TypeVar("_T")
+
+
+class NovemTransferError(NovemException):
+    """A file transfer failed on the computer or did not verify."""
+
+
+@dataclass
+class TransferStats:
+    """What one file transfer moved, and how fast."""
+
+    local: str
+    remote: str
+    bytes: int = 0  # the file's size
+    wire_bytes: int = 0  # what crossed the connection, after compression
+    seconds: float = 0.0
+    sha256: Optional[str] = None  # hex digest both ends agreed on, when verified
+
+    @property
+    def throughput(self) -> float:
+        """File bytes per second over the whole transfer."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+def _quote(path: str) -> str:
+    """Quote a remote path for the shell, keeping bytes that are not UTF-8.
+
+    Names listed from the computer carry such bytes as surrogate escapes.
+    Control messages are JSON text, so each one is rebuilt on the far side
+    with ``printf`` instead of being sent raw.
+    """
+    words = []
+    for i, word in enumerate(re.split(r"([\udc80-\udcff])", path)):
+        if i % 2:
+            words.append(f"\"$(printf '\\{ord(word) - 0xDC00:03o}')\"")
+        elif word:
+            words.append(shlex.quote(word))
+    return "".join(words) or "''"
+
+
+def _failure(action: str, result: ExecResult) -> NovemTransferError:
+    detail = result.stderr.strip() or (f"signal {result.signal}" if result.signal else f"exit {result.code}")
+    return NovemTransferError(f"{action} failed on the computer: {detail}")
+
+
+async def _shell(
+    conn: ComputeConnection,
+    target: str,
+    command: str,
+    use: Callable[[Channel], Awaitable[_T]],
+    timeout_seconds: int,
+    retry_seconds: float,
+    on_retry: Optional[Callable[[NovemException], None]],
+) -> _T:
+    """Run ``command`` in a shell-mode exec channel on an open connection."""
+    return cast(
+        _T,
+        await _with_retry(
+            lambda c: c.open_exec(target, command, mode="shell", timeout_seconds=timeout_seconds),
+            lambda ch: _closing(ch, use(ch)),
+            lambda: _Borrowed(conn),
+            retry_seconds,
+            on_retry,
+        ),
+    )
+
+
+async def _send_file(
+    ch: Channel,
+    path: str,
+    compress: bool,
+    hasher: Any,
+    stats: TransferStats,
+    total: int,
+    progress: Optional[ProgressCallback],
+) -> None:
+    """Stream a local file into a channel's stdin, then end it.
+
+    Reads, compression and hashing run on one daemon thread, at most
+    ``_READ_AHEAD`` blocks ahead of what has been sent.
+    """
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Tuple[bytes, int, Optional[BaseException]]]" = asyncio.Queue()
+    room = threading.Semaphore(_READ_AHEAD)
+    stopped = threading.Event()
+
+    def deliver(wire: bytes, size: int, error: Optional[BaseException]) -> bool:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, (wire, size, error))
+            return True
+        except RuntimeError:  # the loop is gone
+            return False
+
+    def read() -> None:
+        packer = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits 31: gzip framing
+        try:
+            with open(path, "rb") as f:
+                while True:
+                    room.acquire()
+                    if stopped.is_set():
+                        return
+                    block = f.read(_BLOCK_BYTES)
+                    hasher.update(block)
+                    wire = block
+                    if packer is not None:
+                        wire = packer.compress(block) if block else packer.flush()
+                    if not deliver(wire, len(block), None) or not block:
+                        return
+        except BaseException as e:
+            deliver(b"", 0, e)
+
+    threading.Thread(target=read, name="novem-put", daemon=True).start()
+    try:
+        while True:
+            wire, size, error = await queue.get()
+            if error is not None:
+                raise error
+            if wire:
+                await ch.send(wire)
+                stats.wire_bytes += len(wire)
+            room.release()
+            if not size:
+                break
+            stats.bytes += size
+            if progress:
+                progress(stats.bytes, total)
+        await ch.stdin_eof()
+    finally:
+        stopped.set()
+        room.release()
+
+
+async def upload(
+    conn: ComputeConnection,
+    target: str,
+    local: str,
+    remote: str,
+    compress: bool = False,
+    verify: bool = True,
+    progress: Optional[ProgressCallback] = None,
+    timeout_seconds: int = 3600,
+    retry_seconds: float = 0.0,
+    on_retry: Optional[Callable[[NovemException], None]] = None,
+) -> TransferStats:
+    """Copy the local file ``local`` to the absolute path ``remote``.
+
+    Missing remote directories are created. With ``verify`` the computer
+    hashes what it wrote and the file is only moved into place when that
+    matches the local SHA-256. ``progress`` is called as ``progress(sent,
+    total)`` in file bytes.
+    """
+    if not remote.startswith("/"):
+        raise ValueError("the remote path must be absolute")
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    stats = TransferStats(local=local, remote=remote)
+    total = os.path.getsize(local)
+    hasher = hashlib.sha256()
+    part = _quote(remote + _PART_SUFFIX)
+    dest = _quote(remote)
+
+    write = f"gzip -dc > {part}" if compress else f"cat > {part}"
+    finish = f"sha256sum -- {part}" if verify else f"mv -f -- {part} {dest}"
+    # a failed write removes what it left behind and keeps its exit status
+    command = (
+        f"mkdir -p -- {_quote(posixpath.dirname(remote))} && "
+        f"{{ {write} && {finish}; }} || {{ s=$?; rm -f -- {part}; exit $s; }}"
+    )
+
+    result = await _shell(
+        conn,
+        target,
+        command,
+        lambda ch: _exec_collect_channel(
+            ch, None, produce=lambda: _send_file(ch, local, compress, hasher, stats, total, progress)
+        ),
+        timeout_seconds,
+        retry_seconds,
+        on_retry,
+    )
+    if not result.ok:
+        raise _failure(f"put {remote}", result)
+
+    if verify:
+        match = _SHA256.search(result.stdout)
+        expected = hasher.hexdigest()
+        agreed = match is not None and match.group(1) == expected
+        settle = f"mv -f -- {part} {dest}" if agreed else f"rm -f -- {part}"
+        done = await _shell(
+            conn,
+            target,
+            settle,
+            lambda ch: _exec_collect_channel(ch, None),
+            timeout_seconds,
+            retry_seconds,
+            on_retry,
+        )
+        if not agreed:
+            raise NovemTransferError(f"put {remote} failed sha256 verification")
+        if not done.ok:
+            raise _failure(f"put {remote}", done)
+        stats.sha256 = expected
+
+    stats.seconds = loop.time() - started
+    return stats
+
+
+async def download(
+    conn: ComputeConnection,
+    target: str,
+    remote: str,
+    local: str,
+    compress: bool = False,
+    verify: bool = True,
+    progress: Optional[ProgressCallback] = None,
+    timeout_seconds: int = 3600,
+    retry_seconds: float = 0.0,
+    on_retry: Optional[Callable[[NovemException], None]] = None,
+) -> TransferStats:
+    """Copy the remote file ``remote`` to the local path ``local``.
+
+    Missing local directories are created. With ``verify`` the computer
+    reports the file's SHA-256 before sending it, and ``local`` is only
+    replaced when what arrived matches. ``progress`` is called as
+    ``progress(received, None)`` in file bytes.
+    """
+    if not remote.startswith("/"):
+        raise ValueError("the remote path must be absolute")
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    stats = TransferStats(local=local, remote=remote)
+    parent = os.path.dirname(local)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    part = local + _PART_SUFFIX
+    source = _quote(remote)
+
+    steps = [f"sha256sum -- {source} >&2"] if verify else []
+    steps.append(f"gzip -c -- {source}" if compress else f"cat -- {source}")
+
+    async def receive(ch: Channel) -> Tuple[ExecResult, str, bool]:
+        unpack = zlib.decompressobj(31) if compress else None
+        hasher = hashlib.sha256()
+        errors: List[bytes] = []
+
+        def write(f: Any, data: bytes) -> None:
+            f.write(data)
+            hasher.update(data)
+            stats.bytes += len(data)
+
+        with open(part, "wb") as f:
+            async for stream, data in ch:
+                if stream == STREAM_STDERR:
+                    errors.append(data)
+                    continue
+                stats.wire_bytes += len(data)
+                write(f, unpack.decompress(data) if unpack is not None else data)
+                if progress:
+                    progress(stats.bytes, None)
+            if unpack is not None:
+                write(f, unpack.flush())
+        code, signal = await ch.wait()
+        stderr = b"".join(errors).decode("utf-8", "replace")
+        complete = unpack is None or unpack.eof
+        return ExecResult(code=code, signal=signal, stdout="", stderr=stderr), hasher.hexdigest(), complete
+
+    try:
+        result, digest, complete = await _shell(
+            conn,
+            target,
+            " && ".join(steps),
+            lambda ch: _use_channel(ch.stdin_eof, lambda: receive(ch)),
+            timeout_seconds,
+            retry_seconds,
+            on_retry,
+        )
+        if not result.ok:
+            raise _failure(f"get {remote}", result)
+        if not complete:
+            raise NovemTransferError(f"get {remote}: the compressed stream ended early")
+        if verify:
+            match = _SHA256.search(result.stderr)
+            if match is None or match.group(1) != digest:
+                raise NovemTransferError(f"get {remote} failed sha256 verification")
+            stats.sha256 = digest
+        os.replace(part, local)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(part)
+        raise
+
+    stats.seconds = loop.time() - started
+    return stats
+
+
+async def _each(
+    conn: ComputeConnection,
+    jobs: List[Callable[[], Awaitable[TransferStats]]],
+    concurrency: int,
+) -> List[TransferStats]:
+    """Run transfers a few at a time; the first failure cancels the rest."""
+    assert conn.hello is not None
+    limit = min(concurrency, conn.hello.max_channels)
+    if limit < 1:
+        raise ValueError("concurrency must be at least 1")
+    slots = asyncio.Semaphore(limit)
+
+    async def one(job: Callable[[], Awaitable[TransferStats]]) -> TransferStats:
+        async with slots:
+            return await job()
+
+    tasks = [asyncio.ensure_future(one(job)) for job in jobs]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def upload_tree(
+    conn: ComputeConnection,
+    target: str,
+    local_dir: str,
+    remote_dir: str,
+    concurrency: int = 4,
+    **kwargs: Any,
+) -> List[TransferStats]:
+    """Copy every file under ``local_dir`` to the same place under ``remote_dir``.
+
+    Up to ``concurrency`` files (capped by ``hello.max_channels``) are in
+    flight at once. Empty directories are not recreated. Keyword arguments
+    are passed to :func:`upload` for each file.
+    """
+    if not os.path.isdir(local_dir):
+        raise NovemTransferError(f"{local_dir} is not a directory")
+    pairs: List[Tuple[str, str]] = []
+    for root, dirs, files in os.walk(local_dir):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, local_dir).split(os.sep)
+            pairs.append((path, posixpath.join(remote_dir, *rel)))
+    return await _each(
+        conn,
+        [functools.partial(upload, conn, target, src, dst, **kwargs) for src, dst in pairs],
+        concurrency,
+    )
+
+
+async def download_tree(
+    conn: ComputeConnection,
+    target: str,
+    remote_dir: str,
+    local_dir: str,
+    concurrency: int = 4,
+    **kwargs: Any,
+) -> List[TransferStats]:
+    """Copy every file under ``remote_dir`` to the same place under ``local_dir``.
+
+    The computer lists the files with ``find``; up to ``concurrency`` of them
+    are fetched at once. Names that are not UTF-8 keep their bytes through
+    surrogate escapes, as :func:`os.fsdecode` does. Keyword arguments are
+    passed to :func:`download`.
+    """
+    if not remote_dir.startswith("/"):
+        raise ValueError("the remote path must be absolute")
+
+    async def collect(ch: Channel) -> Tuple[ExecResult, bytes]:
+        names = io.BytesIO()
+        return await _exec_collect_channel(ch, None, stdout=names), names.getvalue()
+
+    listing, names = await _shell(
+        conn,
+        target,
+        f"cd -- {_quote(remote_dir)} && find . -type f -print0",
+        collect,
+        600,
+        kwargs.get("retry_seconds", 0.0),
+        kwargs.get("on_retry"),
+    )
+    if not listing.ok:
+        raise _failure(f"list {remote_dir}", listing)
+
+    pairs: List[Tuple[str, str]] = []
+    for entry in sorted(names.decode("utf-8", "surrogateescape").split("\0")):
+        parts = [p for p in entry.split("/") if p not in ("", ".")]
+        if not parts:
+            continue
+        if ".." in parts:
+            raise NovemTransferError(f"refusing to write {entry!r} outside {local_dir}")
+        pairs.append((posixpath.join(remote_dir, *parts), os.path.join(local_dir, *parts)))
+    os.makedirs(local_dir, exist_ok=True)
+    return await _each(
+        conn,
+        [functools.partial(download, conn, target, src, dst, **kwargs) for src, dst in pairs],
+        concurrency,
+    )
+
+
+__all__ = [
+    "NovemTransferError",
+    "TransferStats",
+    "upload",
+    "download",
+    "upload_tree",
+    "download_tree",
+]
@@ -2,10 +2,11 @@
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, List, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Iterator, List, Optional, cast
 from urllib.parse import urlparse
 
 from .config import config, resolve
+from .loop import shared_loop
 
 
 @dataclass
@@ -64,6 +65,13 @@ class Events:
 
     Each handler runs concurrently — while one awaits an API call,
     the next event can start processing.
+
+    Plain iteration works too, from scripts and from notebooks that already
+    run an event loop; the subscription then lives on the library's
+    background loop (see :func:`novem.loop.shared_loop`)::
+
+        for msg in Events(["/u/alice/p/*/e/mention"]):
+            Context(msg.fqnp).reply("thanks!")
     """
 
     def __init__(self, patterns: List[str], **kwargs: Any) -> None:
@@ -108,3 +116,20 @@ class Events:
                 yield await q.get()
         finally:
             await sio.disconnect()
+
+    def __iter__(self) -> Iterator[EventMessage]:
+        """Sync iterator — blocks for each event, driving :meth:`__aiter__` in the background."""
+        events = cast(AsyncGenerator[EventMessage, None], self.__aiter__())
+        loop = shared_loop()
+
+        async def next_event() -> EventMessage:
+            return await events.__anext__()
+
+        try:
+            while True:
+                try:
+                    yield loop.run(next_event())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run(events.aclose())
@@ -3,7 +3,9 @@ import re
 import sys
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from novem.exceptions import Novem403, Novem404, raise_on_response
+import requests
+
+from novem.exceptions import Novem403, Novem404, NovemException, raise_on_response
 
 from ..api_ref import NovemAPI
 from ..shared import NovemShare
@@ -12,12 +14,18 @@ from ..tags import NovemTags
 from ..utils import cl
 from ..utils import colors as clrs
 from .config import NovemJobConfig
+from .download import DownloadStats, NovemDownloadError, download
+from .upload import ARCHIVE_FORMATS, ArchiveUpload, MultipartUpload, ProgressCallback
 
 """
 
 """
 
 
+class NovemJobError(NovemException):
+    """A job run could not be started or did not succeed."""
+
+
 class NovemJobAPI(NovemTreeSync, NovemAPI):
     config: Optional[NovemJobConfig]
     shared: Optional[NovemShare]
@@ -25,6 +33,9 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
     id: str
     user: Optional[str] = None
 
+    # transfer statistics of the last run's output download, if one was saved
+    last_download: Optional[DownloadStats] = None
+
     _debug: bool = False
 
     def __init__(self, **kwargs: Any) -> None:
@@ -327,7 +338,10 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
         input_dir: Optional[Union[str, List[str]]] = None,
         output: Optional[str] = None,
         output_file: Optional[str] = None,
-    ) -> None:
+        progress: Optional[ProgressCallback] = None,
+        archive: Optional[str] = None,
+        download_progress: Optional[ProgressCallback] = None,
+    ) -> Optional[str]:
         """
         Trigger a job run by posting to /data.
 
@@ -342,20 +356,68 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
         When the same multipart filename appears in both sources, the *files*
         entry wins and a warning is emitted.
 
+        The multipart body is streamed from disk as it is sent (see
+        :class:`~novem.job.upload.MultipartUpload`), one input file open at a
+        time. *progress* is called as ``progress(sent, total)`` in bytes while
+        the body goes out.
+
+        *archive* (``"tar.gz"`` or ``"tar.zst"``) sends the same inputs as a
+        single compressed tarball part, ``input.tar.gz`` / ``input.tar.zst``,
+        instead of one part per file. The archive is packed while it uploads,
+        without a temporary file, which suits inputs with many small files.
+        ``tar.zst`` needs Python 3.14+ or the ``zstandard`` package.
+
         Without files or input_dir, an empty JSON body is sent.
 
         If *output* is provided, the response body is saved to that directory
         (created if necessary) using the filename from the server's
         Content-Disposition header. *output_file* instead writes it to exactly
         that path, which is what the CLI's ``-o @file.ext`` form asks for.
+        The output is streamed in adaptive chunks (see :mod:`novem.job.download`)
+        and *download_progress* is called as ``progress(received, total)``.
+        When the server offers a stable artefact URL, a dropped connection is
+        resumed with Range requests, and an advertised digest is verified.
+        Transfer statistics are kept in :attr:`last_download`.
 
         *input_dir* accepts a single directory or a list of them.
+
+        Returns the path the output was saved to, if any. Errors are printed
+        and exit the process, as the CLI expects; see :meth:`_run` (used by
+        :class:`~novem.job.runner.JobRunner`) for the raising variant.
         """
+        try:
+            return self._run(
+                files=files,
+                input_dir=input_dir,
+                output=output,
+                output_file=output_file,
+                progress=progress,
+                archive=archive,
+                download_progress=download_progress,
+            )
+        except (NovemJobError, NovemDownloadError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    def _run(
+        self,
+        files: Optional[List[str]] = None,
+        input_dir: Optional[Union[str, List[str]]] = None,
+        output: Optional[str] = None,
+        output_file: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        archive: Optional[str] = None,
+        download_progress: Optional[ProgressCallback] = None,
+    ) -> Optional[str]:
+        """The body of :meth:`run`, raising :class:`NovemJobError` instead of exiting."""
         path = self._path("/data")
 
         if self._debug:
             print(f"POST: {path}")
 
+        if archive is not None and archive not in ARCHIVE_FORMATS:
+            raise NovemJobError(f"unsupported archive format {archive}, expected one of: {', '.join(ARCHIVE_FORMATS)}")
+
         upload: Dict[str, str] = {}
 
         input_dirs: List[str] = []
@@ -366,8 +428,7 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
 
         for one_dir in input_dirs:
             if not os.path.isdir(one_dir):
-                print(f"Error: input directory not found: {one_dir}")
-                sys.exit(1)
+                raise NovemJobError(f"input directory not found: {one_dir}")
             for root, dirs, walked in os.walk(one_dir):
                 # skip hidden directories in-place so we don't descend into them
                 dirs[:] = [d for d in dirs if not d.startswith(".")]
@@ -381,12 +442,10 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
         if files:
             for raw in files:
                 if not raw.startswith("@"):
-                    print(f"Error: file arguments must start with @, got: {raw}")
-                    sys.exit(1)
+                    raise NovemJobError(f"file arguments must start with @, got: {raw}")
                 fpath = raw[1:]
                 if not os.path.isfile(fpath):
-                    print(f"Error: file not found: {fpath}")
-                    sys.exit(1)
+                    raise NovemJobError(f"file not found: {fpath}")
                 mp_name = os.path.basename(fpath)
                 if mp_name in upload and upload[mp_name] != fpath:
                     print(
@@ -396,12 +455,28 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
                 upload[mp_name] = fpath
 
         if upload:
-            multipart: List[Tuple[str, Any]] = [
-                (f"file_{idx}", (mp_name, open(fpath, "rb"))) for idx, (mp_name, fpath) in enumerate(upload.items())
-            ]
-            if self._debug:
-                print(f"  files in:  {len(upload)} ({list(upload.keys())})")
-            r = self._session.post(path, files=multipart, stream=bool(output or output_file), timeout=(30, 1800))
+            body: Union[MultipartUpload, ArchiveUpload]
+            if archive:
+                body = ArchiveUpload(list(upload.items()), archive, progress=progress)
+                if self._debug:
+                    print(f"  files in:  {len(upload)} ({list(upload.keys())}, as {body.filename})")
+            else:
+                body = MultipartUpload(
+                    [(f"file_{idx}", mp_name, fpath) for idx, (mp_name, fpath) in enumerate(upload.items())],
+                    progress=progress,
+                )
+                if self._debug:
+                    print(f"  files in:  {len(upload)} ({list(upload.keys())}, {len(body)} bytes)")
+            try:
+                r = self._session.post(
+                    path,
+                    headers={"Content-type": body.content_type},
+                    data=body,
+                    stream=bool(output or output_file),
+                    timeout=(30, 1800),
+                )
+            finally:
+                body.close()
         else:
             if self._debug:
                 print("  files in:  0")
@@ -413,17 +488,31 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
                 timeout=(30, 1800),
             )
 
+        try:
+            return self._save_output(r, output, output_file, download_progress)
+        finally:
+            r.close()
+
+    def _save_output(
+        self,
+        r: requests.Response,
+        output: Optional[str],
+        output_file: Optional[str],
+        progress: Optional[ProgressCallback] = None,
+    ) -> Optional[str]:
+        """Check a run response and stream its body to disk if asked to."""
         if not r.ok:
             # Try to parse error message from JSON response
             try:
                 error_data = r.json()
-                if "error" in error_data:
-                    print(f"Error: {error_data['error']}")
-                else:
-                    print(f"Error: {r.text}")
-            except Exception:
-                print(f"Error: {r.text}")
-            sys.exit(1)
+            except ValueError:
+                error_data = None
+            if isinstance(error_data, dict) and "error" in error_data:
+                raise NovemJobError(error_data["error"])
+            raise NovemJobError(r.text)
+
+        dest: Optional[str] = None
+        self.last_download = None
 
         if output_file:
             # -o @file.ext: write the artifact to exactly this path
@@ -431,20 +520,19 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
             if parent:
                 os.makedirs(parent, exist_ok=True)
             with open(output_file, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                self.last_download = download(self._session, r, f, progress=progress)
+            dest = output_file
             if self._debug:
-                print(f"  files out: 1 -> {output_file}")
+                print(f"  files out: 1 -> {output_file} ({self._describe_download()})")
         elif output:
             os.makedirs(output, exist_ok=True)
             cd = r.headers.get("Content-Disposition", "")
             name = self._parse_filename(cd) or "output"
             dest = self._dedup_path(output, name)
             with open(dest, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                self.last_download = download(self._session, r, f, progress=progress)
             if self._debug:
-                print(f"  files out: 1 ({name}) -> {dest}")
+                print(f"  files out: 1 ({name}) -> {dest} ({self._describe_download()})")
         elif r.content:
             if self._debug:
                 cd = r.headers.get("Content-Disposition", "")
@@ -454,6 +542,19 @@ class NovemJobAPI(NovemTreeSync, NovemAPI):
             if self._debug:
                 print("  files out: 0")
 
+        return dest
+
+    def _describe_download(self) -> str:
+        stats = self.last_download
+        if stats is None:
+            return ""
+        parts = [f"{stats.bytes} bytes", f"{stats.throughput / (1024 * 1024):.1f} MiB/s"]
+        if stats.resumed:
+            parts.append(f"resumed {stats.resumed}x")
+        if stats.verified:
+            parts.append(f"{stats.verified} verified")
+        return ", ".join(parts)
+
     def _sync_base(self, user_aware: bool) -> str:
         # _path() is already user-aware
         return self._path()
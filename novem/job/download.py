@@ -0,0 +1,196 @@
+"""Streaming download of job run artefacts.
+
+A run's output arrives as the body of the ``POST /data`` response. This
+module writes it to disk in chunks that adapt to the link: they start small,
+double while reads finish quickly and halve when a read stalls, so fast links
+make few large writes and slow links still report progress often.
+
+When the server supports it, an interrupted download is resumed instead of
+running the job again. That needs a stable artefact URL in the response's
+``Content-Location`` header and ``Accept-Ranges: bytes``; the rest is fetched
+with a ``Range`` request (guarded by ``If-Range`` when an ETag is given). A
+digest in ``Repr-Digest`` (RFC 9530), ``Digest`` (RFC 3230) or ``Content-MD5``
+is checked once the body is complete. A content-coded (e.g. gzip) body is
+written decoded, so it is neither resumed nor checked against a digest.
+"""
+
+import base64
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+import urllib3
+
+from novem.exceptions import NovemException
+
+from .upload import ProgressCallback
+
+_MIN_CHUNK = 64 * 1024
+_MAX_CHUNK = 8 * 1024 * 1024
+# aim for reads of about this long: big enough to amortise per-chunk
+# overhead, short enough for progress to keep moving on a slow link
+_TARGET_READ_SECONDS = 0.25
+
+# digest algorithm names (lower-cased) to hashlib names
+_DIGEST_ALGOS = {"sha-512": "sha512", "sha-256": "sha256", "sha": "sha1", "md5": "md5"}
+
+_TRANSFER_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError)
+
+
+class NovemDownloadError(NovemException):
+    """An artefact download failed, could not be resumed or did not verify."""
+
+
+@dataclass
+class DownloadStats:
+    """What a download moved, and how fast."""
+
+    bytes: int = 0
+    seconds: float = 0.0
+    resumed: int = 0  # how many times the transfer was picked up with a Range request
+    verified: Optional[str] = None  # the digest algorithm checked, if the server sent one
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second over the whole download."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
+def _expected_digest(headers: Any) -> Optional[Tuple[str, bytes]]:
+    """The strongest (algorithm, raw digest) the response advertises."""
+    found: Dict[str, bytes] = {}
+
+    # Repr-Digest: sha-256=:<base64>:, sha-512=:<base64>:
+    for algo, b64 in re.findall(r"([\w-]+)=:([A-Za-z0-9+/=]+):", headers.get("Repr-Digest", "")):
+        found.setdefault(algo.lower(), base64.b64decode(b64))
+    # Digest: SHA-256=<base64>,MD5=<base64>
+    for algo, b64 in re.findall(r"([\w-]+)=([A-Za-z0-9+/]+=*)", headers.get("Digest", "")):
+        found.setdefault(algo.lower(), base64.b64decode(b64))
+    if headers.get("Content-MD5"):
+        found.setdefault("md5", base64.b64decode(headers["Content-MD5"]))
+
+    for algo in _DIGEST_ALGOS:
+        if algo in found:
+            return algo, found[algo]
+    return None
+
+
+def _encoded(r: requests.Response) -> bool:
+    return r.headers.get("Content-Encoding", "identity").lower() != "identity"
+
+
+def _body_checks(r: requests.Response) -> Tuple[Optional[int], Optional[Tuple[str, bytes]]]:
+    """The length and digest to check the body written to disk against.
+
+    Both describe the content-coded bytes while the body is written decoded,
+    so neither applies to a gzip or deflate encoded response; urllib3 still
+    raises when such a body ends short of its Content-Length.
+    """
+    if _encoded(r):
+        return None, None
+    length = r.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else None, _expected_digest(r.headers)
+
+
+def _resume_url(r: requests.Response) -> Optional[str]:
+    """The stable artefact URL to resume from, if the server offers one."""
+    location = r.headers.get("Content-Location")
+    if not location or r.headers.get("Accept-Ranges", "").lower() != "bytes":
+        return None
+    if _encoded(r):
+        # Range offsets count encoded bytes, not the decoded ones on disk
+        return None
+    return urljoin(r.url, location)
+
+
+def download(
+    session: requests.Session,
+    r: requests.Response,
+    f: IO[bytes],
+    progress: Optional[ProgressCallback] = None,
+    max_resumes: int = 3,
+) -> DownloadStats:
+    """Stream the body of ``r`` (requested with ``stream=True``) into ``f``.
+
+    ``progress`` is called as ``progress(received, total)`` where ``total``
+    is the Content-Length, or None when the size on disk is not known. Raises
+    :class:`NovemDownloadError` when the transfer breaks and cannot be
+    resumed, or when the body does not match the advertised digest.
+    """
+    stats = DownloadStats()
+    total, expected = _body_checks(r)
+    hasher = hashlib.new(_DIGEST_ALGOS[expected[0]]) if expected else None
+    resume_url = _resume_url(r)
+    etag = r.headers.get("ETag")
+
+    chunk = _MIN_CHUNK
+    started = time.monotonic()
+    current = r
+    while True:
+        error: Optional[BaseException] = None
+        while True:
+            t0 = time.monotonic()
+            try:
+                # read1: whatever has arrived, up to chunk, so a drop loses nothing buffered
+                block = current.raw.read1(chunk, decode_content=True)
+            except _TRANSFER_ERRORS as e:
+                # only the connection is retried, a failed write is not
+                error = e
+                break
+            elapsed = time.monotonic() - t0
+            if not block:
+                break
+            f.write(block)
+            if hasher:
+                hasher.update(block)
+            stats.bytes += len(block)
+            if progress:
+                progress(stats.bytes, total)
+
+            if elapsed < _TARGET_READ_SECONDS / 2 and chunk < _MAX_CHUNK:
+                chunk *= 2
+            elif elapsed > _TARGET_READ_SECONDS * 2 and chunk > _MIN_CHUNK:
+                chunk //= 2
+
+        if error is None and (total is None or stats.bytes >= total):
+            break
+        reason = str(error) if error else f"the connection closed at {stats.bytes} of {total} bytes"
+
+        if current is not r:
+            current.close()
+        if not resume_url or stats.resumed >= max_resumes:
+            raise NovemDownloadError(f"download interrupted after {stats.bytes} bytes: {reason}") from error
+        stats.resumed += 1
+        headers = {"Range": f"bytes={stats.bytes}-"}
+        if etag:
+            headers["If-Range"] = etag
+        current = session.get(resume_url, headers=headers, stream=True, timeout=(30, 1800))
+        if current.status_code == 200:
+            # the artefact changed (If-Range) or Range is ignored: start over,
+            # checking against what this response says about the new body
+            f.seek(0)
+            f.truncate()
+            stats.bytes = 0
+            total, expected = _body_checks(current)
+            hasher = hashlib.new(_DIGEST_ALGOS[expected[0]]) if expected else None
+            resume_url = _resume_url(current)
+            etag = current.headers.get("ETag")
+        elif current.status_code != 206 or not current.headers.get("Content-Range", "").startswith(
+            f"bytes {stats.bytes}-"
+        ):
+            current.close()
+            raise NovemDownloadError(f"could not resume download (HTTP {current.status_code}): {reason}") from error
+
+    if current is not r:
+        current.close()
+    stats.seconds = time.monotonic() - started
+
+    if expected and hasher:
+        if hasher.digest() != expected[1]:
+            raise NovemDownloadError(f"download failed {expected[0]} verification")
+        stats.verified = expected[0]
+    return stats
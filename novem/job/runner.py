@@ -0,0 +1,186 @@
+"""Run many jobs concurrently.
+
+:meth:`Job.run` blocks until the job finishes (up to its 1800 s read timeout)
+and exits the process on failure, which suits the CLI but not a caller that
+fans out hundreds of runs. :class:`JobRunner` runs a list of jobs on a
+bounded thread pool, one :class:`Job` (and so one HTTP session) per run:
+
+    runner = JobRunner(["etl", "report", "export"], output_dir="out", max_workers=4)
+    results = runner.run()
+    failed = [r for r in results if not r.ok]
+
+Each job's output is streamed to ``{output_dir}/{job}/``, so job names must
+be unique when ``output_dir`` is set. ``input_dir`` may contain a ``{job}``
+placeholder to give every job its own inputs; without one, all jobs share the
+same inputs. When ``output_dir`` is set, a machine-readable ``manifest.json``
+with per-job status, timings and output paths is written next to the outputs.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from novem.exceptions import NovemException
+
+from . import Job
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+@dataclass
+class JobResult:
+    """The outcome of one job run in a :class:`JobRunner` batch."""
+
+    job: str
+    ok: bool
+    seconds: float
+    started: str
+    finished: str
+    output: Optional[str] = None
+    error: Optional[str] = None
+    output_bytes: Optional[int] = None
+    throughput: Optional[float] = None  # output download rate, bytes per second
+
+
+class JobRunner:
+    """Run many jobs concurrently on a bounded worker pool.
+
+    ``jobs`` are job names (looked up without creating them) or ready-made
+    :class:`Job` objects. ``files``, ``input_dir`` and ``archive`` are passed
+    to every run as in :meth:`Job.run`; ``{job}`` in ``input_dir`` is
+    replaced by the job's name. ``on_result`` is called from the worker
+    thread as each job finishes. Remaining keyword arguments (``profile``,
+    ``config_path``, ...) are used to construct jobs given by name.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[Union[str, Job]],
+        max_workers: int = 8,
+        output_dir: Optional[str] = None,
+        input_dir: Optional[Union[str, List[str]]] = None,
+        files: Optional[List[str]] = None,
+        archive: Optional[str] = None,
+        on_result: Optional[Callable[[JobResult], None]] = None,
+        **job_kwargs: Any,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.jobs = list(jobs)
+        if output_dir:
+            # each run writes to output_dir/name, so a repeated name would clobber another's files
+            names = [self._name(j) for j in self.jobs]
+            repeated = sorted({n for n in names if names.count(n) > 1})
+            if repeated:
+                raise ValueError(f"jobs writing to output_dir need unique names, repeated: {', '.join(repeated)}")
+        self.max_workers = max_workers
+        self.output_dir = output_dir
+        self.input_dir = input_dir
+        self.files = files
+        self.archive = archive
+        self.on_result = on_result
+        self._job_kwargs = job_kwargs
+        self._lock = threading.Lock()
+        self.results: List[JobResult] = []
+        self.seconds: float = 0.0
+        self.started: Optional[str] = None
+
+    def _job(self, job: Union[str, Job]) -> Job:
+        if isinstance(job, Job):
+            return job
+        kwargs = {"create": False, **self._job_kwargs}
+        return Job(job, **kwargs)
+
+    @staticmethod
+    def _name(job: Union[str, Job]) -> str:
+        return job.id if isinstance(job, Job) else job
+
+    def _inputs(self, name: str) -> Optional[Union[str, List[str]]]:
+        if isinstance(self.input_dir, str):
+            return self.input_dir.replace("{job}", name)
+        if self.input_dir:
+            return [d.replace("{job}", name) for d in self.input_dir]
+        return None
+
+    def _run_one(self, job: Union[str, Job]) -> JobResult:
+        name = self._name(job)
+        started = _now()
+        t0 = time.monotonic()
+        output: Optional[str] = None
+        error: Optional[str] = None
+        runnable: Optional[Job] = None
+        try:
+            runnable = self._job(job)
+            output = runnable._run(
+                files=self.files,
+                input_dir=self._inputs(name),
+                output=os.path.join(self.output_dir, name) if self.output_dir else None,
+                archive=self.archive,
+            )
+        except (NovemException, OSError) as e:
+            error = str(e) or type(e).__name__
+        except Exception as e:  # a transport failure must not take the batch down
+            error = f"{type(e).__name__}: {e}"
+
+        stats = runnable.last_download if runnable else None
+        result = JobResult(
+            job=name,
+            ok=error is None,
+            seconds=round(time.monotonic() - t0, 3),
+            started=started,
+            finished=_now(),
+            output=output,
+            error=error,
+            output_bytes=stats.bytes if stats else None,
+            throughput=round(stats.throughput, 1) if stats else None,
+        )
+        if self.on_result:
+            with self._lock:
+                self.on_result(result)
+        return result
+
+    def run(self) -> List[JobResult]:
+        """Run every job and return their results in the order given."""
+        self.started = _now()
+        t0 = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(self.jobs), 1))) as pool:
+            self.results = list(pool.map(self._run_one, self.jobs))
+        self.seconds = round(time.monotonic() - t0, 3)
+
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self.write_manifest(os.path.join(self.output_dir, MANIFEST_NAME))
+        return self.results
+
+    @property
+    def ok(self) -> bool:
+        """True when every job in the last :meth:`run` succeeded."""
+        return all(r.ok for r in self.results)
+
+    def manifest(self) -> Dict[str, Any]:
+        """The results of the last :meth:`run` as a JSON-ready dict."""
+        return {
+            "started": self.started,
+            "seconds": self.seconds,
+            "max_workers": self.max_workers,
+            "ok": self.ok,
+            "jobs": [asdict(r) for r in self.results],
+        }
+
+    def write_manifest(self, path: str) -> None:
+        """Write :meth:`manifest` to ``path`` as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest(), f, indent=2)
+            f.write("\n")
+
+
+__all__ = ["JobRunner", "JobResult"]
@@ -0,0 +1,210 @@
+"""Streaming multipart bodies for job runs.
+
+Handing ``files=[(name, open(path)), ...]`` to ``requests`` assembles the
+whole multipart body in memory before anything is sent, so a run with a few
+GB of input needs a few GB of RAM. :class:`MultipartUpload` produces the same
+``multipart/form-data`` body lazily instead: each file is opened when its part
+is reached, read in fixed-size blocks and closed before the next part, so at
+most one input handle is open at any time.
+
+Part sizes are known up front (headers plus ``os.path.getsize``), so the body
+is sent with a Content-Length and streamed block by block rather than being
+buffered.
+
+:class:`ArchiveUpload` packs the inputs into a single compressed tarball part
+instead (``tar.gz`` or ``tar.zst``). The tarball is built and compressed while
+it is sent, without a temporary file; its size is not known up front, so that
+body goes out with chunked transfer encoding.
+"""
+
+import os
+import secrets
+import tarfile
+import zlib
+from typing import IO, Any, Callable, Iterator, List, Optional, Tuple
+
+from novem.exceptions import NovemException
+
+# (bytes sent so far, total bytes or None when not known up front)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+ARCHIVE_FORMATS = ("tar.gz", "tar.zst")
+
+_ARCHIVE_TYPES = {"tar.gz": "application/gzip", "tar.zst": "application/zstd"}
+
+_BLOCK_SIZE = 256 * 1024
+
+
+def _quote_param(value: str) -> str:
+    """Escape a multipart header parameter the way urllib3 does (HTML5 form)."""
+    return value.translate({ord('"'): "%22", ord("\r"): "%0D", ord("\n"): "%0A"})
+
+
+def _compressor(archive: str) -> Any:
+    """A streaming compressor (``compress``/``flush``) for an archive format."""
+    if archive == "tar.gz":
+        # wbits=31: deflate with a gzip header and trailer
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd.ZstdCompressor()
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        raise ImportError("tar.zst needs Python 3.14+ or zstandard. Install with: pip install zstandard") from None
+    return zstandard.ZstdCompressor().compressobj()
+
+
+class _StreamingBody:
+    """Shared bookkeeping for the lazily generated request bodies."""
+
+    _size: Optional[int] = None
+
+    def __init__(self, progress: Optional[ProgressCallback], block_size: int) -> None:
+        self.boundary = secrets.token_hex(16)
+        self._progress = progress
+        self._block_size = block_size
+        self._handle: Optional[IO[bytes]] = None
+        self._sent = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def sent(self) -> int:
+        """Bytes of the body handed to the transport so far."""
+        return self._sent
+
+    def _part_header(self, field: str, filename: str, content_type: Optional[str] = None) -> bytes:
+        header = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote_param(field)}"; filename="{_quote_param(filename)}"\r\n'
+        )
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return f"{header}\r\n".encode("utf-8")
+
+    def _trailer(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode("ascii")
+
+    def _count(self, block: bytes) -> bytes:
+        self._sent += len(block)
+        if self._progress:
+            self._progress(self._sent, self._size)
+        return block
+
+    def _read_file(self, path: str, size: int) -> Iterator[bytes]:
+        """Yield exactly ``size`` bytes of ``path``, holding it open only meanwhile."""
+        remaining = size
+        self._handle = open(path, "rb")
+        try:
+            while remaining:
+                block = self._handle.read(min(self._block_size, remaining))
+                if not block:
+                    raise NovemException(f"{path} shrank while it was being uploaded")
+                remaining -= len(block)
+                yield block
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the file handle of the part being sent, if any."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class MultipartUpload(_StreamingBody):
+    """A lazily generated ``multipart/form-data`` request body.
+
+    ``parts`` is a list of ``(field, filename, path)``. Pass the object as
+    ``data=`` with :attr:`content_type` as the Content-Type header; call
+    :meth:`close` when the request is done (or abandoned) to release the
+    file handle of a part that was only partly sent.
+    """
+
+    def __init__(
+        self,
+        parts: List[Tuple[str, str, str]],
+        progress: Optional[ProgressCallback] = None,
+        block_size: int = _BLOCK_SIZE,
+    ) -> None:
+        super().__init__(progress, block_size)
+        self._parts = [
+            (self._part_header(field, filename), path, os.path.getsize(path)) for field, filename, path in parts
+        ]
+        self._size = sum(len(h) + size + 2 for h, _, size in self._parts) + len(self._trailer())
+
+    def __len__(self) -> int:
+        return self._size or 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, path, size in self._parts:
+            yield self._count(header)
+            for block in self._read_file(path, size):
+                yield self._count(block)
+            yield self._count(b"\r\n")
+        yield self._count(self._trailer())
+
+
+class ArchiveUpload(_StreamingBody):
+    """A multipart body with one part: the inputs as a compressed tarball.
+
+    ``files`` is a list of ``(archive name, path)``; ``archive`` is one of
+    :data:`ARCHIVE_FORMATS`. The tar stream is written by hand (PAX headers
+    from :class:`tarfile.TarInfo`, then the file's blocks) so that a single
+    large input never has to be held in memory, and each piece is compressed
+    on its way out.
+    """
+
+    def __init__(
+        self,
+        files: List[Tuple[str, str]],
+        archive: str,
+        progress: Optional[ProgressCallback] = None,
+        block_size: int = _BLOCK_SIZE,
+    ) -> None:
+        if archive not in ARCHIVE_FORMATS:
+            raise NovemException(f"unsupported archive format {archive!r}, expected: {', '.join(ARCHIVE_FORMATS)}")
+        super().__init__(progress, block_size)
+        self.archive = archive
+        self.filename = f"input.{archive}"
+        # fail on a missing zstd backend before the request is started; the
+        # compressor used is made per iteration so a retried body is whole
+        _compressor(archive)
+        self._files = files
+
+    def _tar(self) -> Iterator[bytes]:
+        """The uncompressed tar stream for ``self._files``."""
+        written = 0
+        for name, path in self._files:
+            st = os.stat(path)
+            info = tarfile.TarInfo(name)
+            info.size = st.st_size
+            info.mtime = int(st.st_mtime)
+            info.mode = st.st_mode & 0o7777
+            header = info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+            yield header
+            yield from self._read_file(path, info.size)
+            pad = -info.size % tarfile.BLOCKSIZE
+            if pad:
+                yield tarfile.NUL * pad
+            written += len(header) + info.size + pad
+        # end-of-archive marker, padded out to a whole record like tarfile does
+        end = 2 * tarfile.BLOCKSIZE
+        end += -(written + end) % tarfile.RECORDSIZE
+        yield tarfile.NUL * end
+
+    def __iter__(self) -> Iterator[bytes]:
+        compress = _compressor(self.archive)
+        yield self._count(self._part_header("file_0", self.filename, _ARCHIVE_TYPES[self.archive]))
+        for block in self._tar():
+            packed = compress.compress(block)
+            if packed:
+                yield self._count(packed)
+        tail = compress.flush()
+        yield self._count(tail + b"\r\n" + self._trailer())
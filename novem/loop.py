@@ -0,0 +1,86 @@
+"""The library's background event loop.
+
+The sync compute helpers (``Computer.run``, ``stream``, ``put``, ...) and the
+sync :class:`~novem.events.Events` iterator are thin wrappers around
+coroutines. Rather than create and tear down an event loop for every call
+with ``asyncio.run`` — which also fails outright inside a loop that is
+already running, as in Jupyter — they submit their coroutine to one
+long-lived loop on a daemon thread and block until it finishes:
+
+    from novem.loop import shared_loop
+
+    result = shared_loop().run(some_coroutine())
+
+Work that outlives a call, such as pooled compute connections and port
+forwards, lives on the same loop. The loop is started on first use and
+stopped at interpreter exit.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from novem.exceptions import NovemException
+
+_T = TypeVar("_T")
+
+
+class _LoopThread:
+    """One event loop on a daemon thread, driven from synchronous code."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name=self._name, daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run ``coro`` on the loop thread and block until it finishes."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise NovemException("A blocking novem call was made from novem's own event loop; await it instead.")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop())
+        try:
+            return future.result()
+        except KeyboardInterrupt:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not thread.is_alive():
+            loop.close()
+
+
+_shared_loop: Optional[_LoopThread] = None
+_shared_loop_lock = threading.Lock()
+
+
+def shared_loop() -> _LoopThread:
+    """The process-wide background loop, stopped at interpreter exit."""
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            import atexit
+
+            _shared_loop = _LoopThread("novem-loop")
+            atexit.register(_shared_loop.stop)
+        return _shared_loop
+
+
+__all__ = ["shared_loop"]
@@ -1,3 +1,4 @@
-from novem.table.selector import Selector
+from novem.table.selector import Selector, SelectorSet
+from novem.table.styler import compile_ctx, compile_masks, compile_styler
 
-__all__ = ["Selector"]
+__all__ = ["Selector", "SelectorSet", "compile_ctx", "compile_masks", "compile_styler"]
@@ -1,5 +1,5 @@
 import sys
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 
 if TYPE_CHECKING:
     # give type checkers the real modules so pd./np. attributes resolve
@@ -64,15 +64,104 @@ def handle_position(position: Union[slice, Any, int], used_positions: Set[int])
         return []
 
 
-def enhance_positions(positions: List[int], ior: int) -> List[int]:
-    if not positions or not isinstance(ior, int):
+def _occurrences(codes: "np.ndarray") -> "np.ndarray":
+    """
+    For each entry, how many equal entries come before it (0 for the first)
+    """
+    order = np.argsort(codes, kind="stable")
+    ranked = codes[order]
+    starts = np.r_[True, ranked[1:] != ranked[:-1]]
+    offsets = np.arange(len(codes))
+    occ = np.empty(len(codes), dtype=np.intp)
+    occ[order] = offsets - np.maximum.accumulate(np.where(starts, offsets, 0))
+    return occ
+
+
+class _AxisLookup(object):
+    """
+    Resolve labels to positions along one axis of a reference frame, the
+    way one get_loc() and handle_position() call per label would, but in
+    bulk
+
+    The n-th occurrence of a label maps to the n-th row carrying that label
+    in the axis and is dropped if there is none. The work that only depends
+    on the axis is done once, so a lookup can be shared by many selectors.
+    Labels get_indexer() cannot match exactly (missing keys, partial date
+    strings and the like) fall back to the per-label loop, which keeps its
+    error handling.
+    """
+
+    def __init__(self, axis: Any) -> None:
+        self.axis = axis
+        self.unique = axis.is_unique
+        if not self.unique:
+            codes, self.uniques = axis.factorize(use_na_sentinel=False)
+            codes = codes.astype(np.intp)
+            self.width = len(axis) + 1
+            keys = codes * self.width + _occurrences(codes)
+            self.order = np.argsort(keys, kind="stable")
+            self.keys = keys[self.order]
+
+    def positions(self, labels: Any) -> List[int]:
+        labels = pd.Index(labels) if not isinstance(labels, pd.Index) else labels
+
+        if self.unique:
+            found = self.axis.get_indexer(labels)
+            if len(found) and (found >= 0).all():
+                # a repeated label resolves only once, at its first occurrence
+                _, first = np.unique(found, return_index=True)
+                return found[np.sort(first)].tolist()
+        else:
+            codes = self.uniques.get_indexer(labels)
+            if (codes >= 0).all():
+                keys = codes * self.width + _occurrences(codes)
+                at = np.searchsorted(self.keys, keys).clip(max=len(self.keys) - 1)
+                hit = self.keys[at] == keys
+                return self.order[at[hit]].tolist()
+
+        positions: List[int] = []
+        used_positions: Set[int] = set()
+        for label in labels:
+            positions.extend(handle_position(self.axis.get_loc(label), used_positions))
+        return positions
+
+
+def enhance_positions(positions: "np.ndarray", ior: int) -> "np.ndarray":
+    if not len(positions) or not isinstance(ior, int):
         return positions
     if ior == 0:
         return positions
     elif ior < 0:
-        return list(range(min(positions) + ior, min(positions))) + positions
+        low = positions.min()
+        return np.r_[np.arange(low + ior, low), positions]
     else:  # ior > 0
-        return positions + list(range(max(positions) + 1, max(positions) + 1 + ior))
+        high = positions.max()
+        return np.r_[positions, np.arange(high + 1, high + 1 + ior)]
+
+
+def compress_positions(positions: Any) -> str:
+    """
+    Format positions as a novem selector axis, writing every ascending run
+    of three or more consecutive positions as an inclusive start:end range
+
+    Order is preserved, so [1, 2, 3, 4, 9, 6, 7] becomes "1:4,9,6,7"
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    values = positions.tolist()
+    breaks = np.flatnonzero(np.diff(positions) != 1) + 1
+    starts = np.r_[0, breaks]
+    stops = np.r_[breaks, len(positions)]
+    runs = np.flatnonzero(stops - starts > 2)
+
+    # everything between two ranges is written out as is
+    parts: List[str] = []
+    done = 0
+    for start, stop in zip(starts[runs].tolist(), stops[runs].tolist()):
+        parts.extend(map(str, values[done:start]))
+        parts.append(f"{values[start]}:{values[stop - 1]}")
+        done = stop
+    parts.extend(map(str, values[done:]))
+    return ",".join(parts)
 
 
 class Selector(object):
@@ -104,6 +193,10 @@ class Selector(object):
 
     If you have duplicate values we recommend you reset_index and supply
     a co or ci of -1
+
+    Runs of consecutive rows or columns are written as start:end ranges,
+    which keeps selectors over large tables short; pass compact=False for
+    the plain comma separated list of every position
     """
 
     def __init__(
@@ -117,6 +210,7 @@ class Selector(object):
         io: Optional[int] = None,
         cor: Optional[int] = None,
         ior: Optional[int] = None,
+        compact: bool = True,
     ) -> None:
         """ """
 
@@ -131,6 +225,11 @@ class Selector(object):
         self.io = io
         self.cor = cor
         self.ior = ior
+        self.compact = compact
+
+        # shared by every selector of a SelectorSet
+        self._index_lookup: Optional[_AxisLookup] = None
+        self._column_lookup: Optional[_AxisLookup] = None
 
     def _pd_ix_lookup(self) -> str:
         assert pd, "pandas is not installed"
@@ -189,36 +288,33 @@ class Selector(object):
         # duplicate values outside of filter
 
         # Find the row and column positions in the original dataframe
-        row_positions: List[int] = []
-        used_positions: Set[int] = set()
-        for row_label in row_indices:
-            position = frame.index.get_loc(row_label)
-            row_positions.extend(handle_position(position, used_positions))
-
-        col_positions: List[int] = []
-        used_col_positions: Set[int] = set()
-        for col_label in col_indices:
-            position = frame.columns.get_loc(col_label)
-            col_positions.extend(handle_position(position, used_col_positions))
+        index_lookup = self._index_lookup or _AxisLookup(frame.index)
+        column_lookup = self._column_lookup or _AxisLookup(frame.columns)
+        row_found = np.asarray(index_lookup.positions(row_indices), dtype=np.intp)
+        col_found = np.asarray(column_lookup.positions(col_indices), dtype=np.intp)
 
         # convert to novem 0 based index and drop negative offset results
         height = len(frame)
         width = len(frame.columns)
-        row_positions = [x + rl + io for x in row_positions if x < height]
-        row_positions = enhance_positions(row_positions, ior)
-        row_positions = [x for x in row_positions if x >= 0 and x <= height]
+        row_found = row_found[row_found < height] + rl + io
+        row_found = enhance_positions(row_found, ior)
+        row_positions: List[int] = row_found[(row_found >= 0) & (row_found <= height)].tolist()
 
-        col_positions = [x + cl + co for x in col_positions if x < width]
-        col_positions = enhance_positions(col_positions, cor)
-        col_positions = [x for x in col_positions if x >= 0 and x <= width]
+        col_found = col_found[col_found < width] + cl + co
+        col_found = enhance_positions(col_found, cor)
+        col_positions: List[int] = col_found[(col_found >= 0) & (col_found <= width)].tolist()
 
         # Return empty string if there are no valid rows/columns and no explicit override (Issue #55)
         if (not row_positions and not self.i) or (not col_positions and not self.c):
             return ""
 
         # Create a comma-separated list of row and column positions
-        row_str = ",".join(map(str, row_positions))
-        col_str = ",".join(map(str, col_positions))
+        if self.compact:
+            row_str = compress_positions(row_positions)
+            col_str = compress_positions(col_positions)
+        else:
+            row_str = ",".join(map(str, row_positions))
+            col_str = ",".join(map(str, col_positions))
 
         if self.i:
             row_str = self.i
@@ -246,3 +342,70 @@ class Selector(object):
         """
 
         return f"{self.get_selector_string()} {self.applicator}"
+
+
+# the /config/table/cell leaves a SelectorSet can write
+CELL_LEAVES = ("align", "border", "format", "padding", "text", "width", "merge", "overflow", "priority")
+
+
+class SelectorSet(object):
+    """
+    Build many selectors against one reference frame
+
+    Styling a large table typically takes dozens of selectors over the same
+    frame. A SelectorSet looks the frame's index and columns up once and
+    shares that work between all of them, then joins the selectors for
+    each cell leaf into the multi-line config novem expects:
+
+        ss = SelectorSet(df)
+        ss.add("align", df.loc[:, "NAV":], ">")
+        ss.add("format", df.loc[:, ["NAV", "YTD"]], ",.1%")
+        ss.add("border", ": 0", "l 1 gray-300")
+
+        plot.cell.align = ss.get_config("align")
+
+    Selections that resolve to no cells are left out. The keyword arguments
+    to add() are those of Selector.
+    """
+
+    def __init__(self, r: Any, compact: bool = True) -> None:
+        """ """
+        assert pd, "pandas is not installed"
+        assert np, "numpy is not installed"
+
+        self.ref = r
+        self.compact = compact
+        self._index_lookup = _AxisLookup(r.index)
+        self._column_lookup = _AxisLookup(r.columns)
+        self._selectors: Dict[str, List[Selector]] = {}
+
+    def add(self, leaf: str, selector: Any, applicator: Any, **kwargs: Any) -> Selector:
+        """
+        Add a selection to the config of a cell leaf (align, format, ...)
+        """
+        if leaf not in CELL_LEAVES:
+            raise ValueError(f"leaf must be one of {', '.join(CELL_LEAVES)}")
+
+        kwargs.setdefault("compact", self.compact)
+        sel = Selector(selector, applicator, r=self.ref, **kwargs)
+        sel._index_lookup = self._index_lookup
+        sel._column_lookup = self._column_lookup
+        self._selectors.setdefault(leaf, []).append(sel)
+        return sel
+
+    def get_config(self, leaf: str) -> str:
+        """
+        The selectors added for ``leaf``, one per line
+        """
+        lines: List[str] = []
+        for sel in self._selectors.get(leaf, []):
+            selection = sel.get_selector_string()
+            if selection:
+                lines.append(f"{selection} {sel.applicator}")
+        return "\n".join(lines)
+
+    def get_configs(self) -> Dict[str, str]:
+        """
+        The config of every leaf that has selectors, keyed by leaf
+        """
+        return {leaf: self.get_config(leaf) for leaf in self._selectors}
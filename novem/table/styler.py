@@ -0,0 +1,161 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+if TYPE_CHECKING:
+    # give type checkers the real modules so pd./np. attributes resolve
+    import numpy as np
+    import pandas as pd
+else:
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        pd = None
+        np = None
+
+from novem.table.selector import CELL_LEAVES, compress_positions
+
+# the leaf of /config/colors, next to the /config/table/cell leaves
+COLORS_LEAF = "colors"
+
+_ALIGN = {"left": "<", "start": "<", "center": "-", "right": ">", "end": ">"}
+
+
+def _css_rule(prop: str, value: str) -> Tuple[str, str]:
+    """
+    The novem leaf and applicator for one CSS declaration, or ("", "") if
+    novem has no equivalent
+    """
+    if prop in ("background-color", "background"):
+        return COLORS_LEAF, f"bg {value}"
+    if prop == "color":
+        return COLORS_LEAF, f"fg {value}"
+    if prop == "text-align" and value in _ALIGN:
+        return "align", _ALIGN[value]
+    return "", ""
+
+
+def _compile(
+    rows: "np.ndarray",
+    cols: "np.ndarray",
+    rule_ids: "np.ndarray",
+    rules: Sequence[Tuple[str, str]],
+    ro: int,
+    co: int,
+) -> Dict[str, str]:
+    """
+    Turn styled cells into selector lines, one leaf config per leaf
+
+    Cells are grouped per rule and column; columns that share the exact same
+    rows share one line, and both axes are written as ranges where they run.
+    """
+    configs: Dict[str, List[str]] = {}
+    if not len(rows):
+        return {}
+
+    order = np.lexsort((rows, cols, rule_ids))
+    rows, cols, rule_ids = rows[order], cols[order], rule_ids[order]
+    starts = np.flatnonzero(np.r_[True, (cols[1:] != cols[:-1]) | (rule_ids[1:] != rule_ids[:-1])])
+    stops = np.r_[starts[1:], len(rows)]
+
+    # rule -> row set -> columns, in order of first appearance
+    shapes: Dict[int, Dict[bytes, Tuple["np.ndarray", List[int]]]] = {}
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        selected = np.unique(rows[start:stop])
+        entry = shapes.setdefault(int(rule_ids[start]), {}).setdefault(selected.tobytes(), (selected, []))
+        entry[1].append(int(cols[start]))
+
+    for rule_id, by_rows in shapes.items():
+        leaf, applicator = rules[rule_id]
+        for selected, selected_cols in by_rows.values():
+            line = f"{compress_positions(selected + ro)} {compress_positions(np.asarray(selected_cols) + co)}"
+            configs.setdefault(leaf, []).append(f"{line} {applicator}")
+
+    return {leaf: "\n".join(lines) for leaf, lines in configs.items()}
+
+
+def compile_ctx(ctx: Mapping[Tuple[int, int], Iterable[Tuple[str, str]]], r: Any) -> Dict[str, str]:
+    """
+    Compile computed Styler styles into novem configs
+
+    Args:
+        ctx: CSS declarations per (row, column) position in ``r``, as in a
+            computed ``Styler.ctx``.
+        r: The frame the positions refer to, used for the header offsets.
+
+    Returns:
+        Dict[str, str]: Multi-line config per leaf, "colors" for colors and
+        the cell leaf name (e.g. "align") for the rest.
+
+    When a cell declares a property more than once the last value wins, as
+    in CSS. Properties novem has no equivalent for are skipped.
+    """
+    assert pd, "pandas is not installed"
+    assert np, "numpy is not installed"
+
+    rules: Dict[Tuple[str, str], int] = {}
+    cells: List[Tuple[int, int, int]] = []
+    for (row, col), declarations in ctx.items():
+        # last declaration of each property wins
+        props = {prop.strip().lower(): str(value).strip() for prop, value in declarations}
+        for prop, value in props.items():
+            rule = _css_rule(prop, value)
+            if rule[0]:
+                cells.append((row, col, rules.setdefault(rule, len(rules))))
+
+    table = np.asarray(cells, dtype=np.intp).reshape(-1, 3)
+    return _compile(table[:, 0], table[:, 1], table[:, 2], list(rules), r.columns.nlevels, r.index.nlevels)
+
+
+def compile_styler(styler: Any) -> Dict[str, str]:
+    """
+    Compile a pandas Styler into novem configs, see compile_ctx
+
+        configs = compile_styler(df.style.map(highlight).set_properties(**{"text-align": "right"}))
+
+        plot.colors = configs.pop("colors", "")
+        with plot.cell.batch() as cell:
+            for leaf, config in configs.items():
+                cell.add(leaf, config)
+
+    Styles on the index and column headers are not compiled.
+    """
+    # computes styler.ctx, the same step rendering takes
+    styler._compute()
+    return compile_ctx(styler.ctx, styler.data)
+
+
+def compile_masks(styles: Iterable[Tuple[str, Any, Any]], r: Any) -> Dict[str, str]:
+    """
+    Compile boolean masks into novem configs
+
+    Args:
+        styles: (leaf, applicator, mask) triples. ``leaf`` is "colors" or a
+            cell leaf, ``applicator`` the rule to apply (a string or e.g. a
+            StaticColor) and ``mask`` a boolean DataFrame or array shaped like
+            ``r``, or a DataFrame with a subset of its labels.
+        r: The reference frame.
+
+    Returns:
+        Dict[str, str]: Multi-line config per leaf, as compile_ctx.
+    """
+    assert pd, "pandas is not installed"
+    assert np, "numpy is not installed"
+
+    rules: List[Tuple[str, str]] = []
+    found: List[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]] = []
+    for leaf, applicator, mask in styles:
+        if leaf != COLORS_LEAF and leaf not in CELL_LEAVES:
+            raise ValueError(f"leaf must be one of {', '.join((COLORS_LEAF,) + CELL_LEAVES)}")
+        if isinstance(mask, pd.DataFrame) and mask.shape != r.shape:
+            mask = mask.reindex(index=r.index, columns=r.columns, fill_value=False)
+        values = np.asarray(mask, dtype=bool)
+        if values.shape != r.shape:
+            raise ValueError(f"mask shape {values.shape} does not match the frame's {r.shape}")
+        rows, cols = np.nonzero(values)
+        found.append((rows, cols, np.full(len(rows), len(rules), dtype=np.intp)))
+        rules.append((leaf, str(applicator)))
+
+    if not found:
+        return {}
+    rows, cols, rule_ids = (np.concatenate(x) for x in zip(*found))
+    return _compile(rows, cols, rule_ids, rules, r.columns.nlevels, r.index.nlevels)
@@ -1,3 +1,8 @@
-from novem.table.utils.format import merge_from_index, merge_from_index_first_rows, merge_from_index_last_rows
+from novem.table.utils.format import (
+    find_all_index_breaks,
+    merge_from_index,
+    merge_from_index_first_rows,
+    merge_from_index_last_rows,
+)
 
-__all__ = ["merge_from_index", "merge_from_index_first_rows", "merge_from_index_last_rows"]
+__all__ = ["find_all_index_breaks", "merge_from_index", "merge_from_index_first_rows", "merge_from_index_last_rows"]
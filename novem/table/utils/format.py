@@ -1,13 +1,49 @@
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
-    # give type checkers the real module so pd.DataFrame etc. resolve
+    # give type checkers the real modules so pd.DataFrame etc. resolve
+    import numpy as np
     import pandas as pd
 else:
     try:
+        import numpy as np
         import pandas as pd
     except ImportError:
         pd = None
+        np = None
+
+
+def _hierarchy(src: Union[pd.DataFrame, pd.Index], io: Optional[int]) -> Tuple[pd.MultiIndex, int]:
+    """
+    The index of ``src`` as a MultiIndex, and the row offset novem needs
+    """
+    if not isinstance(src, (pd.DataFrame, pd.Index)):
+        raise TypeError("Input must be a pandas DataFrame or Index object")
+
+    if isinstance(src, pd.DataFrame):
+        index = src.index
+        aio = src.columns.nlevels
+    else:
+        index = src
+        aio = 1
+
+    if not isinstance(index, pd.MultiIndex):
+        index = pd.MultiIndex.from_arrays([index])
+
+    return index, io if io is not None else aio
+
+
+def _level_breaks(index: pd.MultiIndex, level: int) -> "np.ndarray":
+    """
+    Rows where a new run of equal labels starts on ``level``
+
+    Compares the level's integer codes rather than the labels. Missing
+    labels (code -1) never equal each other, so each starts its own run.
+    """
+    codes = np.asarray(index.codes[level])
+    if not len(codes):
+        return np.empty(0, dtype=np.intp)
+    return np.flatnonzero(np.r_[True, (codes[1:] != codes[:-1]) | (codes[1:] == -1)])
 
 
 def merge_from_index(src: Union[pd.DataFrame, pd.Index], io: Optional[int] = None) -> str:
@@ -54,41 +90,19 @@ def merge_from_index(src: Union[pd.DataFrame, pd.Index], io: Optional[int] = Non
         2:3 0 lbl1
         4:5 0 lbl2
     """
-    if not isinstance(src, (pd.DataFrame, pd.Index)):
-        raise TypeError("Input must be a pandas DataFrame or Index object")
-
-    if isinstance(src, pd.DataFrame):
-        index = src.index
-        aio = src.columns.nlevels
-    else:
-        index = src
-        aio = 1
-
-    if io is not None:
-        aio = io
-
-    if not isinstance(index, pd.MultiIndex):
-        index = pd.MultiIndex.from_arrays([index])
+    index, aio = _hierarchy(src, io)
 
     if len(index) == 0:
         return ""  # Return empty string for empty index
 
     merge_instructions: List[str] = []
     for level in range(index.nlevels):
-        current_label = None
-        start_row = 0
-        row = 0  # bound even if the level has no values
-
-        for row, label in enumerate(index.get_level_values(level)):
-            if label == current_label:
-                continue
-            if current_label is not None and start_row < row - 1:
-                merge_instructions.append(f"{start_row + aio}:{row + aio - 1} {level} lbl{len(merge_instructions) + 1}")
-            current_label = label
-            start_row = row
-
-        if start_row < row:
-            merge_instructions.append(f"{start_row + aio}:{row + aio} {level} lbl{len(merge_instructions) + 1}")
+        starts = _level_breaks(index, level)
+        ends = np.r_[starts[1:], len(index)] - 1
+        # single cell merges are skipped
+        multi = ends > starts
+        for start, end in zip((starts[multi] + aio).tolist(), (ends[multi] + aio).tolist()):
+            merge_instructions.append(f"{start}:{end} {level} lbl{len(merge_instructions) + 1}")
 
     return "\n".join(merge_instructions)
 
@@ -111,20 +125,7 @@ def find_index_breaks(
             - The calculated offset value
             - Total length of the source data
     """
-    if not isinstance(src, (pd.DataFrame, pd.Index)):
-        raise TypeError("Input must be a pandas DataFrame or Index object")
-
-    if isinstance(src, pd.DataFrame):
-        index = src.index
-        aio = src.columns.nlevels
-    else:
-        index = src
-        aio = 1
-
-    offset = io if io is not None else aio
-
-    if not isinstance(index, pd.MultiIndex):
-        index = pd.MultiIndex.from_arrays([index])
+    index, offset = _hierarchy(src, io)
 
     total_length = len(index)
     if total_length == 0:
@@ -138,15 +139,27 @@ def find_index_breaks(
     if not 0 <= actual_level < index.nlevels:
         raise ValueError(f"Level {level} out of range for index with {index.nlevels} levels")
 
-    break_points: List[int] = []
-    current_label = None
+    return _level_breaks(index, actual_level).tolist(), offset, total_length
 
-    for row, label in enumerate(index.get_level_values(actual_level)):
-        if label != current_label:
-            break_points.append(row)
-            current_label = label
 
-    return break_points, offset, total_length
+def find_all_index_breaks(
+    src: Union[pd.DataFrame, pd.Index], io: Optional[int] = None
+) -> Tuple[List[List[int]], int, int]:
+    """
+    Find the group break points of every index level in one call.
+
+    Args:
+        src (Union[pd.DataFrame, pd.Index]): The source DataFrame or Index object to analyze.
+        io (Optional[int]): Initial offset. If provided, overrides the calculated offset.
+
+    Returns:
+        Tuple[List[List[int]], int, int]: A tuple containing:
+            - The break points of each level, outermost first, as returned by find_index_breaks
+            - The calculated offset value
+            - Total length of the source data
+    """
+    index, offset = _hierarchy(src, io)
+    return [_level_breaks(index, level).tolist() for level in range(index.nlevels)], offset, len(index)
 
 
 def merge_from_index_first_rows(
@@ -189,13 +202,6 @@ def merge_from_index_last_rows(
     if not break_points:
         return ""
 
-    last_rows: List[int] = []
-
-    # Handle groups before the last one
-    for i in range(len(break_points) - 1):
-        last_rows.append(break_points[i + 1] - 1)
-
-    # Handle the last group
-    last_rows.append(total_length - 1)
-
-    return ",".join(str(row + offset) for row in last_rows)
+    # each group ends the row before the next one begins
+    last_rows = break_points[1:] + [total_length]
+    return ",".join(str(row - 1 + offset) for row in last_rows)
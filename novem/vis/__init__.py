@@ -1,6 +1,6 @@
 import sys
 import warnings
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from novem.exceptions import Novem403, Novem404, raise_on_response
 
@@ -413,6 +413,33 @@ class NovemVisAPI(NovemTreeSync, NovemAPI):
         if not r.ok:
             raise_on_response(r)
 
+    def api_write_stream(self, relpath: str, chunks: Iterable[bytes]) -> None:
+        """
+        relpath: relative path to the plot baseline, as for api_write
+        chunks: utf-8 encoded pieces of the value, sent as a chunked
+                request body as they are produced
+        """
+        if self.user:
+            print(f"You cannot modify another user's {self._vispath}")
+            return
+
+        path = f"{self._api_root}vis/{self._vispath}/{self.id}{relpath}"
+
+        if self._debug:
+            print(f"POST (chunked): {path}")
+
+        r = self._session.post(
+            path,
+            headers={"Content-type": "text/plain"},
+            data=iter(chunks),
+        )
+
+        if r.status_code == 404:
+            raise Novem404(path)
+
+        if not r.ok:
+            raise_on_response(r)
+
     @property
     def log(self) -> None:
         """
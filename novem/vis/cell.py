@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+import requests
 
 from novem.table import Selector
+from novem.table.selector import CELL_LEAVES
 
 if TYPE_CHECKING:
     from novem.vis.plot import Plot
@@ -38,6 +42,124 @@ class IProxy(str):
         return self.p.read(self.path)
 
 
+class BatchLeaf(object):
+    """
+    The rules collected for one cell leaf inside a batch
+    """
+
+    def __init__(self) -> None:
+        self.rules: List[str] = []
+        self.replace = False
+
+    def __iadd__(self, val: Union[str, Selector]) -> "BatchLeaf":
+        self.rules.extend(x for x in str(val).split("\n") if x.strip())
+        return self
+
+    def __str__(self) -> str:
+        return "\n".join(self.rules)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _pool_size(session: requests.Session, url: str) -> int:
+    """
+    Connections the session keeps for url, requests that run past it open
+    a throwaway connection each
+    """
+    manager = getattr(session.get_adapter(url), "poolmanager", None)
+    return int(getattr(manager, "connection_pool_kw", {}).get("maxsize", 1))
+
+
+class NovemCellBatch(object):
+    """
+    Collect cell rules in memory and write each leaf once
+
+    Use it through ``plot.cell.batch()``:
+
+        with plot.cell.batch() as cell:
+            cell.align += S(df.loc[:, "NAV":], ">", r=df)
+            cell.format += ": 1: ,.1%"
+            cell.border = ": 0 l 1 gray-300"
+
+    Appending with ``+=`` adds to what the plot already has, assigning
+    replaces it, just as on ``plot.cell``. Nothing is read or written until
+    the block ends: then every leaf that was appended to is read once, the
+    rules are deduplicated and each touched leaf is written with one request,
+    the leaves concurrently, up to the connections the plot's session keeps
+    per host. On a frozen plot the leaves are queued one after the other
+    instead. If the block raises, nothing is written.
+
+    Repeated rules keep only their last occurrence, so the order in which
+    they take effect is unchanged.
+    """
+
+    def __init__(self, config: "NovemCellConfig", max_workers: int = 8) -> None:
+        self._config = config
+        self._max_workers = max_workers
+        self._leaves: Dict[str, BatchLeaf] = {}
+
+    def __enter__(self) -> "NovemCellBatch":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def __getattr__(self, name: str) -> BatchLeaf:
+        if name not in CELL_LEAVES:
+            raise AttributeError(name)
+        return self._leaves.setdefault(name, BatchLeaf())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in CELL_LEAVES:
+            return super().__setattr__(name, value)
+        if value is self._leaves.get(name):
+            return  # the result of +=
+        leaf = BatchLeaf()
+        leaf.replace = True
+        leaf += value
+        self._leaves[name] = leaf
+
+    def add(self, leaf: str, value: Union[str, Selector]) -> None:
+        """
+        Append rules to a leaf, e.g. the configs of a SelectorSet
+        """
+        if leaf not in CELL_LEAVES:
+            raise ValueError(f"leaf must be one of {', '.join(CELL_LEAVES)}")
+        current = getattr(self, leaf)
+        current += value
+
+    def flush(self) -> None:
+        """
+        Write every touched leaf and start over
+        """
+        leaves, self._leaves = self._leaves, {}
+        if not leaves:
+            return
+
+        def write(name: str, leaf: BatchLeaf) -> None:
+            path = f"/config/table/cell/{name}"
+            rules = leaf.rules
+            if not leaf.replace:
+                rules = self._config.read(path).split("\n") + rules
+            # keep the last of any repeated rule, where it takes effect
+            unique = list(dict.fromkeys(x for x in reversed(rules) if x.strip()))
+            self._config.write(path, "\n".join(reversed(unique)))
+
+        api = self._config.api
+        workers = min(self._max_workers, len(leaves), _pool_size(api._session, api._api_root))
+        if api._freeze or workers < 2:
+            # a frozen plot queues into one dict, keep it to this thread
+            for name, leaf in leaves.items():
+                write(name, leaf)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(write, name, leaf) for name, leaf in leaves.items()]:
+                future.result()
+
+
 class NovemCellConfig(object):
     def __init__(self, api: "Plot") -> None:
         """ """
@@ -65,6 +187,13 @@ class NovemCellConfig(object):
 
         return self.api._write(path, vls)
 
+    def batch(self) -> NovemCellBatch:
+        """
+        Collect cell rules locally and write each leaf once, see
+        NovemCellBatch
+        """
+        return NovemCellBatch(self)
+
     def _proxy(self, path: str) -> str:
         ip = IProxy()
         ip.p = self
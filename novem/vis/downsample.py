@@ -0,0 +1,182 @@
+"""Client-side downsampling of plot data.
+
+A line chart cannot show more points than it has pixels, so sending it
+millions of rows only costs upload and render time. :func:`downsample`
+reduces each numeric series of a pandas frame or series, or a NumPy array,
+to about ``max_points`` points before it is serialized:
+
+``"lttb"``
+    Largest-Triangle-Three-Buckets: one point per bucket, the one forming
+    the largest triangle with the point kept before it and the mean of the
+    next bucket. Keeps the visual shape of the series.
+``"minmax"``
+    The minimum and the maximum of every bucket. Keeps every peak.
+
+The first and last points are always kept. A frame with several series
+keeps the rows any of them selects, so rows stay aligned across columns.
+The index is the x axis when it is numeric or datetime and increasing,
+otherwise points are treated as evenly spaced.
+
+``MAX_POINTS`` is the default budget per plot type. Types that are not
+listed (bars, tables, maps, …) have a row per category and are not
+downsampled unless ``max_points`` is given explicitly.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    # give type checkers the real modules so pd./np. attributes resolve
+    import numpy as np
+    import pandas as pd
+else:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+METHODS = ("lttb", "minmax")
+
+# about two points per horizontal pixel of a rendered chart
+MAX_POINTS: Dict[str, int] = {
+    "line": 2000,
+    "area": 2000,
+    "scatter": 5000,
+}
+
+
+def max_points_for(plot_type: Optional[str]) -> Optional[int]:
+    """
+    The default point budget for a plot type, None if it is not downsampled
+    """
+    return MAX_POINTS.get((plot_type or "").strip().lower())
+
+
+def _bucket_sums(values: "np.ndarray", starts: "np.ndarray") -> "np.ndarray":
+    """
+    Sum and count the non-NaN values of every bucket starting at ``starts``
+    """
+    valid = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    counts = np.add.reduceat(valid.astype(np.intp), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def lttb_indices(x: "np.ndarray", y: "np.ndarray", max_points: int) -> "np.ndarray":
+    """
+    Positions of the points Largest-Triangle-Three-Buckets keeps
+
+    :x increasing x values
+    :y y values, NaN points are only kept when a bucket has nothing else
+    :max_points points to keep, at least 3
+    """
+    if max_points < 3:
+        raise ValueError("lttb needs max_points of at least 3")
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # the first and last point are kept, the rest split into even buckets
+    edges = (np.arange(max_points - 1) * ((n - 2) / (max_points - 2))).astype(np.intp) + 1
+    edges[-1] = n - 1
+    starts = edges[:-1]
+    mean_x = _bucket_sums(x[: n - 1], starts)
+    mean_y = _bucket_sums(y[: n - 1], starts)
+    # the bucket after the last one is the last point
+    mean_x = np.append(mean_x[1:], x[-1])
+    mean_y = np.append(mean_y[1:], y[-1])
+
+    kept = np.empty(max_points, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    # each bucket depends on the point kept in the one before
+    for i, (lo, hi) in enumerate(zip(starts.tolist(), edges[1:].tolist())):
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - mean_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (mean_y[i] - ay))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        kept[i + 1] = a
+    return kept
+
+
+def minmax_indices(y: "np.ndarray", max_points: int) -> "np.ndarray":
+    """
+    Positions of the minimum and maximum of every bucket
+
+    :y y values
+    :max_points points to keep, at least 4 (two buckets)
+    """
+    if max_points < 4:
+        raise ValueError("minmax needs max_points of at least 4")
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=np.float64)
+    size = -(-n // ((max_points - 2) // 2))
+    buckets = -(-n // size)
+    # pad to whole buckets; padding and NaN never win unless a bucket is all NaN
+    low = np.full(buckets * size, np.inf)
+    high = np.full(buckets * size, -np.inf)
+    low[:n] = np.where(np.isnan(y), np.inf, y)
+    high[:n] = np.where(np.isnan(y), -np.inf, y)
+    offsets = np.arange(buckets) * size
+    mins = offsets + low.reshape(buckets, size).argmin(axis=1)
+    maxs = offsets + high.reshape(buckets, size).argmax(axis=1)
+    return np.unique(np.concatenate(([0, n - 1], mins, maxs)))
+
+
+def _x_values(index: Any, n: int) -> "np.ndarray":
+    if isinstance(index, pd.DatetimeIndex) and index.is_monotonic_increasing and not index.hasnans:
+        return np.asarray(index, dtype="datetime64[ns]").astype(np.int64).astype(np.float64)
+    if pd.api.types.is_numeric_dtype(index.dtype) and index.is_monotonic_increasing and not index.hasnans:
+        return np.asarray(index, dtype=np.float64)
+    return np.arange(n, dtype=np.float64)
+
+
+def _select(x: "np.ndarray", columns: "np.ndarray", method: str, max_points: int) -> "np.ndarray":
+    picked = [
+        lttb_indices(x, column, max_points) if method == "lttb" else minmax_indices(column, max_points)
+        for column in columns.T
+    ]
+    return np.unique(np.concatenate(picked)) if picked else np.arange(len(x))
+
+
+def downsample(data: Any, method: str = "lttb", max_points: int = 2000) -> Any:
+    """
+    Downsample plot data, see the module docstring
+
+    :data pandas DataFrame/Series or 1 or 2 dimensional NumPy array, other
+        data is returned as is
+    :method "lttb" or "minmax"
+    :max_points points to keep per series
+    """
+    if method not in METHODS:
+        raise ValueError(f"downsample must be one of {', '.join(METHODS)}")
+
+    if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
+        if len(data) <= max_points:
+            return data
+        frame = data.to_frame() if isinstance(data, pd.Series) else data
+        numeric = frame.select_dtypes(include=["number", "bool"])
+        if numeric.shape[1] == 0:
+            return data
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        return data.iloc[_select(_x_values(frame.index, len(frame)), values, method, max_points)]
+
+    if np is not None and isinstance(data, np.ndarray) and data.ndim in (1, 2) and data.dtype.kind in "biuf":
+        if len(data) <= max_points:
+            return data
+        values = data.reshape(len(data), -1).astype(np.float64)
+        return data[_select(np.arange(len(data), dtype=np.float64), values, method, max_points)]
+
+    return data
+
+
+__all__ = ["MAX_POINTS", "METHODS", "downsample", "lttb_indices", "max_points_for", "minmax_indices"]
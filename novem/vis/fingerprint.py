@@ -0,0 +1,155 @@
+"""Fingerprints of plot data, to skip uploading data the plot already has.
+
+:func:`fingerprint` hashes plot data together with the options it is
+serialized with. Pandas objects are hashed with ``hash_pandas_object``,
+which is much cheaper than writing them as CSV, so unchanged frames skip
+serialization as well as the upload. NumPy arrays and strings hash their
+bytes; for anything else ``fingerprint`` returns None and the caller hashes
+the serialized CSV instead.
+
+A :class:`FingerprintStore` remembers the last fingerprint uploaded per
+plot, in memory or, given a path, in a JSON file that survives restarts and
+can be shared by processes refreshing the same plots.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+if TYPE_CHECKING:
+    # give type checkers the real modules so pd./np. attributes resolve
+    import numpy as np
+    import pandas as pd
+else:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+
+def _digest(*parts: bytes) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+def _pandas_fingerprint(data: Any, index: Optional[bool]) -> Optional[str]:
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    write_index = True if index is None else index
+    try:
+        rows = pd.util.hash_pandas_object(frame, index=write_index).to_numpy()
+    except TypeError:
+        # unhashable values, e.g. lists in object columns
+        return None
+
+    # the row hashes ignore labels and dtypes, both of which change the csv
+    layout = repr((list(frame.columns), [str(t) for t in frame.dtypes]))
+    if write_index:
+        layout += repr((frame.index.names, str(frame.index.dtype)))
+    return _digest(b"pandas", layout.encode("utf-8"), rows.tobytes())
+
+
+def fingerprint(data: Any, options: Optional[Mapping[str, Any]] = None) -> Optional[str]:
+    """
+    Fingerprint plot data without serializing it
+
+    :data the data passed to Plot._set_data
+    :options the serialization options, part of the fingerprint
+
+    Returns a hex digest, or None if the data is not a type that can be
+    hashed directly; hash its serialized CSV with fingerprint_csv instead.
+    """
+    prefix = repr(sorted((options or {}).items())).encode("utf-8")
+
+    if isinstance(data, str):
+        return _digest(b"str", data.encode("utf-8"))
+
+    if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
+        digest = _pandas_fingerprint(data, (options or {}).get("index"))
+        return _digest(prefix, digest.encode("ascii")) if digest else None
+
+    if np is not None and isinstance(data, np.ndarray) and not data.dtype.hasobject:
+        layout = repr((data.shape, data.dtype.str)).encode("utf-8")
+        return _digest(b"numpy", prefix, layout, np.ascontiguousarray(data).tobytes())
+
+    return None
+
+
+def fingerprint_csv(csv: str) -> str:
+    """
+    Fingerprint serialized plot data, equal to fingerprint() of the same string
+    """
+    return _digest(b"str", csv.encode("utf-8"))
+
+
+class FingerprintStore:
+    """
+    The last fingerprint uploaded per plot
+
+    Without a path the store only lives as long as the process. With a path
+    it is a JSON object of key -> fingerprint, re-read on every lookup and
+    replaced atomically on every update, so several processes can share it.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = os.path.expanduser(path) if path else None
+        self._memory: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, str]:
+        if self.path is None:
+            return self._memory
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            # a missing or unreadable store only means uploading again
+            return {}
+        return stored if isinstance(stored, dict) else {}
+
+    def _save(self, stored: Dict[str, str]) -> None:
+        if self.path is None:
+            self._memory = stored
+            return
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, prefix=".fingerprints-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stored, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            stored = dict(self._load())
+            stored[key] = value
+            self._save(stored)
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            stored = dict(self._load())
+            if stored.pop(key, None) is not None:
+                self._save(stored)
+
+
+# shared by every plot with skip_unchanged=True and no store of its own
+_memory_store = FingerprintStore()
+
+
+__all__ = ["FingerprintStore", "fingerprint", "fingerprint_csv"]
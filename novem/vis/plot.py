@@ -1,12 +1,15 @@
 from io import StringIO
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
 
 from novem.vis import NovemVisAPI
 
 from .cell import NovemCellConfig
 from .colors import NovemColors
 from .custom import NovemCustom
+from .downsample import METHODS, downsample, max_points_for
+from .fingerprint import FingerprintStore, _memory_store, fingerprint, fingerprint_csv
 from .plot_config import NovemPlotConfig
+from .serialize import is_chunked, stream_csv, to_csv
 
 # Import pandas for type checking, not runtime
 if TYPE_CHECKING:
@@ -27,6 +30,26 @@ class Plot(NovemVisAPI):
     Connection options (``token``, ``api_root``, ``profile``) are resolved from
     the arguments, ``novem.config``, the environment, or the config file — see
     the README. Unknown keyword arguments are ignored with a warning.
+
+    ``float_precision``, ``date_format``, ``index`` and ``engine`` control how
+    ``data`` is written as CSV (see ``novem.vis.serialize``); they can also be
+    given per call, e.g. ``plot(df, float_precision=2)``.
+
+    With ``skip_unchanged=True`` data identical to the last upload is neither
+    serialized nor sent again (see ``novem.vis.fingerprint``). Fingerprints
+    are kept in memory, or in the JSON file given as ``fingerprint_store`` so
+    scheduled refreshes skip unchanged data across restarts.
+
+    ``downsample="lttb"`` or ``"minmax"`` reduces long series to
+    ``max_points`` points before they are written (see
+    ``novem.vis.downsample``). Without ``max_points`` the budget follows the
+    plot type, and types without one (bars, tables, …) are sent in full.
+
+    ``data`` may also be an iterator or a list of chunks, e.g. ``read_csv(...,
+    chunksize=...)``, a database cursor or batches of its rows. The chunks
+    are serialized and uploaded as a chunked request as they are read, so
+    the whole payload is never held in memory. Streamed data is always
+    uploaded and never downsampled.
     """
 
     colors: Optional[NovemColors] = None
@@ -49,6 +72,14 @@ class Plot(NovemVisAPI):
         title: Optional[str] = None,
         colors: Optional[Any] = None,
         data: Optional[Any] = None,
+        float_precision: Optional[int] = None,
+        date_format: Optional[str] = None,
+        index: Optional[bool] = None,
+        engine: str = "pandas",
+        skip_unchanged: bool = False,
+        fingerprint_store: Optional[Union[str, FingerprintStore]] = None,
+        downsample: Optional[str] = None,
+        max_points: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -57,6 +88,15 @@ class Plot(NovemVisAPI):
         :type the type of plot
         :caption caption of the plot
         :title title of the plot
+        :float_precision decimals to round float data to
+        :date_format strftime format for datetime data
+        :index whether to write the index of pandas data (default True)
+        :engine "pandas" or "pyarrow" to write pandas data with
+        :skip_unchanged don't upload data identical to the last upload
+        :fingerprint_store path or FingerprintStore remembering uploads,
+            implies skip_unchanged
+        :downsample "lttb" or "minmax" to downsample long series
+        :max_points points to keep per series, by plot type if None
 
         Connection options (token, api_root, profile, …) and behaviour flags
         (user, create, qpr, debug) are accepted via **kwargs and resolved by
@@ -76,8 +116,34 @@ class Plot(NovemVisAPI):
 
         self._freeze: bool = False
 
+        # how data is written as csv, see novem.vis.serialize
+        self.csv_options: Dict[str, Any] = {
+            "float_precision": float_precision,
+            "date_format": date_format,
+            "index": index,
+            "engine": engine,
+        }
+
+        # last uploaded data per plot, None to always upload
+        if isinstance(fingerprint_store, str):
+            fingerprint_store = FingerprintStore(fingerprint_store)
+        self.fingerprints: Optional[FingerprintStore] = fingerprint_store or (_memory_store if skip_unchanged else None)
+
+        # how long series are reduced, see novem.vis.downsample
+        if downsample is not None and downsample not in METHODS:
+            raise ValueError(f"downsample must be one of {', '.join(METHODS)}")
+        self.downsample_options: Dict[str, Any] = {
+            "downsample": downsample,
+            "max_points": max_points,
+        }
+
+        # the plot type as last written or read, for the downsample budget
+        self._plot_type: Optional[str] = type
+
         # store pending updates when plot is frozen
         self._pending: Dict[str, str] = {}
+        # fingerprint of the pending /data, stored once run() uploads it
+        self._pending_fingerprint: Optional[str] = None
 
         self.colors = NovemColors(self)
         self.custom = NovemCustom(self)
@@ -102,23 +168,58 @@ class Plot(NovemVisAPI):
         """
         Set's the data of the plot
 
-        The parameter either needs to be a text string
-        of CSV formatted text or an object with a to_csv
-        function.
+        The parameter is either a text string of CSV
+        formatted text, a pandas, polars or pyarrow table,
+        a numpy array or an object with a to_csv function,
+        or an iterator or list of such chunks, which is streamed.
+        Serialization options (float_precision, date_format,
+        index, engine) and downsampling (downsample, max_points)
+        override the plot's options for this call.
+        Data identical to the last upload is skipped when the
+        plot has a fingerprint store.
         """
 
-        raw_str: str = ""
-        to_csv = getattr(data, "to_csv", None)
-
-        if callable(to_csv):
-            # if data has a callable csv funciton we'll
-            # assume it's a pandas dataframe
-            raw_str = data.to_csv()
-        else:
-            raw_str = str(data)
-
-        # invoke server write
-        self._write("/data", raw_str)
+        options = dict(self.csv_options)
+        sampling = dict(self.downsample_options)
+        for current in (options, sampling):
+            for key in current:
+                if key in kwargs:
+                    current[key] = kwargs.pop(key)
+
+        if is_chunked(data):
+            # the stream is only read while uploading, so there is
+            # nothing to hash or downsample, and the last upload is stale
+            # even when this one fails partway
+            if self.fingerprints:
+                self.fingerprints.forget(self._data_key())
+            self._write_stream("/data", stream_csv(data, **options))
+            self._parse_kwargs(**kwargs)
+            return self
+
+        method = sampling["downsample"]
+        if method:
+            sampling["max_points"] = sampling["max_points"] or max_points_for(self._known_type())
+
+        # hash the data itself when we can, it is cheaper than the csv
+        store = self.fingerprints
+        digest = fingerprint(data, {**options, **sampling}) if store else None
+        raw_str = None
+        if store and digest is None:
+            raw_str = self._serialize(data, options, sampling)
+            digest = fingerprint_csv(raw_str)
+
+        if not store or self._uploaded_fingerprint(store) != digest:
+            if raw_str is None:
+                raw_str = self._serialize(data, options, sampling)
+
+            # invoke server write
+            self._write("/data", raw_str)
+
+            # a frozen plot has only queued the data, run() stores it
+            if store and digest and self._freeze:
+                self._pending_fingerprint = digest
+            elif store and digest:
+                store.set(self._data_key(), digest)
 
         # also update our chart varibales
         self._parse_kwargs(**kwargs)
@@ -128,6 +229,24 @@ class Plot(NovemVisAPI):
         # would rather operate on the plot object itself
         return self
 
+    def _data_key(self) -> str:
+        return f"{self._api_root}vis/{self._vispath}/{self.id}"
+
+    def _uploaded_fingerprint(self, store: FingerprintStore) -> Optional[str]:
+        if self._freeze and "/data" in self._pending:
+            return self._pending_fingerprint
+        return store.get(self._data_key())
+
+    def _serialize(self, data: Any, options: Dict[str, Any], sampling: Dict[str, Any]) -> str:
+        if sampling["downsample"] and sampling["max_points"]:
+            data = downsample(data, sampling["downsample"], sampling["max_points"])
+        return to_csv(data, **options)
+
+    def _known_type(self) -> str:
+        if self._plot_type is None:
+            return self.type
+        return self._plot_type
+
     def __call__(self, data: Any, **kwargs: Any) -> Any:
         return self._set_data(data, **kwargs)
 
@@ -140,17 +259,27 @@ class Plot(NovemVisAPI):
 
     def _write(self, path: str, value: str) -> None:
         if self._freeze:
+            if path == "/data":
+                self._pending_fingerprint = None
             self._pending[path] = value
         else:
             self.api_write(path, value)
 
+    def _write_stream(self, path: str, chunks: Iterable[bytes]) -> None:
+        if self._freeze:
+            self._write(path, b"".join(chunks).decode("utf-8"))
+        else:
+            self.api_write_stream(path, chunks)
+
     # we'll implement generic properties common across all plots here
     @property
     def type(self) -> str:
-        return self._read("/config/type").strip()
+        self._plot_type = self._read("/config/type").strip()
+        return self._plot_type
 
     @type.setter
     def type(self, value: str) -> None:
+        self._plot_type = value
         return self._write("/config/type", value)
 
     @property
@@ -303,6 +432,11 @@ class Plot(NovemVisAPI):
         for path, value in self._pending.items():
             self.api_write(path, value)
 
+        # only now has the server got the data
+        if self.fingerprints and self._pending_fingerprint:
+            self.fingerprints.set(self._data_key(), self._pending_fingerprint)
+            self._pending_fingerprint = None
+
         self._freeze = False
 
     def __setattr__(self, name: str, value: Any) -> None:
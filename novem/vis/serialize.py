@@ -0,0 +1,338 @@
+"""CSV serialization of plot data.
+
+``Plot`` sends its data as CSV. :func:`to_csv` turns the common tabular
+types into that payload directly: pandas frames and series, polars frames,
+pyarrow tables and NumPy arrays. Strings pass through untouched, and any
+other object with a ``to_csv()`` method is asked to serialize itself.
+
+Pandas frames are written with ``DataFrame.to_csv`` by default.
+``engine="pyarrow"`` uses pyarrow's multithreaded CSV writer instead, which
+is several times faster on wide float frames but writes a different payload:
+headers and strings are quoted, the index header is ``""``, whole floats
+lose their ``.0`` and timestamps keep their fractional digits. Frames pyarrow
+cannot represent faithfully (MultiIndex or duplicate columns, timezone-aware
+datetimes) are still written by pandas.
+
+``float_precision`` rounds floats to that many decimals and ``date_format``
+is a strftime format for datetimes. Both shrink the payload compared to full
+precision. ``index`` controls whether a pandas index is written (it is by
+default, as with ``to_csv``).
+
+:func:`stream_csv` writes an iterable of chunks (e.g. ``read_csv(...,
+chunksize=...)``, a database cursor or batches of its rows) as a stream
+of CSV blocks, so a plot can be uploaded without holding the whole
+payload. The first pandas chunk decides the engine and the date format
+of the stream.
+"""
+
+import csv
+import io
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    # give type checkers the real modules so pd./np. attributes resolve
+    import numpy as np
+    import pandas as pd
+else:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+ENGINES = ("pandas", "pyarrow")
+
+
+def _module(data: Any) -> str:
+    return type(data).__module__.split(".")[0]
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore[import-untyped,import-not-found]
+        import pyarrow.compute  # type: ignore[import-untyped,import-not-found]  # noqa: F401
+        import pyarrow.csv  # type: ignore[import-untyped,import-not-found]  # noqa: F401
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def _require_pyarrow() -> Any:
+    pa = _pyarrow()
+    if pa is None:
+        raise ImportError("pyarrow is required for this functionality. Please install it using 'pip install pyarrow'.")
+    return pa
+
+
+def _arrow_csv(
+    pa: Any, table: Any, float_precision: Optional[int], date_format: Optional[str], header: bool = True
+) -> str:
+    """
+    Write an arrow table as CSV, with dates, booleans and rounding
+    formatted closer to what pandas writes
+    """
+    pc = pa.compute
+    columns = []
+    for column in table.columns:
+        kind = column.type
+        if pa.types.is_floating(kind) and float_precision is not None:
+            column = pc.round(column, ndigits=float_precision)
+        elif pa.types.is_timestamp(kind) or pa.types.is_date(kind):
+            column = _arrow_dates(pa, column, date_format)
+        elif pa.types.is_boolean(kind):
+            column = pc.if_else(column, "True", "False")
+        columns.append(column)
+    table = pa.table(columns, names=table.column_names)
+
+    sink = io.BytesIO()
+    pa.csv.write_csv(table, sink, write_options=pa.csv.WriteOptions(include_header=header, quoting_style="needed"))
+    return sink.getvalue().decode("utf-8")
+
+
+def _arrow_dates(pa: Any, column: Any, date_format: Optional[str]) -> Any:
+    """
+    Format a date or timestamp column. By default dates are written alone
+    when every value falls on midnight, and fractional seconds only when
+    there are any. With a date_format %S is whole seconds, as in pandas.
+    """
+    pc = pa.compute
+
+    def always(condition: Any) -> bool:
+        return pc.all(condition).as_py() in (True, None)
+
+    fmt = date_format
+    if pa.types.is_timestamp(column.type):
+        whole = pc.floor_temporal(column, unit="second")
+        if fmt is not None or always(pc.equal(whole, column)):
+            # %S prints the fraction the unit allows
+            column = whole.cast(pa.timestamp("s", tz=column.type.tz))
+        if fmt is None and not always(pc.equal(pc.floor_temporal(column, unit="day"), column)):
+            fmt = "%Y-%m-%d %H:%M:%S"
+    return pc.strftime(column, format=fmt or "%Y-%m-%d")
+
+
+def _frame_engine(frame: Any, engine: str) -> str:
+    """
+    The engine that writes a pandas frame, pandas for frames pyarrow
+    cannot represent faithfully
+    """
+    simple = (
+        not isinstance(frame.columns, pd.MultiIndex)
+        and frame.columns.is_unique
+        and not any(isinstance(t, pd.DatetimeTZDtype) for t in frame.dtypes)
+    )
+    return engine if simple else "pandas"
+
+
+def _pandas_csv(
+    data: Any,
+    float_precision: Optional[int],
+    date_format: Optional[str],
+    index: Optional[bool],
+    engine: str,
+    header: bool,
+) -> str:
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    write_index = True if index is None else index
+
+    if _frame_engine(frame, engine) == "pyarrow":
+        pa = _require_pyarrow()
+        flat = frame
+        if write_index:
+            names = [name if name is not None else "" for name in frame.index.names]
+            flat = frame.reset_index(names=names if len(names) > 1 else names[0])
+        table = pa.Table.from_pandas(flat, preserve_index=False)
+        return _arrow_csv(pa, table, float_precision, date_format, header)
+
+    return frame.to_csv(
+        index=write_index,
+        header=header,
+        float_format=f"%.{float_precision}f" if float_precision is not None else None,
+        date_format=date_format,
+    )
+
+
+def _numpy_csv(data: Any, float_precision: Optional[int], header: bool) -> str:
+    values = data.reshape(-1, 1) if data.ndim == 1 else data
+    if values.ndim != 2:
+        raise ValueError(f"only 1 and 2 dimensional arrays can be written as CSV, not {values.ndim}")
+    fmt = f"%.{float_precision}f" if float_precision is not None and values.dtype.kind == "f" else "%s"
+    out = io.StringIO()
+    names = ",".join(map(str, range(values.shape[1]))) if header else ""
+    np.savetxt(out, values, fmt=fmt, delimiter=",", header=names, comments="")
+    return out.getvalue()
+
+
+def to_csv(
+    data: Any,
+    float_precision: Optional[int] = None,
+    date_format: Optional[str] = None,
+    index: Optional[bool] = None,
+    engine: str = "pandas",
+    header: bool = True,
+) -> str:
+    """
+    Serialize plot data as CSV, see the module docstring
+
+    :data pandas DataFrame/Series, polars DataFrame, pyarrow Table, NumPy
+        array, CSV string or any object with a to_csv() method
+    :float_precision decimals to round floats to, full precision if None
+    :date_format strftime format for datetimes
+    :index write the pandas index (default True)
+    :engine "pandas" writes pandas frames with DataFrame.to_csv, "pyarrow"
+        with pyarrow's faster writer, see the module docstring
+    :header write the column names, strings are passed through regardless
+
+    A list of rows (lists or tuples) is written with the csv module. Other
+    containers raise a TypeError, pass them as a frame or with stream_csv.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+
+    if isinstance(data, str):
+        return data
+
+    if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
+        return _pandas_csv(data, float_precision, date_format, index, engine, header)
+
+    if _module(data) == "polars" and hasattr(data, "write_csv"):
+        return data.write_csv(include_header=header, float_precision=float_precision, datetime_format=date_format)
+
+    if _module(data) == "pyarrow" and hasattr(data, "column_names"):
+        return _arrow_csv(_require_pyarrow(), data, float_precision, date_format, header)
+
+    if np is not None and isinstance(data, np.ndarray):
+        return _numpy_csv(data, float_precision, header)
+
+    to_csv = getattr(data, "to_csv", None)
+    if callable(to_csv):
+        # anything else that knows how to write itself
+        out = str(to_csv())
+        return out if header else out.partition("\n")[2]
+
+    if _is_rows(data):
+        # e.g. the rows of cursor.fetchall()
+        return _rows_csv(data)
+
+    if isinstance(data, (list, tuple, set, dict)):
+        raise TypeError(f"cannot write a {type(data).__name__} of {_item_types(data)} as plot data")
+
+    return str(data)
+
+
+def _is_rows(data: Any) -> bool:
+    return isinstance(data, (list, tuple)) and all(isinstance(row, (list, tuple)) for row in data)
+
+
+def _item_types(data: Any) -> str:
+    return ", ".join(sorted({type(item).__name__ for item in data})) or "nothing"
+
+
+def _rows_csv(rows: Iterable[Any]) -> str:
+    out = io.StringIO()
+    csv.writer(out, lineterminator="\n").writerows(rows)
+    return out.getvalue()
+
+
+def is_chunked(data: Any) -> bool:
+    """
+    Whether plot data is a stream of chunks rather than one table: an
+    iterator, or a list of frames or of row batches
+    """
+    if isinstance(data, Iterator):
+        return True
+    if not isinstance(data, (list, tuple)) or not data:
+        return False
+    if pd is not None and all(isinstance(item, (pd.DataFrame, pd.Series)) for item in data):
+        return True
+    return all(_is_rows(item) for item in data)
+
+
+def _stream_date_format(frame: Any, index: Optional[bool], engine: str) -> Optional[str]:
+    """
+    A date format for every chunk of a stream, from its first frame
+
+    Pandas picks dates alone or dates with times per column and per call,
+    so chunks written with no format could mix both in one column. A
+    stream always writes the time, as a later chunk may have one, and
+    fractional seconds when the first chunk has any. Frames with
+    timezone-aware datetimes are left alone, pandas always writes those
+    in full.
+    """
+    frame = frame.to_frame() if isinstance(frame, pd.Series) else frame
+    columns = [column for _, column in frame.items() if pd.api.types.is_datetime64_any_dtype(column.dtype)]
+    if (True if index is None else index) and isinstance(frame.index, pd.DatetimeIndex):
+        columns.append(frame.index.to_series())
+    if not columns or any(isinstance(column.dtype, pd.DatetimeTZDtype) for column in columns):
+        return None
+
+    values = pd.concat([column.dropna() for column in columns], ignore_index=True)
+    if engine == "pyarrow" or (values == values.dt.floor("s")).all():
+        return "%Y-%m-%d %H:%M:%S"
+    return "%Y-%m-%d %H:%M:%S.%f"
+
+
+def _chunk_csv(chunk: Any, header: bool, options: Dict[str, Any]) -> str:
+    if isinstance(chunk, bytes):
+        return chunk.decode("utf-8")
+    if isinstance(chunk, (list, tuple)):
+        # a batch of rows from cursor.fetchmany(), or the single row that
+        # iterating a cursor yields
+        return _rows_csv(chunk if _is_rows(chunk) else [chunk])
+    return to_csv(chunk, header=header, **options)
+
+
+def stream_csv(
+    chunks: Iterable[Any],
+    float_precision: Optional[int] = None,
+    date_format: Optional[str] = None,
+    index: Optional[bool] = None,
+    engine: str = "pandas",
+    block_size: int = 1 << 20,
+) -> Iterator[bytes]:
+    """
+    Serialize chunks of plot data as a stream of utf-8 CSV blocks
+
+    :chunks frames or anything else to_csv takes, written with the header
+        of the first one only; CSV strings and bytes, passed through as is;
+        or lists of rows and single rows, as a DB-API cursor gives them,
+        written with the csv module
+    :block_size bytes to gather before yielding, small chunks are joined so
+        a request body is not sent a row at a time
+
+    The remaining options are as for to_csv. Only one chunk and one block
+    are held at a time. The first pandas chunk fixes the engine and, when
+    date_format is None, the date format for the rest; a later chunk that
+    needs another engine raises a ValueError.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {', '.join(ENGINES)}")
+    options = {"float_precision": float_precision, "date_format": date_format, "index": index, "engine": engine}
+
+    pending: List[bytes] = []
+    size = 0
+    chosen: Optional[str] = None
+    for n, chunk in enumerate(chunks):
+        if pd is not None and isinstance(chunk, (pd.DataFrame, pd.Series)):
+            frame = chunk.to_frame() if isinstance(chunk, pd.Series) else chunk
+            if chosen is None:
+                chosen = _frame_engine(frame, engine)
+                options["engine"] = chosen
+                if date_format is None:
+                    options["date_format"] = _stream_date_format(frame, index, chosen)
+            elif _frame_engine(frame, engine) != chosen:
+                raise ValueError(f"chunk {n} cannot be written with the {chosen} engine like the first chunk")
+        block = _chunk_csv(chunk, n == 0, options).encode("utf-8")
+        pending.append(block)
+        size += len(block)
+        if size >= block_size:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+__all__ = ["is_chunked", "stream_csv", "to_csv"]
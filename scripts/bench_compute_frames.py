@@ -0,0 +1,149 @@
+"""Micro-benchmark for the compute frame hot path.
+
+Measures MB/s through ``Channel.send`` (splitting a payload into frames) and
+through ``ComputeConnection._read_loop`` (dispatching inbound frames to their
+channel), with the socket replaced by an in-memory stand-in so only the
+client's own framing cost is timed. The previous per-frame base64 codec is
+timed alongside for comparison.
+
+    uv run python scripts/bench_compute_frames.py [--mb 256] [--frame 65536]
+"""
+
+import argparse
+import asyncio
+import base64
+import secrets
+import time
+
+import aiohttp
+
+from novem.code.compute import BINARY_HEADER, STREAM_STDOUT, Channel, ComputeConnection, Hello
+
+
+def _channel_id() -> str:
+    return base64.urlsafe_b64encode(secrets.token_bytes(16)).decode().rstrip("=")
+
+
+class _NullSocket:
+    """Counts what would be sent, and replays prepared inbound frames."""
+
+    close_code = 1000
+
+    def __init__(self, inbound=()):
+        self.sent = 0
+        self._inbound = list(inbound)
+
+    async def send_bytes(self, frame):
+        self.sent += len(frame)
+
+    def __aiter__(self):
+        return self._replay()
+
+    async def _replay(self):
+        for data in self._inbound:
+            yield aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, data, None)
+
+
+def _connection(frame_size, inbound=()):
+    conn = ComputeConnection("ws://unused/ws-cu", "nut-bench")
+    conn.hello = Hello("novem.compute.v1", 16, frame_size, 30)
+    conn.max_data_bytes = frame_size
+    conn._receive_max_data_bytes = frame_size
+    conn._ws = _NullSocket(inbound)
+    return conn
+
+
+def _rate(nbytes, seconds):
+    return nbytes / (1024 * 1024) / seconds if seconds else float("inf")
+
+
+async def bench_send(total, frame_size):
+    conn = _connection(frame_size)
+    channel = Channel(conn, _channel_id(), "exec")
+    payload = secrets.token_bytes(min(total, 16 * 1024 * 1024))
+    t0 = time.perf_counter()
+    sent = 0
+    while sent < total:
+        await channel.send(payload)
+        sent += len(payload)
+    return _rate(sent, time.perf_counter() - t0)
+
+
+async def bench_send_legacy(total, frame_size):
+    """The previous path: slice to bytes and base64-decode the id per frame."""
+    channel = _channel_id()
+    payload = secrets.token_bytes(min(total, 16 * 1024 * 1024))
+    t0 = time.perf_counter()
+    sent = 0
+    while sent < total:
+        for i in range(0, len(payload), frame_size):
+            frame = bytes([0]) + base64.urlsafe_b64decode(channel + "==") + payload[i : i + frame_size]
+            sent += len(frame) - BINARY_HEADER
+    return _rate(sent, time.perf_counter() - t0)
+
+
+async def bench_read(total, frame_size):
+    channel_id = _channel_id()
+    frame = bytes([STREAM_STDOUT]) + base64.urlsafe_b64decode(channel_id + "==") + secrets.token_bytes(frame_size)
+    conn = _connection(frame_size, [frame] * max(1, total // frame_size))
+    channel = Channel(conn, channel_id, "exec")
+    conn._channels[channel.key] = channel
+    received = 0
+
+    def feed(stream, data):
+        nonlocal received
+        received += len(data)
+
+    channel._feed = feed  # type: ignore[method-assign]
+    t0 = time.perf_counter()
+    await conn._read_loop()
+    elapsed = time.perf_counter() - t0
+    channel._exit.exception()  # the replay ends by "losing" the connection
+    return _rate(received, elapsed)
+
+
+def _dispatch(total, frame_size, key_of):
+    channel_id = _channel_id()
+    frame = bytes([STREAM_STDOUT]) + base64.urlsafe_b64decode(channel_id + "==") + secrets.token_bytes(frame_size)
+    channels = {key_of(frame): object()}
+    received = 0
+    t0 = time.perf_counter()
+    for _ in range(max(1, total // frame_size)):
+        if channels.get(key_of(frame)) is not None:
+            received += len(frame[BINARY_HEADER:])
+    return _rate(received, time.perf_counter() - t0)
+
+
+async def bench_dispatch(total, frame_size):
+    """Channel lookup alone: by the raw id the frame carries."""
+    return _dispatch(total, frame_size, lambda frame: frame[1:BINARY_HEADER])
+
+
+async def bench_dispatch_legacy(total, frame_size):
+    """Channel lookup alone, the previous way: base64-encode every frame's id."""
+    return _dispatch(
+        total,
+        frame_size,
+        lambda frame: base64.urlsafe_b64encode(frame[1:BINARY_HEADER]).decode("ascii").rstrip("="),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=256, help="data to push through each path (default: 256)")
+    parser.add_argument("--frame", type=int, default=64 * 1024, help="payload bytes per frame (default: 65536)")
+    opts = parser.parse_args()
+    total = opts.mb * 1024 * 1024
+
+    for label, bench in [
+        ("send", bench_send),
+        ("send (per-frame base64)", bench_send_legacy),
+        ("read loop", bench_read),
+        ("dispatch", bench_dispatch),
+        ("dispatch (per-frame base64)", bench_dispatch_legacy),
+    ]:
+        print(f"{label:<28} {asyncio.run(bench(total, opts.frame)):>10.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
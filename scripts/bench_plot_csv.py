@@ -0,0 +1,46 @@
+"""Benchmark for serializing plot data as CSV.
+
+Times ``DataFrame.to_csv`` against ``novem.vis.serialize.to_csv`` on a wide
+float frame with a datetime index, with each engine and with and without
+rounding, and reports seconds and payload size. The pyarrow rows are
+skipped when pyarrow is not installed.
+
+    uv run python scripts/bench_plot_csv.py [--rows 1000000] [--cols 10] [--precision 4]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from novem.vis.serialize import _pyarrow, to_csv
+
+
+def _time(label, fn):
+    t0 = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<36} {elapsed:>8.2f} s {len(out) / 1024 / 1024:>10.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows in the frame (default: 1000000)")
+    parser.add_argument("--cols", type=int, default=10, help="float columns in the frame (default: 10)")
+    parser.add_argument("--precision", type=int, default=4, help="decimals when rounding (default: 4)")
+    opts = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=opts.rows, freq="s", name="time")
+    df = pd.DataFrame(rng.normal(size=(opts.rows, opts.cols)), index=index, columns=[f"c{i}" for i in range(opts.cols)])
+
+    engines = ["pandas"] + (["pyarrow"] if _pyarrow() is not None else [])
+    _time("DataFrame.to_csv()", df.to_csv)
+    for engine in engines:
+        _time(f"to_csv engine={engine}", lambda: to_csv(df, engine=engine))
+        _time(f"to_csv engine={engine} precision={opts.precision}", lambda: to_csv(df, opts.precision, engine=engine))
+
+
+if __name__ == "__main__":
+    main()
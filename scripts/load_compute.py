@@ -0,0 +1,38 @@
+"""Load test for the compute client against the in-process fake server.
+
+Opens ``--channels`` exec channels over one connection, ``--concurrency`` at
+a time, each producing ``--bytes`` of output, and reports channels per
+second, MB/s and admission latency percentiles. ``--admission-delay`` makes
+the fake server wait before admitting each channel.
+
+Run it as a module from the repository root, where the fake server lives
+in the test tree:
+
+    uv run python -m scripts.load_compute [--channels 2000] [--concurrency 64] [--bytes 65536]
+"""
+
+import argparse
+import asyncio
+
+from tests.fake_compute import FakeComputeServer, load_test
+
+
+async def run(opts):
+    async with FakeComputeServer(max_channels=opts.max_channels, admission_delay=opts.admission_delay) as server:
+        return await load_test(server.url, opts.channels, opts.concurrency, opts.bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=2000, help="channels to open in total (default: 2000)")
+    parser.add_argument("--concurrency", type=int, default=64, help="channels open at once (default: 64)")
+    parser.add_argument("--bytes", type=int, default=64 * 1024, help="output per channel (default: 65536)")
+    parser.add_argument("--max-channels", type=int, default=64, help="server channel limit (default: 64)")
+    parser.add_argument("--admission-delay", type=float, default=0.0, help="server admission delay in seconds")
+    opts = parser.parse_args()
+
+    print(asyncio.run(run(opts)).summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+"""An in-process ``novem.compute.v1`` server for tests and benchmarks.
+
+Exercising the compute client otherwise needs a live computer. This fake
+speaks the public protocol over a real local WebSocket, so the aiohttp
+transport, the frame codec and message dispatch all run unmocked:
+
+    async with FakeComputeServer() as server:
+        async with ComputeConnection(server.url, "nut-test") as conn:
+            ch = await conn.open_exec(server.target, "echo", ["hello"])
+
+Exec channels run scripted commands rather than processes: ``echo ARGS``,
+``cat`` (stdin to stdout), ``yes BYTES`` (that much output), ``sleep
+SECONDS``, ``exit CODE``, ``true`` and ``false``, plus anything passed in
+``commands``. Shell mode splits the command line the same way. PTY and
+``tcp`` channels echo their input back. The server pings every
+``heartbeat_seconds``, can delay admission, turn away handshakes
+(:meth:`reject_next`) and end every session with a chosen close code
+(:meth:`close_all`).
+
+:func:`load_test` drives many concurrent channels through one connection and
+reports channels per second, throughput and admission latency percentiles;
+``python -m scripts.load_compute`` runs it from the command line.
+"""
+
+import asyncio
+import base64
+import json
+import math
+import secrets
+import shlex
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from novem.code.compute import (
+    MAX_DATA_BYTES,
+    PATH,
+    PROTOCOL,
+    STREAM_DATA,
+    STREAM_STDERR,
+    STREAM_STDOUT,
+    ComputeConnection,
+    decode_frame,
+    encode_frame,
+)
+
+FAKE_TARGET = "/v1/users/fake/code/computers/box"
+
+
+def _web() -> Any:
+    ComputeConnection._aiohttp()  # the same install hint when aiohttp is missing
+    from aiohttp import web
+
+    return web
+
+
+class FakeProcess:
+    """What a scripted command sees: its arguments, stdin and output."""
+
+    def __init__(self, session: "_Session", channel: str, kind: str, args: List[str]) -> None:
+        self.channel = channel
+        self.kind = kind
+        self.args = args
+        self.stdin: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()  # None at EOF
+        self._session = session
+
+    async def read(self) -> bytes:
+        """The next chunk of stdin, or ``b""`` once it is closed."""
+        data = await self.stdin.get()
+        return data or b""
+
+    async def write(self, data: bytes, stream: int = STREAM_STDOUT) -> None:
+        """Send output, split into frames of the negotiated size."""
+        size = self._session.server.max_data_bytes
+        for i in range(0, len(data), size):
+            await self._session.send_bytes(encode_frame(self.channel, data[i : i + size], stream))
+
+
+Command = Callable[[FakeProcess], Awaitable[int]]
+
+
+async def _echo(proc: FakeProcess) -> int:
+    await proc.write((" ".join(proc.args) + "\n").encode())
+    return 0
+
+
+async def _cat(proc: FakeProcess) -> int:
+    while data := await proc.read():
+        await proc.write(data, STREAM_DATA if proc.kind != "exec" else STREAM_STDOUT)
+    return 0
+
+
+async def _yes(proc: FakeProcess) -> int:
+    remaining = int(proc.args[0]) if proc.args else 0
+    block = b"y\n" * (proc._session.server.max_data_bytes // 2)
+    while remaining > 0:
+        chunk = block[:remaining]
+        await proc.write(chunk)
+        remaining -= len(chunk)
+    return 0
+
+
+async def _sleep(proc: FakeProcess) -> int:
+    await asyncio.sleep(float(proc.args[0]) if proc.args else 0.0)
+    return 0
+
+
+async def _exit(proc: FakeProcess) -> int:
+    return int(proc.args[0]) if proc.args else 0
+
+
+async def _true(proc: FakeProcess) -> int:
+    return 0
+
+
+async def _false(proc: FakeProcess) -> int:
+    return 1
+
+
+BUILTIN_COMMANDS: Dict[str, Command] = {
+    "echo": _echo,
+    "cat": _cat,
+    "yes": _yes,
+    "sleep": _sleep,
+    "exit": _exit,
+    "true": _true,
+    "false": _false,
+}
+
+
+class _Session:
+    """One client connection to the fake server."""
+
+    def __init__(self, server: "FakeComputeServer", ws: Any) -> None:
+        self.server = server
+        self.ws = ws
+        self.procs: Dict[str, Tuple[FakeProcess, "asyncio.Task[None]"]] = {}
+        self.pending = 0
+
+    async def send_bytes(self, frame: bytes) -> None:
+        self.server.frames_sent += 1
+        self.server.bytes_sent += len(frame)
+        await self.ws.send_bytes(frame)
+
+    async def send_json(self, message: Dict[str, Any]) -> None:
+        await self.ws.send_str(json.dumps(message))
+
+    async def violation(self) -> None:
+        await self.ws.close(code=1008)
+
+    async def on_text(self, msg: Dict[str, Any]) -> None:
+        kind = msg.get("type")
+        if kind == "open":
+            asyncio.ensure_future(self.admit(msg))
+            return
+        entry = self.procs.get(msg.get("channel", ""))
+        if kind not in ("stdin_eof", "signal", "resize", "close"):
+            await self.violation()
+        elif entry is None:
+            return  # the channel already ended
+        elif kind == "stdin_eof":
+            entry[0].stdin.put_nowait(None)
+        elif kind == "signal":
+            self.finish(entry[0].channel)
+            entry[1].cancel()
+            await self.send_json({"type": "exit", "channel": entry[0].channel, "code": -1, "signal": msg["signal"]})
+        elif kind == "close":
+            self.finish(entry[0].channel)
+            entry[1].cancel()
+
+    def on_binary(self, data: bytes) -> None:
+        _, channel, payload = decode_frame(data)
+        self.server.frames_received += 1
+        self.server.bytes_received += len(data)
+        entry = self.procs.get(channel)
+        if entry is not None:
+            entry[0].stdin.put_nowait(payload)
+
+    async def admit(self, msg: Dict[str, Any]) -> None:
+        request_id = msg.get("request_id", "")
+        server = self.server
+
+        async def deny(code: str, message: str) -> None:
+            await self.send_json({"type": "error", "request_id": request_id, "code": code, "message": message})
+
+        if len(self.procs) + self.pending >= server.max_channels:
+            await deny("limit_exceeded", "too many channels")
+            return
+        kind = msg.get("kind")
+        if kind == "exec":
+            if msg.get("mode") == "shell":
+                words = shlex.split(msg.get("command", ""))
+                name, args = (words[0], words[1:]) if words else ("", [])
+            else:
+                name, args = msg.get("command", ""), list(msg.get("args", []))
+            command = server.commands.get(name.rsplit("/", 1)[-1])
+            if command is None:
+                await deny("process_start_failed", f"{name}: command not found")
+                return
+        elif kind in ("pty", "tcp"):
+            command, args = _cat, []
+        else:
+            await deny("invalid_request", f"unknown channel kind {kind!r}")
+            return
+
+        self.pending += 1
+        try:
+            if server.admission_delay:
+                await asyncio.sleep(server.admission_delay)
+        finally:
+            self.pending -= 1
+        channel = base64.urlsafe_b64encode(secrets.token_bytes(16)).decode().rstrip("=")
+        proc = FakeProcess(self, channel, kind, args)
+        task = asyncio.ensure_future(self.run(proc, command))
+        self.procs[channel] = (proc, task)
+        server.opened += 1
+        await self.send_json({"type": "ready", "request_id": request_id, "channel": channel, "kind": kind})
+
+    async def run(self, proc: FakeProcess, command: Command) -> None:
+        await asyncio.sleep(0)  # let ready go out first
+        try:
+            code = await command(proc)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            await proc.write(f"{e}\n".encode(), STREAM_STDERR)
+            code = 1
+        if self.finish(proc.channel):
+            if proc.kind == "tcp":
+                await self.send_json({"type": "closed", "channel": proc.channel})
+            else:
+                await self.send_json({"type": "exit", "channel": proc.channel, "code": code, "signal": None})
+
+    def finish(self, channel: str) -> bool:
+        return self.procs.pop(channel, None) is not None
+
+    def stop(self) -> None:
+        for _, task in self.procs.values():
+            task.cancel()
+        self.procs.clear()
+
+
+class FakeComputeServer:
+    """A local ``novem.compute.v1`` endpoint; see the module docstring.
+
+    Counters (``connections``, ``opened``, and frames and bytes each way)
+    cover the server's whole life.
+    """
+
+    def __init__(
+        self,
+        max_channels: int = 16,
+        max_data_bytes: int = MAX_DATA_BYTES,
+        heartbeat_seconds: int = 30,
+        admission_delay: float = 0.0,
+        commands: Optional[Dict[str, Command]] = None,
+    ) -> None:
+        self.max_channels = max_channels
+        self.max_data_bytes = max_data_bytes
+        self.heartbeat_seconds = heartbeat_seconds
+        self.admission_delay = admission_delay
+        self.commands = {**BUILTIN_COMMANDS, **(commands or {})}
+        self.target = FAKE_TARGET
+        self.connections = 0
+        self.opened = 0  # channels admitted
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.frames_received = 0
+        self.bytes_received = 0
+        self._rejections: List[Tuple[int, Optional[float]]] = []
+        self._sessions: List[_Session] = []
+        self._runner: Any = None
+        self.url = ""
+
+    async def __aenter__(self) -> "FakeComputeServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Listen on a free port on 127.0.0.1; ``url`` is set once it is up."""
+        web = _web()
+        app = web.Application()
+        app.router.add_get(PATH, self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"ws://127.0.0.1:{self._runner.addresses[0][1]}{PATH}"
+
+    async def stop(self) -> None:
+        await self.close_all(1001)
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reject_next(self, status: int, retry_after: Optional[float] = None) -> None:
+        """Turn away the next handshake with an HTTP ``status``."""
+        self._rejections.append((status, retry_after))
+
+    async def close_all(self, code: int = 1001) -> None:
+        """End every open session with a WebSocket close ``code``."""
+        sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.stop()
+            await session.ws.close(code=code)
+
+    async def _handler(self, request: Any) -> Any:
+        web = _web()
+        self.connections += 1
+        if self._rejections:
+            status, retry_after = self._rejections.pop(0)
+            headers = {"Retry-After": f"{retry_after:g}"} if retry_after is not None else {}
+            return web.Response(status=status, headers=headers)
+
+        ws = web.WebSocketResponse(protocols=(PROTOCOL,), max_msg_size=self.max_data_bytes + 4096)
+        await ws.prepare(request)
+        session = _Session(self, ws)
+        self._sessions.append(session)
+        await session.send_json(
+            {
+                "type": "hello",
+                "protocol": PROTOCOL,
+                "max_channels": self.max_channels,
+                "max_data_bytes": self.max_data_bytes,
+                "heartbeat_seconds": self.heartbeat_seconds,
+            }
+        )
+        heartbeat = asyncio.ensure_future(self._heartbeat(ws))
+        aiohttp = ComputeConnection._aiohttp()
+        try:
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    await session.on_text(json.loads(msg.data))
+                elif msg.type == aiohttp.WSMsgType.BINARY:
+                    session.on_binary(msg.data)
+        finally:
+            heartbeat.cancel()
+            session.stop()
+            if session in self._sessions:
+                self._sessions.remove(session)
+        return ws
+
+    async def _heartbeat(self, ws: Any) -> None:
+        while not ws.closed:
+            await asyncio.sleep(self.heartbeat_seconds)
+            await ws.ping()
+
+
+# ── load testing ──────────────────────────────────────────────────────────
+
+
+@dataclass
+class LoadReport:
+    """What :func:`load_test` measured."""
+
+    channels: int
+    concurrency: int
+    seconds: float
+    bytes: int  # output received across all channels
+    admission: List[float] = field(default_factory=list)  # seconds, sorted
+    failed: int = 0
+
+    @property
+    def channels_per_second(self) -> float:
+        return self.channels / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds > 0 else 0.0
+
+    def percentile(self, p: float) -> float:
+        """The admission latency at percentile ``p`` (0-100), in seconds."""
+        if not self.admission:
+            return 0.0
+        index = max(0, math.ceil(p / 100 * len(self.admission)) - 1)
+        return self.admission[index]
+
+    def summary(self) -> str:
+        return (
+            f"{self.channels} channels ({self.failed} failed), {self.concurrency} at once, in {self.seconds:.2f}s: "
+            f"{self.channels_per_second:.0f} channels/s, {self.mb_per_second:.1f} MB/s, admission "
+            f"p50 {self.percentile(50) * 1000:.2f} ms, p99 {self.percentile(99) * 1000:.2f} ms"
+        )
+
+
+async def load_test(
+    url: str,
+    channels: int = 1000,
+    concurrency: int = 64,
+    output_bytes: int = 0,
+    token: str = "nut-load",
+    target: str = FAKE_TARGET,
+) -> LoadReport:
+    """Run ``channels`` exec channels over one connection, ``concurrency`` at a time.
+
+    Each channel runs ``yes output_bytes`` and drains its output. Concurrency
+    is capped by the server's ``max_channels``. Admission latency is each
+    channel's open-to-ready time.
+    """
+    if channels < 1 or concurrency < 1:
+        raise ValueError("channels and concurrency must be at least 1")
+    async with ComputeConnection(url, token) as conn:
+        assert conn.hello is not None
+        limit = min(concurrency, conn.hello.max_channels)
+        slots = asyncio.Semaphore(limit)
+        report = LoadReport(channels=channels, concurrency=limit, seconds=0.0, bytes=0)
+
+        async def one() -> None:
+            async with slots:
+                ch = await conn.open_exec(target, "yes", [str(output_bytes)])
+                async for _, data in ch:
+                    report.bytes += len(data)
+                code, _ = await ch.wait()
+                if code != 0:
+                    report.failed += 1
+                if ch.stats.admission_seconds is not None:
+                    report.admission.append(ch.stats.admission_seconds)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(channels)))
+        report.seconds = time.perf_counter() - started
+        report.admission.sort()
+        return report
+
+
+__all__ = [
+    "FAKE_TARGET",
+    "BUILTIN_COMMANDS",
+    "FakeProcess",
+    "FakeComputeServer",
+    "LoadReport",
+    "load_test",
+]
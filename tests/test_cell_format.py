@@ -1,7 +1,10 @@
 import configparser
 import os
+import threading
 from functools import partial
 
+from requests.adapters import HTTPAdapter
+
 from novem import Plot
 
 # test novem colors
@@ -99,3 +102,117 @@ def test_color_assign(requests_mock):
 
     p.run()
     assert test_values == ts
+
+
+def test_cell_batch(requests_mock):
+    plot_id = "test_plot"
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    api_root = config["general"]["api_root"]
+
+    requests_mock.register_uri("put", f"{api_root}vis/plots/{plot_id}", text="")
+
+    remote = {"align": ": : <", "format": ""}
+    calls = []
+
+    threads = set()
+
+    def post_value(leaf, request, context):
+        calls.append(("post", leaf))
+        threads.add(threading.get_ident())
+        remote[leaf] = request.body.decode("utf-8")
+
+    def get_value(leaf, request, context):
+        calls.append(("get", leaf))
+        return remote.get(leaf, "")
+
+    for leaf in ["align", "format", "border"]:
+        url = f"{api_root}vis/plots/{plot_id}/config/table/cell/{leaf}"
+        requests_mock.register_uri("get", url, text=partial(get_value, leaf))
+        requests_mock.register_uri("post", url, text=partial(post_value, leaf))
+
+    p = Plot(plot_id, config_path=config_file)
+    adapter = p._session.get_adapter(api_root)
+
+    with p.cell.batch() as cell:
+        for i in range(200):
+            cell.align += f"{i % 3 + 1} : >"
+        cell.align += ": : <"
+        cell.format += "1 : ,.1%\n2 : ,.0f"
+        cell.border = ": 0 l 1 gray-300"
+        cell.border += ": 1 r 1 gray-300"
+        assert calls == []
+
+    # appended leaves are read once, every leaf is written once
+    assert sorted(calls) == [
+        ("get", "align"),
+        ("get", "format"),
+        ("post", "align"),
+        ("post", "border"),
+        ("post", "format"),
+    ]
+    # repeats keep their last position
+    assert remote["align"] == "3 : >\n1 : >\n2 : >\n: : <"
+    assert remote["format"] == "1 : ,.1%\n2 : ,.0f"
+    assert remote["border"] == ": 0 l 1 gray-300\n: 1 r 1 gray-300"
+
+    # a failing block writes nothing
+    calls.clear()
+    try:
+        with p.cell.batch() as cell:
+            cell.align = ": : -"
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert calls == []
+    assert remote["align"] == "3 : >\n1 : >\n2 : >\n: : <"
+
+    # the session is left as it was
+    assert p._session.get_adapter(api_root) is adapter
+
+    # the writes stay within the connections the session keeps
+    p._session.mount(api_root, HTTPAdapter(pool_maxsize=1))
+    threads.clear()
+    with p.cell.batch() as cell:
+        cell.align = ": : >"
+        cell.format = ": : ,.0f"
+    assert threads == {threading.get_ident()}
+
+
+def test_cell_batch_frozen(requests_mock):
+    plot_id = "test_plot"
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    api_root = config["general"]["api_root"]
+
+    requests_mock.register_uri("put", f"{api_root}vis/plots/{plot_id}", text="")
+    posted = []
+    for leaf in ["align", "format", "border"]:
+        url = f"{api_root}vis/plots/{plot_id}/config/table/cell/{leaf}"
+        requests_mock.register_uri("get", url, text=": : <")
+        requests_mock.register_uri("post", url, text=lambda request, context: posted.append(request.text) or "")
+
+    p = Plot(plot_id, config_path=config_file)
+    p.freeze()
+    p.cell.format = "1 : ,.0f"
+
+    # queued in order on this thread, appends read what is already queued
+    with p.cell.batch() as cell:
+        cell.align += ": : >"
+        cell.format += "2 : ,.1%"
+        cell.border = ": 0 l 1 gray-300"
+    assert posted == []
+    assert p._pending == {
+        "/config/table/cell/format": "1 : ,.0f\n2 : ,.1%",
+        "/config/table/cell/align": ": : <\n: : >",
+        "/config/table/cell/border": ": 0 l 1 gray-300",
+    }
+
+    p.run()
+    assert sorted(posted) == ["1 : ,.0f\n2 : ,.1%", ": 0 l 1 gray-300", ": : <\n: : >"]
@@ -5,6 +5,7 @@ Listing goes through GraphQL (mocked at the /gql endpoint); everything else
 is REST against code/{collection}/{id} (mocked with requests_mock).
 """
 
+import json
 import sys
 from functools import partial
 
@@ -835,6 +836,33 @@ def test_computer_run_without_argv_explains_itself(cli, requests_mock, fs):
         assert "-R -- ls -la" in err
 
 
+def test_computer_run_stats_are_printed_to_stderr(cli, requests_mock, fs, monkeypatch):
+    from novem.code import SessionStats
+    from novem.code.compute import ChannelStats, ConnectionStats
+
+    write_config(auth_req)
+    requests_mock.register_uri("put", f"{api_root}code/computers/my-box", status_code=201)
+
+    def fake_stream(self, argv, **kwargs):
+        self.last_stats = SessionStats(
+            ConnectionStats(handshake_seconds=0.04, hello_seconds=0.002, rtt_seconds=0.012, pings=1),
+            ChannelStats(admission_seconds=0.02, bytes_received=3 * 1024 * 1024, frames_received=48),
+        )
+        return (0, None)
+
+    monkeypatch.setattr("novem.code.Computer.stream", fake_stream)
+
+    try:
+        cli("-c", "my-box", "-R", "--stats", "--", "cat", "big")
+        assert False, "should exit"
+    except CliExit as e:
+        out, err = e.args
+        assert e.code == 0
+        assert out == ""
+        assert "connect 42.0 ms (upgrade 40.0 ms, hello 2.0 ms), rtt 12.0 ms" in err
+        assert "channel ready in 20.0 ms; sent 0 B in 0 frames, received 3.0 MiB in 48 frames" in err
+
+
 def test_computer_attach_calls_shell(cli, requests_mock, fs, monkeypatch):
     write_config(auth_req)
     requests_mock.register_uri("put", f"{api_root}code/computers/my-box", status_code=201)
@@ -913,6 +941,54 @@ def test_attach_and_run_are_mutually_exclusive(cli, requests_mock, fs):
         assert "cannot be combined" in err
 
 
+def test_computer_forward_parses_ssh_style_specs(cli, requests_mock, fs, monkeypatch):
+    write_config(auth_req)
+    requests_mock.register_uri("put", f"{api_root}code/computers/my-box", status_code=201)
+    opened = []
+
+    class FakeForward:
+        def __init__(self, port):
+            self.port = port
+            self.closed = False
+
+        def wait(self):
+            raise KeyboardInterrupt
+
+        def close(self):
+            self.closed = True
+
+    def fake_forward(self, local_port, remote_host, remote_port, **kwargs):
+        opened.append((kwargs["local_host"], local_port, remote_host, remote_port, FakeForward(local_port)))
+        return opened[-1][-1]
+
+    monkeypatch.setattr("novem.code.Computer.forward", fake_forward)
+
+    try:
+        cli("-c", "my-box", "-L", "5432:db:5432", "-L", "0.0.0.0:8888:localhost:8889")
+        assert False, "should exit"
+    except CliExit as e:
+        out, err = e.args
+        assert e.code == 0
+        assert "forwarding 127.0.0.1:5432 -> db:5432" in err
+        assert "forwarding 0.0.0.0:8888 -> localhost:8889" in err
+
+    assert [o[:4] for o in opened] == [("127.0.0.1", 5432, "db", 5432), ("0.0.0.0", 8888, "localhost", 8889)]
+    assert all(o[4].closed for o in opened)
+
+
+def test_computer_forward_rejects_a_malformed_spec(cli, requests_mock, fs):
+    write_config(auth_req)
+    requests_mock.register_uri("put", f"{api_root}code/computers/my-box", status_code=201)
+
+    try:
+        cli("-c", "my-box", "-L", "8888")
+        assert False, "should exit"
+    except CliExit as e:
+        out, err = e.args
+        assert e.code == 1
+        assert "[BIND:]PORT:HOST:HOSTPORT" in err
+
+
 def test_session_verbs_are_computer_only(cli, requests_mock, fs):
     write_config(auth_req)
     requests_mock.register_uri("put", f"{api_root}code/spaces/my-space", status_code=201)
@@ -963,7 +1039,7 @@ def test_job_inputs_split_files_from_directories(cli, requests_mock, fs, monkeyp
 
     seen = {}
 
-    def fake_run(self, files=None, input_dir=None, output=None, output_file=None):
+    def fake_run(self, files=None, input_dir=None, output=None, output_file=None, **kwargs):
         seen.update(files=files, input_dir=input_dir, output=output, output_file=output_file)
 
     monkeypatch.setattr("novem.Job.run", fake_run)
@@ -982,7 +1058,7 @@ def test_job_output_at_prefix_names_a_file(cli, requests_mock, fs, monkeypatch):
 
     seen = {}
 
-    def fake_run(self, files=None, input_dir=None, output=None, output_file=None):
+    def fake_run(self, files=None, input_dir=None, output=None, output_file=None, **kwargs):
         seen.update(output=output, output_file=output_file)
 
     monkeypatch.setattr("novem.Job.run", fake_run)
@@ -993,6 +1069,63 @@ def test_job_output_at_prefix_names_a_file(cli, requests_mock, fs, monkeypatch):
     assert seen["output"] is None
 
 
+def test_job_archive_flag_is_passed_to_run(cli, requests_mock, fs, monkeypatch):
+    write_config(auth_req)
+    requests_mock.register_uri("put", f"{api_root}code/jobs/my-job", status_code=201)
+
+    seen = {}
+
+    def fake_run(self, files=None, input_dir=None, archive=None, **kwargs):
+        seen.update(input_dir=input_dir, archive=archive)
+
+    monkeypatch.setattr("novem.Job.run", fake_run)
+
+    cli("-j", "my-job", "-R", "-i", "./src", "--archive", "tar.gz")
+
+    assert seen == {"input_dir": ["./src"], "archive": "tar.gz"}
+
+
+def test_job_batch_run_reports_each_job_and_writes_manifest(cli, requests_mock, fs):
+    write_config(auth_req)
+    requests_mock.register_uri(
+        "post",
+        f"{api_root}code/jobs/a/data",
+        content=b"A",
+        headers={"Content-Disposition": 'attachment; filename="a.txt"'},
+    )
+    requests_mock.register_uri("post", f"{api_root}code/jobs/b/data", json={"error": "boom"}, status_code=500)
+
+    try:
+        cli("-j", "a,b", "-R", "-o", "out", "--workers", "2")
+        assert False, "should exit"
+    except CliExit as e:
+        out, err = e.args
+        assert e.code == 1
+
+    lines = {line.split()[1]: line for line in out.splitlines()}
+    assert lines["a"].startswith("ok") and "out/a/a.txt" in lines["a"]
+    assert lines["b"].startswith("FAIL") and "boom" in lines["b"]
+    assert "1/2 jobs succeeded" in err
+
+    with open("out/a/a.txt", "rb") as f:
+        assert f.read() == b"A"
+    with open("out/manifest.json") as f:
+        manifest = json.load(f)
+    assert [(j["job"], j["ok"]) for j in manifest["jobs"]] == [("a", True), ("b", False)]
+
+
+def test_job_batch_run_json(cli, requests_mock, fs):
+    write_config(auth_req)
+    for name in ("a", "b"):
+        requests_mock.register_uri("post", f"{api_root}code/jobs/{name}/data", text="")
+
+    out, err = cli("-j", "a,b", "-R", "--json")
+    manifest = json.loads(out)
+    assert manifest["ok"] is True
+    assert [j["job"] for j in manifest["jobs"]] == ["a", "b"]
+    assert all(j["seconds"] >= 0 for j in manifest["jobs"])
+
+
 def test_job_rejects_multiple_outputs(cli, requests_mock, fs):
     write_config(auth_req)
     requests_mock.register_uri("put", f"{api_root}code/jobs/my-job", status_code=201)
@@ -1003,3 +1136,36 @@ def test_job_rejects_multiple_outputs(cli, requests_mock, fs):
     except CliExit as e:
         out, err = e.args
         assert "only be given once" in err
+
+
+def test_computer_fanout_runs_everywhere_and_aggregates_status(cli, requests_mock, fs, monkeypatch):
+    from novem.code.compute import HostResult
+
+    write_config(auth_req)
+    seen = {}
+
+    def fake_run_on(computers, argv, **kwargs):
+        seen["names"] = [c.id for c in computers]
+        seen["argv"] = argv
+        seen["kwargs"] = kwargs
+        return [
+            HostResult("web1", 0, None),
+            HostResult("web2", 3, None),
+            HostResult("web3", 255, None, error="The computer is not running."),
+        ]
+
+    monkeypatch.setattr("novem.code.compute.run_on", fake_run_on)
+
+    try:
+        cli("-c", "web1,web2,web3", "-R", "--workers", "2", "--", "uptime")
+        assert False, "should exit with the aggregate status"
+    except CliExit as e:
+        out, err = e.args
+        assert e.code == 3  # the first failing computer's own status
+
+    assert "web3: The computer is not running." in err
+    assert "2/3 computers failed: web2, web3" in err
+    assert seen["names"] == ["web1", "web2", "web3"]
+    assert seen["argv"] == ["uptime"]
+    assert seen["kwargs"]["stream"] is True
+    assert seen["kwargs"]["concurrency"] == 2
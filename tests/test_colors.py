@@ -501,10 +501,10 @@ def test_color_df_loc_selector(requests_mock):
     n.colors += S(df.loc[df.level == 2, :], SC("bg", "gray-300"), df)
     n.colors += S(df.loc[df.level == 3, :], SC("bg", "gray-400"), df)
 
-    res = """1 1,2,3,4,5,6,7,8 bg gray-100
-2,5,8 1,2,3,4,5,6,7,8 bg gray-200
-3,6,9,12,19 1,2,3,4,5,6,7,8 bg gray-300
-4,7,10,11,13,14,15,16,17,18,20,21,22,23,24,25 1,2,3,4,5,6,7,8 bg gray-400"""
+    res = """1 1:8 bg gray-100
+2,5,8 1:8 bg gray-200
+3,6,9,12,19 1:8 bg gray-300
+4,7,10,11,13:18,20:25 1:8 bg gray-400"""
 
     assert str(n.colors) == res
 
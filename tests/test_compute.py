@@ -11,7 +11,9 @@ import io
 import json
 import os
 import secrets
+import shutil
 import signal
+import socket
 import sys
 import threading
 
@@ -26,6 +28,7 @@ from novem.code.compute import (
     STREAM_STDOUT,
     Channel,
     ComputeConnection,
+    ComputePool,
     Hello,
     NovemComputeError,
     NovemComputeTransportError,
@@ -254,12 +257,175 @@ def test_channel_honours_a_smaller_negotiated_frame_limit():
     asyncio.run(check())
 
 
+def test_send_accepts_any_buffer_without_changing_the_frames():
+    class Connection:
+        max_data_bytes = 4
+
+        def __init__(self):
+            self.frames = []
+
+        async def _send_binary(self, frame):
+            self.frames.append(frame)
+
+    async def check():
+        conn = Connection()
+        channel_id = _channel()
+        channel = Channel(conn, channel_id, "exec")
+        await channel.send(bytearray(b"abcdef"))
+        await channel.send(memoryview(b"xyz"))
+        assert conn.frames == [
+            encode_frame(channel_id, b"abcd"),
+            encode_frame(channel_id, b"ef"),
+            encode_frame(channel_id, b"xyz"),
+        ]
+        assert all(isinstance(frame, bytes) for frame in conn.frames)
+
+    asyncio.run(check())
+
+
+def test_read_loop_routes_frames_by_raw_channel_id():
+    channel_id = _channel()
+
+    class Socket:
+        close_code = 1000
+
+        def __aiter__(self):
+            return self._replay()
+
+        async def _replay(self):
+            for data in (
+                encode_frame(channel_id, b"out", STREAM_STDOUT),
+                encode_frame(_channel(), b"not ours", STREAM_STDOUT),
+                encode_frame(channel_id, b"err", STREAM_STDERR),
+            ):
+                yield aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, data, None)
+
+    async def check():
+        conn = ComputeConnection("ws://unused/ws-cu", "nut-x")
+        conn._ws = Socket()
+        channel = Channel(conn, channel_id, "exec")
+        conn._channels[channel.key] = channel
+        await conn._read_loop()
+        received = [item async for item in channel]
+        assert received == [(STREAM_STDOUT, b"out"), (STREAM_STDERR, b"err")]
+        with pytest.raises(NovemComputeTransportError):
+            await channel.wait()
+
+    asyncio.run(check())
+
+
+class _ReplaySocket:
+    """Replays binary frames into a read loop, then reports a normal close."""
+
+    close_code = 1000
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.read = 0
+
+    def __aiter__(self):
+        return self._replay()
+
+    async def _replay(self):
+        for data in self.frames:
+            self.read += 1
+            yield aiohttp.WSMessage(aiohttp.WSMsgType.BINARY, data, None)
+
+
+def test_a_full_channel_buffer_spills_without_stopping_socket_reads():
+    channel_id = _channel()
+    other_id = _channel()
+    frames = [encode_frame(channel_id, b"%d" % i * 10, STREAM_STDOUT) for i in range(6)]
+    frames.insert(4, encode_frame(other_id, b"other", STREAM_STDOUT))
+
+    async def check():
+        conn = ComputeConnection("ws://unused/ws-cu", "nut-x", buffer_bytes=25)
+        conn._ws = _ReplaySocket(frames)
+        channel = Channel(conn, channel_id, "exec")
+        other = Channel(conn, other_id, "exec")
+        conn._channels[channel.key] = channel
+        conn._channels[other.key] = other
+
+        # nothing consumes the channel, yet every frame is read
+        await asyncio.wait_for(conn._read_loop(), timeout=1)
+        assert conn._ws.read == 7
+        assert channel.buffered == channel.high_water == 60
+        assert channel.spills == 1
+        assert [item async for item in other] == [(STREAM_STDOUT, b"other")]
+
+        received = [data async for _stream, data in channel]
+        assert received == [b"%d" % i * 10 for i in range(6)]
+        assert channel.buffered == 0
+        assert channel._spill is None
+        with pytest.raises(NovemComputeTransportError):
+            await channel.wait()
+
+    asyncio.run(check())
+
+
+def test_a_channel_spills_again_after_catching_up():
+    channel_id = _channel()
+
+    async def check():
+        conn = ComputeConnection("ws://unused/ws-cu", "nut-x", buffer_bytes=15)
+        channel = Channel(conn, channel_id, "exec")
+        received = []
+
+        async def consume():
+            async for stream, data in channel:
+                received.append((stream, data))
+
+        consumer = asyncio.create_task(consume())
+        streams = (STREAM_STDOUT, STREAM_STDERR, STREAM_STDOUT)
+        for i in range(3):
+            for stream in streams:
+                channel._feed(stream, b"%d" % i * 10)
+            await asyncio.sleep(0.01)
+            assert channel._spill is None  # drained and dropped
+        channel._finish(0, None)
+        await asyncio.wait_for(consumer, timeout=1)
+
+        assert received == [(s, b"%d" % i * 10) for i in range(3) for s in streams]
+        assert channel.spills == 3
+        assert await channel.wait() == (0, None)
+
+    asyncio.run(check())
+
+
+def test_closing_a_channel_drops_what_it_spilled():
+    channel_id = _channel()
+    frames = [encode_frame(channel_id, b"y" * 10, STREAM_STDOUT) for _ in range(5)]
+
+    class Connection(ComputeConnection):
+        async def _send_json(self, message):
+            self.sent = message
+
+    async def check():
+        conn = Connection("ws://unused/ws-cu", "nut-x", buffer_bytes=15)
+        conn._ws = _ReplaySocket(frames)
+        channel = Channel(conn, channel_id, "exec")
+        conn._channels[channel.key] = channel
+
+        await asyncio.wait_for(conn._read_loop(), timeout=1)
+        spill = channel._spill
+        assert spill is not None
+
+        await channel.close()  # nobody will consume the rest
+        assert spill.closed and channel._spill is None
+        assert conn.sent == {"type": "close", "channel": channel_id}
+        with pytest.raises(NovemComputeTransportError):
+            await channel.wait()
+
+    asyncio.run(check())
+
+
 def test_connection_enforces_and_releases_negotiated_channel_limit():
     async def check():
         conn = ComputeConnection("ws://unused/ws-cu", "nut-x")
         conn.hello = Hello(PROTOCOL, 1, MAX_DATA_BYTES, 30)
         channel_id = _channel()
-        conn._channels[channel_id] = Channel(conn, channel_id, "exec")
+        channel = Channel(conn, channel_id, "exec")
+        conn._channels[channel.key] = channel
 
         with pytest.raises(NovemComputeError) as exc_info:
             await conn.open_exec(TARGET, "true")
@@ -579,8 +745,9 @@ def test_pty_setup_failure_has_a_clear_error(monkeypatch, failure_point):
 class FakeServer:
     """A minimal server-side implementation of novem.compute.v1."""
 
-    def __init__(self, script, *, reject_statuses=None, protocols=(PROTOCOL,), send_hello=True):
+    def __init__(self, script, *, reject_statuses=None, protocols=(PROTOCOL,), send_hello=True, on_binary=None):
         self.script = script
+        self.on_binary = on_binary
         self.seen = []
         self.auth = None
         self.subprotocol = None
@@ -621,7 +788,10 @@ class FakeServer:
                 self.seen.append(payload)
                 await self.script(ws, payload, self)
             elif msg.type == aiohttp.WSMsgType.BINARY:
-                self.seen.append(decode_frame(msg.data))
+                frame = decode_frame(msg.data)
+                self.seen.append(frame)
+                if self.on_binary is not None:
+                    await self.on_binary(ws, frame, self)
         return ws
 
 
@@ -1071,3 +1241,619 @@ def test_large_stdin_is_chunked_to_the_frame_limit():
     assert len(frames) == 2
     assert len(frames[0][2]) == MAX_DATA_BYTES
     assert len(frames[1][2]) == 100
+
+
+def test_connection_and_channel_stats_cover_latency_traffic_and_rtt():
+    server = FakeServer(_chatty)
+
+    async def body(url):
+        async with ComputeConnection(url, "nut-x") as conn:
+            ch = await conn.open_exec(TARGET, "yes")
+            await _exec_collect_channel(ch, "in")
+            for _ in range(100):  # the first ping goes out right after hello
+                if conn.stats.pings:
+                    break
+                await asyncio.sleep(0.01)
+            return conn.stats, ch.stats
+
+    conn, ch = _drive(server, body)
+
+    assert conn.handshake_seconds is not None and conn.hello_seconds is not None
+    assert conn.channels == 1
+    assert conn.pings == 1 and conn.rtt_seconds == conn.rtt_min_seconds > 0
+    assert ch.admission_seconds is not None and ch.admission_seconds > 0
+    assert (ch.bytes_sent, ch.frames_sent) == (2, 1)
+    assert (ch.bytes_received, ch.frames_received) == (200_005, 5)
+    # the connection also counts headers and control messages
+    assert conn.bytes_received > ch.bytes_received
+    assert conn.frames_sent >= 3  # open, stdin, stdin_eof
+
+
+# --- pooled connections ------------------------------------------------------
+
+
+async def _echo_exit(ws, msg, gw):
+    """Answer every exec open with its command on stdout and exit 0."""
+    if msg["type"] == "open":
+        ch = _channel()
+        await ws.send_str(json.dumps({"type": "ready", "request_id": msg["request_id"], "channel": ch, "kind": "exec"}))
+        await ws.send_bytes(encode_frame(ch, msg["command"].encode(), STREAM_STDOUT))
+        await ws.send_str(json.dumps({"type": "exit", "channel": ch, "code": 0, "signal": None}))
+
+
+@pytest.fixture
+def pooled():
+    """A ComputePool plus a FakeServer served from the pool's own loop."""
+    pools = []
+
+    def start(script, idle_seconds=60.0):
+        pool = ComputePool(idle_seconds=idle_seconds)
+        server = FakeServer(script)
+        runner, url = pool._thread.run(_serve(server))
+        server.url = url
+        pools.append((pool, runner))
+
+        def run(command):
+            return pool.call(
+                lambda: ComputeConnection(url, "nut-x"),
+                lambda conn: conn.open_exec(TARGET, command),
+                lambda channel: _exec_collect_channel(channel, None),
+            )
+
+        return pool, server, run
+
+    yield start
+    for pool, runner in pools:
+        # client sockets first, or the server waits for them on shutdown
+        pool._thread.run(pool._close_all())
+        pool._thread.run(runner.cleanup())
+        pool.close()
+
+
+def test_pool_reuses_one_connection_across_calls(pooled):
+    pool, server, run = pooled(_echo_exit)
+
+    assert [run(c).stdout for c in ("a", "b", "c")] == ["a", "b", "c"]
+    assert server.connections == 1
+    assert pool.connections == 1
+
+
+def test_pool_multiplexes_concurrent_callers(pooled):
+    pool, server, run = pooled(_echo_exit)
+    results = {}
+
+    def worker(name):
+        results[name] = run(name).stdout
+
+    threads = [threading.Thread(target=worker, args=(f"cmd{i}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+
+    assert results == {f"cmd{i}": f"cmd{i}" for i in range(8)}
+    assert server.connections == 1
+
+
+def test_pool_reconnects_after_the_server_closes_an_idle_connection(pooled):
+    async def script(ws, msg, gw):
+        await _echo_exit(ws, msg, gw)
+        if msg["type"] == "stdin_eof":
+            await ws.close(code=1001)  # the server ends the idle session
+
+    pool, server, run = pooled(script)
+
+    assert run("first").ok
+    for _ in range(100):
+        if pool.connections == 0:
+            break
+        threading.Event().wait(0.01)
+    assert run("second").stdout == "second"
+    assert server.connections == 2
+
+
+def test_pool_closes_connections_left_idle(pooled):
+    pool, server, run = pooled(_echo_exit, idle_seconds=0.05)
+
+    assert run("a").ok
+    for _ in range(100):
+        if not pool._entries:
+            break
+        threading.Event().wait(0.01)
+    assert not pool._entries
+
+    assert run("b").ok
+    assert server.connections == 2
+
+
+# --- port forwarding ---------------------------------------------------------
+
+
+async def _upper_echo(ws, msg, gw):
+    """Accept tcp opens and close each channel once its client half-closes."""
+    if msg["type"] == "open":
+        ch = _channel()
+        gw.opens = getattr(gw, "opens", []) + [(msg["kind"], msg["host"], msg["port"])]
+        await ws.send_str(json.dumps({"type": "ready", "request_id": msg["request_id"], "channel": ch, "kind": "tcp"}))
+    elif msg["type"] == "stdin_eof":
+        await ws.send_str(json.dumps({"type": "closed", "channel": msg["channel"]}))
+
+
+async def _upper_bytes(ws, frame, gw):
+    _, ch, payload = frame
+    await ws.send_bytes(encode_frame(ch, payload.upper()))
+
+
+def test_forward_tunnels_each_local_connection_as_a_channel(pooled):
+    from novem.code.forward import PortForward
+
+    pool, server, _ = pooled(_upper_echo)
+    server.on_binary = _upper_bytes
+    fwd = PortForward(pool, lambda: ComputeConnection(server.url, "nut-x"), TARGET, "db.internal", 5432).start()
+    replies = {}
+
+    def client(i):
+        with socket.create_connection(("127.0.0.1", fwd.port), timeout=10) as sock:
+            sock.sendall(b"query %d " % i * 30_000)  # more than one frame
+            sock.shutdown(socket.SHUT_WR)
+            replies[i] = b"".join(iter(lambda: sock.recv(65536), b""))
+
+    try:
+        threads = [threading.Thread(target=client, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+    finally:
+        fwd.close()
+
+    assert replies == {i: b"QUERY %d " % i * 30_000 for i in range(4)}
+    assert server.opens == [("tcp", "db.internal", 5432)] * 4
+    assert server.connections == 1
+    assert fwd.accepted == 4 and fwd.active == 0
+    assert fwd.bytes_sent == fwd.bytes_received == sum(len(r) for r in replies.values())
+
+
+def test_forward_reports_a_refused_remote_and_keeps_listening(pooled):
+    from novem.code.forward import PortForward
+
+    async def script(ws, msg, gw):
+        if msg["type"] == "open":
+            await ws.send_str(
+                json.dumps(
+                    {
+                        "type": "error",
+                        "request_id": msg["request_id"],
+                        "code": "connection_failed",
+                        "message": "connection refused",
+                    }
+                )
+            )
+
+    pool, server, _ = pooled(script)
+    errors = []
+    fwd = PortForward(
+        pool, lambda: ComputeConnection(server.url, "nut-x"), TARGET, "localhost", 1, on_error=errors.append
+    )
+    fwd.start()
+    try:
+        for _ in range(2):
+            with socket.create_connection(("127.0.0.1", fwd.port), timeout=10) as sock:
+                assert sock.recv(1) == b""  # closed without data
+    finally:
+        fwd.close()
+
+    assert [e.code for e in errors] == ["connection_failed", "connection_failed"]
+    assert server.connections == 1
+
+
+# --- background loop ---------------------------------------------------------
+
+
+async def _thread_name():
+    return threading.current_thread().name
+
+
+def test_sync_helpers_share_one_background_loop_even_inside_a_running_loop():
+    from novem.code.compute import _run_sync
+
+    async def notebook_cell():  # Jupyter runs cells inside its own loop
+        return _run_sync(_thread_name())
+
+    first = _run_sync(_thread_name())
+    assert _run_sync(_thread_name()) == first == "novem-loop"
+    assert asyncio.run(notebook_cell()) == "novem-loop"
+    # work that needs the main thread's signal handling still gets it
+    assert _run_sync(_thread_name(), own_loop=True) == threading.main_thread().name
+
+
+# --- batch exec --------------------------------------------------------------
+
+
+def test_exec_many_bounds_concurrency_and_keeps_order():
+    live = set()
+    peak = 0
+
+    async def script(ws, msg, gw):
+        nonlocal peak
+        if msg["type"] != "open":
+            return
+        ch = _channel()
+        live.add(ch)
+        peak = max(peak, len(live))
+        await ws.send_str(json.dumps({"type": "ready", "request_id": msg["request_id"], "channel": ch, "kind": "exec"}))
+
+        async def finish():
+            # later commands finish first, so order comes from the caller
+            await asyncio.sleep(0.01 * (5 - int(msg["args"][0])))
+            await ws.send_bytes(encode_frame(ch, msg["args"][0].encode(), STREAM_STDOUT))
+            live.discard(ch)
+            await ws.send_str(json.dumps({"type": "exit", "channel": ch, "code": 0, "signal": None}))
+
+        asyncio.ensure_future(finish())
+
+    server = FakeServer(script)
+
+    async def body(url):
+        async with ComputeConnection(url, "nut-x") as conn:
+            return await conn.exec_many(TARGET, [["echo", str(i)] for i in range(5)], concurrency=2)
+
+    results = _drive(server, body)
+
+    assert [r.stdout for r in results] == ["0", "1", "2", "3", "4"]
+    assert all(r.ok and r.seconds is not None for r in results)
+    assert peak == 2
+    assert server.connections == 1
+
+
+def test_exec_many_fails_fast_on_a_command_that_cannot_start():
+    async def script(ws, msg, gw):
+        if msg["type"] != "open":
+            return
+        if msg["command"] == "missing":
+            await ws.send_str(
+                json.dumps(
+                    {"type": "error", "request_id": msg["request_id"], "code": "process_start_failed", "message": "no"}
+                )
+            )
+            return
+        ch = _channel()
+        await ws.send_str(json.dumps({"type": "ready", "request_id": msg["request_id"], "channel": ch, "kind": "exec"}))
+
+    server = FakeServer(script)
+
+    async def body(url):
+        async with ComputeConnection(url, "nut-x") as conn:
+            with pytest.raises(NovemComputeError) as ei:
+                await conn.exec_many(TARGET, ["sleep", "missing"])
+            await asyncio.sleep(0.05)
+            return ei.value
+
+    err = _drive(server, body)
+
+    assert err.code == "process_start_failed"
+    # the command still running was closed rather than left behind
+    assert any(m.get("type") == "close" for m in server.seen if isinstance(m, dict))
+
+
+# --- fan-out over several computers -----------------------------------------
+
+
+class _StubComputer:
+    """What run_on needs from a Computer: a name, a target and a connection."""
+
+    def __init__(self, id, url):
+        self.id = id
+        self.compute_target = f"/v1/users/alice/code/computers/{id}"
+        self._url = url
+
+    def connect(self):
+        return ComputeConnection(self._url, "nut-x")
+
+
+class _UnresolvableComputer(_StubComputer):
+    """Its target lookup fails the way an HTTP request can."""
+
+    @property
+    def compute_target(self):
+        raise OSError("network is unreachable")
+
+    @compute_target.setter
+    def compute_target(self, value):
+        pass
+
+
+def test_run_on_prefixes_streamed_lines_and_isolates_failures(capsys):
+    async def script(ws, msg, gw):
+        if msg["type"] != "open":
+            return
+        host = msg["target"].rsplit("/", 1)[-1]
+        ch = _channel()
+        await ws.send_str(json.dumps({"type": "ready", "request_id": msg["request_id"], "channel": ch, "kind": "exec"}))
+        # a line split across frames is still printed whole
+        await ws.send_bytes(encode_frame(ch, f"up on {host[:2]}".encode(), STREAM_STDOUT))
+        await ws.send_bytes(encode_frame(ch, f"{host[2:]}\nbye".encode(), STREAM_STDOUT))
+        code = 2 if host == "web2" else 0
+        await ws.send_str(json.dumps({"type": "exit", "channel": ch, "code": code, "signal": None}))
+
+    server = FakeServer(script)
+
+    async def body(url):
+        from novem.code.compute import run_on_async
+
+        dead = "ws://127.0.0.1:9/ws-cu"  # nothing listens on the discard port
+        hosts = [
+            _StubComputer("web1", url),
+            _StubComputer("web2", url),
+            _StubComputer("gone", dead),
+            _UnresolvableComputer("lost", url),
+        ]
+        return await run_on_async(hosts, ["uptime"], stream=True)
+
+    results = _drive(server, body)
+    out = capsys.readouterr().out
+
+    assert "web1: up on web1\n" in out
+    assert "web1: bye\n" in out
+    assert "web2: up on web2\n" in out
+    assert [r.computer for r in results] == ["web1", "web2", "gone", "lost"]
+    assert results[0].ok
+    assert results[1].code == 2 and results[1].status == 2
+    assert results[2].error and results[2].status == 255
+    assert results[3].error == "network is unreachable" and results[3].status == 255
+    assert server.connections == 2
+
+    from novem.code.compute import aggregate_status
+
+    assert aggregate_status(results) == 2
+    assert aggregate_status(results[:1]) == 0
+
+
+def test_output_falls_back_to_text_streams(monkeypatch):
+    from novem.code.compute import _Output, _PrefixedLines
+
+    out, err = io.StringIO(), io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    monkeypatch.setattr(sys, "stderr", err)
+
+    output = _Output()
+    data = "héllo ✓\n".encode()
+    # a character split across frames is decoded whole
+    for i in range(len(data)):
+        output.write(STREAM_STDOUT, data[i : i + 1])
+    output.write(STREAM_STDERR, b"oops\n")
+
+    lines = _PrefixedLines("web1: ")
+    lines.write(STREAM_STDOUT, b"up\nbye")
+    lines.close()
+
+    assert out.getvalue() == "héllo ✓\nweb1: up\nweb1: bye\n"
+    assert err.getvalue() == "oops\n"
+
+
+# --- large output ------------------------------------------------------------
+
+
+async def _chatty(ws, msg, gw):
+    """Send 200 KB on stdout and a little stderr, then exit."""
+    if msg["type"] == "open":
+        ch = _channel()
+        await ws.send_str(json.dumps({"type": "ready", "request_id": msg["request_id"], "channel": ch, "kind": "exec"}))
+        for _ in range(4):
+            await ws.send_bytes(encode_frame(ch, b"o" * 50_000, STREAM_STDOUT))
+        await ws.send_bytes(encode_frame(ch, b"warn\n", STREAM_STDERR))
+        await ws.send_str(json.dumps({"type": "exit", "channel": ch, "code": 0, "signal": None}))
+
+
+def test_collect_spills_large_output_to_temporary_files():
+    async def body(url):
+        async with ComputeConnection(url, "nut-x") as conn:
+            ch = await conn.open_exec(TARGET, "yes")
+            return await _exec_collect_channel(ch, None, spill_bytes=64 * 1024)
+
+    result = _drive(FakeServer(_chatty), body)
+
+    assert result.stdout == "" and result.stderr == ""
+    assert result.stdout_bytes == 200_000
+    assert result.stdout_file.read() == b"o" * 200_000
+    assert result.stderr_file.read() == b"warn\n"
+    assert result.high_water > 0
+    result.stdout_file.close()
+    result.stderr_file.close()
+
+
+def test_collect_streams_output_to_caller_sinks():
+    sink = io.BytesIO()
+
+    async def body(url):
+        async with ComputeConnection(url, "nut-x") as conn:
+            ch = await conn.open_exec(TARGET, "yes")
+            return await _exec_collect_channel(ch, None, stdout=sink)
+
+    result = _drive(FakeServer(_chatty), body)
+
+    assert sink.getvalue() == b"o" * 200_000
+    assert result.stdout == "" and result.stdout_file is None
+    assert result.stderr == "warn\n"  # no sink for stderr: buffered as before
+
+
+# --- file transfer -----------------------------------------------------------
+
+
+class _LocalShell:
+    """Run shell-mode exec channels as local processes, like a computer would."""
+
+    def __init__(self, corrupt=False):
+        self.procs = {}
+        self.corrupt = corrupt
+        self.tasks = []
+
+    async def script(self, ws, msg, gw):
+        if msg["type"] == "open":
+            ch = _channel()
+            proc = await asyncio.create_subprocess_shell(
+                msg["command"],
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            self.procs[ch] = proc
+            await ws.send_str(
+                json.dumps({"type": "ready", "request_id": msg["request_id"], "channel": ch, "kind": "exec"})
+            )
+            self.tasks.append(asyncio.ensure_future(self._relay(ws, ch, proc)))
+        elif msg["type"] == "stdin_eof":
+            self.procs[msg["channel"]].stdin.close()
+
+    async def on_binary(self, ws, frame, gw):
+        _, ch, payload = frame
+        if self.corrupt:
+            payload = bytes([payload[0] ^ 1]) + payload[1:]
+        proc = self.procs[ch]
+        proc.stdin.write(payload)
+        await proc.stdin.drain()
+
+    async def _relay(self, ws, ch, proc):
+        async def pipe(reader, stream):
+            while chunk := await reader.read(MAX_DATA_BYTES):
+                await ws.send_bytes(encode_frame(ch, chunk, stream))
+
+        await asyncio.gather(pipe(proc.stdout, STREAM_STDOUT), pipe(proc.stderr, STREAM_STDERR))
+        code = await proc.wait()
+        await ws.send_str(json.dumps({"type": "exit", "channel": ch, "code": code, "signal": None}))
+
+
+needs_coreutils = pytest.mark.skipif(
+    not all(shutil.which(tool) for tool in ("sh", "sha256sum", "gzip", "find")),
+    reason="file transfer runs sh, sha256sum, gzip and find on the computer",
+)
+
+
+def _transfer(shell, body):
+    server = FakeServer(shell.script, on_binary=shell.on_binary)
+
+    async def run(url):
+        async with ComputeConnection(url, "nut-x") as conn:
+            return await body(conn)
+
+    return server, _drive(server, run)
+
+
+@needs_coreutils
+@pytest.mark.parametrize("compress", [False, True])
+def test_put_and_get_round_trip_a_file(tmp_path, compress):
+    from novem.code.transfer import download, upload
+
+    data = os.urandom(256 * 1024) + b"novem " * 500_000  # several read blocks, partly compressible
+    (tmp_path / "src.bin").write_bytes(data)
+    remote = str(tmp_path / "remote" / "nested" / "data.bin")
+    seen = []
+
+    async def body(conn):
+        put = await upload(conn, TARGET, str(tmp_path / "src.bin"), remote, compress=compress)
+        got = await download(
+            conn,
+            TARGET,
+            remote,
+            str(tmp_path / "back" / "data.bin"),
+            compress=compress,
+            progress=lambda n, t: seen.append(n),
+        )
+        return put, got
+
+    server, (put, got) = _transfer(_LocalShell(), body)
+
+    assert (tmp_path / "remote" / "nested" / "data.bin").read_bytes() == data
+    assert (tmp_path / "back" / "data.bin").read_bytes() == data
+    assert put.bytes == got.bytes == len(data)
+    assert put.sha256 == got.sha256 is not None
+    assert put.throughput > 0
+    assert (put.wire_bytes < len(data)) is compress
+    assert seen[-1] == len(data)
+    # nothing temporary is left on either side
+    assert sorted(p.name for p in (tmp_path / "remote" / "nested").iterdir()) == ["data.bin"]
+    assert sorted(p.name for p in (tmp_path / "back").iterdir()) == ["data.bin"]
+    # stdin went out as full frames of the negotiated size
+    frames = [f[2] for f in server.seen if isinstance(f, tuple)]
+    assert max(len(f) for f in frames) == MAX_DATA_BYTES
+
+
+@needs_coreutils
+def test_put_that_fails_verification_leaves_the_destination_alone(tmp_path):
+    from novem.code.transfer import NovemTransferError, upload
+
+    (tmp_path / "src.txt").write_bytes(b"payload")
+    (tmp_path / "dest.txt").write_bytes(b"previous")
+
+    async def body(conn):
+        try:
+            await upload(conn, TARGET, str(tmp_path / "src.txt"), str(tmp_path / "dest.txt"))
+        except NovemTransferError as e:
+            return e
+
+    _, error = _transfer(_LocalShell(corrupt=True), body)
+
+    assert "sha256" in str(error)
+    assert (tmp_path / "dest.txt").read_bytes() == b"previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dest.txt", "src.txt"]
+
+
+@needs_coreutils
+def test_get_of_a_missing_file_reports_the_remote_error(tmp_path):
+    from novem.code.transfer import NovemTransferError, download
+
+    async def body(conn):
+        try:
+            await download(conn, TARGET, str(tmp_path / "missing"), str(tmp_path / "out" / "x"))
+        except NovemTransferError as e:
+            return e
+
+    _, error = _transfer(_LocalShell(), body)
+
+    assert "No such file" in str(error)
+    assert list((tmp_path / "out").iterdir()) == []
+
+
+@needs_coreutils
+def test_directories_round_trip_with_several_files_in_flight(tmp_path):
+    from novem.code.transfer import download_tree, upload_tree
+
+    src = tmp_path / "src"
+    files = {"a.txt": b"a", "sub/b.txt": b"b" * 70_000, "sub/deeper/c.bin": os.urandom(1000), "empty": b""}
+    for name, content in files.items():
+        (src / name).parent.mkdir(parents=True, exist_ok=True)
+        (src / name).write_bytes(content)
+
+    async def body(conn):
+        up = await upload_tree(conn, TARGET, str(src), str(tmp_path / "remote"), concurrency=3)
+        down = await download_tree(conn, TARGET, str(tmp_path / "remote"), str(tmp_path / "back"), compress=True)
+        return up, down
+
+    server, (up, down) = _transfer(_LocalShell(), body)
+
+    assert len(up) == len(down) == len(files)
+    for name, content in files.items():
+        assert (tmp_path / "remote" / name).read_bytes() == content
+        assert (tmp_path / "back" / name).read_bytes() == content
+    assert server.connections == 1
+
+
+@needs_coreutils
+def test_get_dir_keeps_names_that_are_not_utf8(tmp_path):
+    from novem.code.transfer import download_tree
+
+    remote = os.fsencode(tmp_path / "remote")
+    os.makedirs(os.path.join(remote, b"caf\xe9"))
+    with open(os.path.join(remote, b"caf\xe9", b"r\xe9sum\xe9 '1'.txt"), "wb") as f:
+        f.write(b"latin-1")
+
+    async def body(conn):
+        return await download_tree(conn, TARGET, str(tmp_path / "remote"), str(tmp_path / "back"))
+
+    _, (got,) = _transfer(_LocalShell(), body)
+
+    back = os.fsencode(tmp_path / "back")
+    assert os.listdir(back) == [b"caf\xe9"]
+    with open(os.path.join(back, b"caf\xe9", b"r\xe9sum\xe9 '1'.txt"), "rb") as f:
+        assert f.read() == b"latin-1"
+    assert got.remote.encode("utf-8", "surrogateescape").endswith(b"/caf\xe9/r\xe9sum\xe9 '1'.txt")
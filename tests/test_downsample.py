@@ -0,0 +1,103 @@
+import configparser
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from novem import Plot
+from novem.vis.downsample import downsample, lttb_indices, max_points_for, minmax_indices
+
+
+def test_lttb_keeps_the_shape():
+    x = np.arange(1000.0)
+    y = np.zeros(1000)
+    y[500] = 10.0
+    y[250] = -3.0
+
+    kept = lttb_indices(x, y, 20)
+    assert len(kept) == 20
+    assert kept[0] == 0 and kept[-1] == 999
+    assert np.all(np.diff(kept) > 0)
+    assert 500 in kept and 250 in kept
+
+    assert list(lttb_indices(x[:10], y[:10], 20)) == list(range(10))
+    with pytest.raises(ValueError, match="at least 3"):
+        lttb_indices(x, y, 2)
+
+    # NaN points are not picked over real ones, a gap shorter than a bucket is skipped
+    y[600:605] = np.nan
+    assert not np.isnan(y[lttb_indices(x, y, 50)]).any()
+
+
+def test_minmax_keeps_every_extreme():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=10001).cumsum()
+    y[17] = np.nan
+
+    kept = minmax_indices(y, 100)
+    assert len(kept) <= 100
+    assert kept[0] == 0 and kept[-1] == 10000
+    assert np.nanmax(y[kept]) == np.nanmax(y)
+    assert np.nanmin(y[kept]) == np.nanmin(y)
+    with pytest.raises(ValueError, match="at least 4"):
+        minmax_indices(y, 3)
+
+
+def test_downsample_frames_and_arrays():
+    n = 10000
+    index = pd.date_range("2020-01-01", periods=n, freq="s")
+    df = pd.DataFrame({"a": np.sin(np.arange(n) / 100), "b": np.cos(np.arange(n) / 50), "s": "x"}, index=index)
+
+    small = downsample(df, "lttb", 100)
+    assert 100 <= len(small) <= 200
+    assert list(small.columns) == ["a", "b", "s"]
+    assert small.index.is_monotonic_increasing
+    assert small.index[0] == index[0] and small.index[-1] == index[-1]
+    pd.testing.assert_frame_equal(small, df.loc[small.index])
+
+    assert len(downsample(df["a"], "minmax", 100)) <= 100
+    assert len(downsample(np.arange(n), "lttb", 100)) == 100
+    assert downsample(df.head(50), "lttb", 100) is not None
+    assert len(downsample(df[["s"]], "lttb", 100)) == n
+    assert downsample("a\n1\n", "lttb", 100) == "a\n1\n"
+    with pytest.raises(ValueError, match="downsample must be one of"):
+        downsample(df, "every_other")
+
+    assert max_points_for("line") == 2000
+    assert max_points_for(" Line\n") == 2000
+    assert max_points_for("bar") is None
+
+
+def test_plot_downsamples_by_type(requests_mock):
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    api_root = config["general"]["api_root"]
+
+    posted = []
+    requests_mock.register_uri("put", f"{api_root}vis/plots/ds", text="")
+    requests_mock.register_uri("post", f"{api_root}vis/plots/ds/config/type", text="")
+    requests_mock.register_uri("get", f"{api_root}vis/plots/ds/config/type", text="bar\n")
+    requests_mock.register_uri(
+        "post", f"{api_root}vis/plots/ds/data", text=lambda request, context: posted.append(request.text) or ""
+    )
+
+    df = pd.DataFrame({"v": np.random.default_rng(0).normal(size=5000)})
+
+    p = Plot("ds", type="line", downsample="lttb", config_path=config_file)
+    p.data = df
+    p(df, max_points=100)
+    p(df, downsample=None)
+    assert [len(x.splitlines()) - 1 for x in posted] == [2000, 100, 5000]
+
+    # the type is read from the plot when it was not set here
+    p = Plot("ds", downsample="minmax", config_path=config_file)
+    p.data = df
+    assert len(posted[-1].splitlines()) - 1 == 5000
+    p(df, max_points=100)
+    assert len(posted[-1].splitlines()) - 1 <= 100
+
+    with pytest.raises(ValueError, match="downsample must be one of"):
+        Plot("ds", downsample="fast", config_path=config_file)
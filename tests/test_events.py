@@ -191,3 +191,24 @@ def test_events_kwarg_token_over_env():
     with patch.dict(os.environ, {"NOVEM_TOKEN": "env_token"}, clear=False):
         evt = Events(["/u/alice/p/*/e/*"], token="kwarg_token")
         assert evt._token == "kwarg_token"
+
+
+def test_events_can_be_iterated_synchronously():
+    closed = []
+
+    async def fake_aiter(self):
+        try:
+            for i in range(3):
+                yield EventMessage("s", "c", "t", f"/u/alice/p/plot{i}", "bob", "")
+        finally:
+            closed.append(True)
+
+    with patch.object(Events, "__aiter__", fake_aiter):
+        seen = []
+        for msg in Events(["/u/alice/p/*/e/*"], token="t"):
+            seen.append(msg.fqnp)
+            if len(seen) == 2:
+                break
+
+    assert seen == ["/u/alice/p/plot0", "/u/alice/p/plot1"]
+    assert closed == [True]  # leaving the loop ends the subscription
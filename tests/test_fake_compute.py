@@ -0,0 +1,176 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from novem.code.compute import (
+    PROTOCOL,
+    STREAM_STDERR,
+    STREAM_STDOUT,
+    ComputeConnection,
+    NovemComputeError,
+    NovemComputeTransportError,
+)
+
+from .fake_compute import FakeComputeServer, FakeProcess, LoadReport, load_test
+
+
+async def _collect(ch):
+    out = {STREAM_STDOUT: b"", STREAM_STDERR: b""}
+    async for stream, data in ch:
+        out[stream] = out.get(stream, b"") + data
+    return out, await ch.wait()
+
+
+def test_builtin_commands_run_through_the_client():
+    async def check():
+        async with FakeComputeServer() as server:
+            async with ComputeConnection(server.url, "nut-test") as conn:
+                out, status = await _collect(await conn.open_exec(server.target, "echo", ["hello", "world"]))
+                assert out[STREAM_STDOUT] == b"hello world\n"
+                assert status == (0, None)
+
+                out, status = await _collect(await conn.open_exec(server.target, "yes 100000", mode="shell"))
+                assert len(out[STREAM_STDOUT]) == 100000
+                assert status == (0, None)
+
+                _, status = await _collect(await conn.open_exec(server.target, "exit", ["3"]))
+                assert status == (3, None)
+
+                ch = await conn.open_exec(server.target, "cat")
+                await ch.send(b"x" * 200000)
+                await ch.stdin_eof()
+                out, status = await _collect(ch)
+                assert out[STREAM_STDOUT] == b"x" * 200000
+                assert status == (0, None)
+            assert server.connections == 1
+            assert server.opened == 4
+
+    asyncio.run(check())
+
+
+def test_custom_command_and_failures():
+    async def greet(proc: FakeProcess) -> int:
+        await proc.write(b"oops\n", STREAM_STDERR)
+        return 7
+
+    async def check():
+        async with FakeComputeServer(commands={"greet": greet}) as server:
+            async with ComputeConnection(server.url, "nut-test") as conn:
+                out, status = await _collect(await conn.open_exec(server.target, "/usr/bin/greet"))
+                assert out[STREAM_STDERR] == b"oops\n"
+                assert status == (7, None)
+
+                with pytest.raises(NovemComputeError) as info:
+                    await conn.open_exec(server.target, "nope")
+                assert info.value.code == "process_start_failed"
+
+    asyncio.run(check())
+
+
+def test_pty_echo_and_signal():
+    async def check():
+        async with FakeComputeServer() as server:
+            async with ComputeConnection(server.url, "nut-test") as conn:
+                pty = await conn.open_pty(server.target)
+                await pty.resize(40, 120)
+                await pty.send(b"ls\r")
+                stream, data = await pty.__aiter__().__anext__()
+                assert data == b"ls\r"
+                await pty.signal("INT")
+                assert await pty.wait() == (-1, "INT")
+
+                ch = await conn.open_exec(server.target, "sleep", ["30"])
+                await ch.signal("TERM")
+                assert await ch.wait() == (-1, "TERM")
+
+    asyncio.run(check())
+
+
+def test_server_enforces_its_channel_limit():
+    async def check():
+        async with FakeComputeServer(max_channels=1) as server:
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(server.url, protocols=(PROTOCOL,)) as ws:
+                    hello = json.loads((await ws.receive()).data)
+                    assert hello["max_channels"] == 1
+                    for request_id in ("a", "b"):
+                        spec = {"type": "open", "request_id": request_id, "kind": "exec", "command": "sleep"}
+                        await ws.send_str(json.dumps({**spec, "args": ["30"], "target": server.target}))
+                    replies = [json.loads((await ws.receive()).data) for _ in range(2)]
+            assert [r["type"] for r in replies] == ["ready", "error"]
+            assert replies[1]["request_id"] == "b"
+            assert replies[1]["code"] == "limit_exceeded"
+
+    asyncio.run(check())
+
+
+@pytest.mark.parametrize(
+    "close_code, reason",
+    [(1001, "session_ended"), (1011, "upstream_unavailable"), (4000, "connection_failed")],
+)
+def test_close_codes_reach_the_client(close_code, reason):
+    async def check():
+        async with FakeComputeServer() as server:
+            async with ComputeConnection(server.url, "nut-test") as conn:
+                ch = await conn.open_exec(server.target, "sleep", ["30"])
+                await server.close_all(close_code)
+                with pytest.raises(NovemComputeTransportError) as info:
+                    await ch.wait()
+            assert info.value.code == reason
+            assert info.value.close_code == close_code
+
+    asyncio.run(check())
+
+
+def test_handshake_rejection_carries_retry_after():
+    async def check():
+        async with FakeComputeServer() as server:
+            server.reject_next(429, retry_after=2)
+            with pytest.raises(NovemComputeTransportError) as info:
+                async with ComputeConnection(server.url, "nut-test"):
+                    pass
+            assert info.value.code == "limit_exceeded"
+            assert info.value.retryable
+            assert info.value.retry_after == 2
+            async with ComputeConnection(server.url, "nut-test") as conn:
+                assert conn.hello is not None
+            assert server.connections == 2
+
+    asyncio.run(check())
+
+
+def test_heartbeat_keeps_an_idle_connection_alive():
+    async def check():
+        async with FakeComputeServer(heartbeat_seconds=1) as server:
+            async with ComputeConnection(server.url, "nut-test") as conn:
+                await asyncio.sleep(1.5)
+                out, _ = await _collect(await conn.open_exec(server.target, "echo", ["up"]))
+                assert out[STREAM_STDOUT] == b"up\n"
+
+    asyncio.run(check())
+
+
+def test_load_test_reports_every_channel():
+    async def check():
+        async with FakeComputeServer(max_channels=8) as server:
+            return await load_test(server.url, channels=50, concurrency=32, output_bytes=10000)
+
+    report = asyncio.run(check())
+    assert report.channels == 50
+    assert report.concurrency == 8
+    assert report.failed == 0
+    assert report.bytes == 50 * 10000
+    assert len(report.admission) == 50
+    assert report.percentile(50) <= report.percentile(99)
+    assert report.channels_per_second > 0
+    assert "50 channels" in report.summary()
+
+
+def test_load_report_percentiles():
+    report = LoadReport(channels=4, concurrency=1, seconds=2.0, bytes=4 * 1024 * 1024, admission=[0.1, 0.2, 0.3, 0.4])
+    assert report.percentile(50) == 0.2
+    assert report.percentile(99) == 0.4
+    assert report.mb_per_second == 2.0
+    assert report.channels_per_second == 2.0
@@ -0,0 +1,170 @@
+import configparser
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from novem import Plot
+from novem.exceptions import NovemException
+from novem.vis.fingerprint import FingerprintStore, fingerprint, fingerprint_csv
+
+
+def _api_root(config_file):
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    return config["general"]["api_root"]
+
+
+def test_fingerprint_follows_the_csv():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]}, index=pd.Index([1, 2], name="i"))
+
+    assert fingerprint(df) == fingerprint(df.copy())
+    assert fingerprint(df) != fingerprint(df.assign(a=[1.0, 2.5]))
+    # labels, dtypes and options change the csv without changing the values
+    assert fingerprint(df) != fingerprint(df.rename(columns={"a": "c"}))
+    assert fingerprint(df) != fingerprint(df.astype({"a": "float32"}))
+    assert fingerprint(df) != fingerprint(df.rename_axis("j"))
+    assert fingerprint(df) != fingerprint(df, {"float_precision": 1})
+    assert fingerprint(df, {"index": False}) == fingerprint(df.set_axis([5, 6]), {"index": False})
+    assert fingerprint(df["a"]) == fingerprint(df[["a"]])
+
+    arr = np.arange(6.0)
+    assert fingerprint(arr) == fingerprint(arr.copy())
+    assert fingerprint(arr) != fingerprint(arr.reshape(2, 3))
+    assert fingerprint("a\n1\n") == fingerprint_csv("a\n1\n")
+
+    # types that cannot be hashed directly fall back to the csv
+    assert fingerprint(pd.DataFrame({"l": [[1], [2]]})) is None
+    assert fingerprint(np.array([1, "a"], dtype=object)) is None
+    assert fingerprint(42) is None
+
+
+def test_store_persists_to_file(tmp_path):
+    path = str(tmp_path / "state" / "fingerprints.json")
+    store = FingerprintStore(path)
+    assert store.get("k") is None
+
+    store.set("k", "1")
+    store.set("j", "2")
+    assert FingerprintStore(path).get("k") == "1"
+    assert json.load(open(path)) == {"j": "2", "k": "1"}
+
+    store.forget("k")
+    assert FingerprintStore(path).get("k") is None
+    assert os.listdir(tmp_path / "state") == ["fingerprints.json"]
+
+    with open(path, "w") as f:
+        f.write("not json")
+    assert store.get("j") is None
+
+    memory = FingerprintStore()
+    memory.set("k", "1")
+    assert memory.get("k") == "1"
+
+
+def test_plot_skips_unchanged_data(requests_mock, tmp_path):
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    api_root = _api_root(config_file)
+
+    posted = []
+    requests_mock.register_uri("put", f"{api_root}vis/plots/fp", text="")
+    requests_mock.register_uri(
+        "post", f"{api_root}vis/plots/fp/data", text=lambda request, context: posted.append(request.text) or ""
+    )
+    requests_mock.register_uri("post", f"{api_root}vis/plots/fp/config/title", text="")
+
+    df = pd.DataFrame({"a": [1, 2]})
+    store = str(tmp_path / "fingerprints.json")
+
+    p = Plot("fp", fingerprint_store=store, config_path=config_file)
+    p.data = df
+    p(df.copy(), title="same data")
+    assert len(posted) == 1
+    assert requests_mock.request_history[-1].text == "same data"
+
+    # a new process with the same store still skips
+    p = Plot("fp", fingerprint_store=store, config_path=config_file)
+    p.data = df
+    p(df, float_precision=2)
+    p.data = df.assign(a=[1, 3])
+    p.data = [("a",), (1,)]
+    p.data = [("a",), (1,)]
+    assert len(posted) == 4
+
+    # without a store every assignment uploads
+    p = Plot("fp", config_path=config_file)
+    p.data = df
+    p.data = df
+    assert len(posted) == 6
+
+    p = Plot("fp", skip_unchanged=True, config_path=config_file)
+    p.data = df
+    p.data = df
+    assert len(posted) == 7
+
+
+def test_frozen_plot_stores_fingerprint_after_run(requests_mock, tmp_path):
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    api_root = _api_root(config_file)
+
+    requests_mock.register_uri("put", f"{api_root}vis/plots/fz", text="")
+    requests_mock.register_uri("post", f"{api_root}vis/plots/fz/data", status_code=500, text="down")
+
+    df = pd.DataFrame({"a": [1, 2]})
+    store = FingerprintStore(str(tmp_path / "fingerprints.json"))
+
+    # a failed run leaves the store untouched
+    p = Plot("fz", fingerprint_store=store, config_path=config_file)
+    p.freeze()
+    p.data = df
+    p.data = df
+    assert len(p._pending) == 1
+    with pytest.raises(NovemException):
+        p.run()
+    assert store.get(p._data_key()) is None
+
+    posted = []
+    requests_mock.register_uri(
+        "post", f"{api_root}vis/plots/fz/data", text=lambda request, context: posted.append(request.text) or ""
+    )
+    p = Plot("fz", fingerprint_store=store, config_path=config_file)
+    p.freeze()
+    p.data = df
+    p.run()
+    assert len(posted) == 1
+    assert store.get(p._data_key()) == fingerprint(df, {**p.csv_options, **p.downsample_options})
+
+    # queued data replaces what the store has, so the stored data is sent again
+    p = Plot("fz", fingerprint_store=store, config_path=config_file)
+    p.freeze()
+    p.data = df.assign(a=[3, 4])
+    p.data = df
+    assert p.data == df.to_csv()
+    p.run()
+    p.data = df
+    assert len(posted) == 2
+
+
+def test_failed_stream_forgets_the_last_upload(requests_mock, tmp_path):
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    api_root = _api_root(config_file)
+
+    requests_mock.register_uri("put", f"{api_root}vis/plots/st", text="")
+    requests_mock.register_uri("post", f"{api_root}vis/plots/st/data", text="")
+
+    df = pd.DataFrame({"a": [1, 2]})
+    store = FingerprintStore(str(tmp_path / "fingerprints.json"))
+    p = Plot("st", fingerprint_store=store, config_path=config_file)
+    p.data = df
+    assert store.get(p._data_key()) is not None
+
+    requests_mock.register_uri("post", f"{api_root}vis/plots/st/data", status_code=500, text="down")
+    with pytest.raises(NovemException):
+        p.data = iter([df.assign(a=[3, 4])])
+    # the server may hold part of the stream, so the same frame is sent again
+    assert store.get(p._data_key()) is None
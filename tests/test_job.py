@@ -1,18 +1,32 @@
+import base64
 import configparser
+import email
+import errno
+import gzip
+import hashlib
 import io
+import json
 import os
+import tarfile
+import threading
 from contextlib import redirect_stdout
 from functools import partial
 from unittest.mock import patch
 
 import pytest
-from requests import Response
+from requests import Response, Session
+from urllib3.fields import RequestField
+from urllib3.filepost import encode_multipart_formdata
 
-from novem import Job
+from novem import Job, JobRunner
 from novem.exceptions import Novem403, Novem404
 from novem.job import Job as _Job
+from novem.job.download import _expected_digest, download
+from novem.job.upload import ArchiveUpload, MultipartUpload
 from novem.utils import API_ROOT
 
+CONFIG_FILE = f"{os.path.dirname(os.path.abspath(__file__))}/test.conf"
+
 
 def test_job_ref(requests_mock):
     job_id = "test_job"
@@ -607,6 +621,17 @@ def _make_job(requests_mock, job_id="test_job"):
     return Job(job_id, config_path=config_file), api_root
 
 
+def _body_text(body):
+    """Decode a request body, draining it first if it was streamed."""
+    if body is None:
+        return ""
+    if isinstance(body, str):
+        return body
+    if not isinstance(body, bytes):
+        body = b"".join(body)
+    return body.decode("utf-8", errors="replace")
+
+
 def _make_shared_job(requests_mock, job_id="test_job", user="alice"):
     """Helper: create a Job pointed at another user's namespace, no create call."""
     base = os.path.dirname(os.path.abspath(__file__))
@@ -679,7 +704,7 @@ def test_job_run_with_files(requests_mock, tmp_path):
 
     def handler(request, context):
         captured["content_type"] = request.headers.get("Content-Type", "")
-        captured["body"] = request.body
+        captured["body"] = _body_text(request.body)
         return ""
 
     requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
@@ -688,11 +713,6 @@ def test_job_run_with_files(requests_mock, tmp_path):
 
     assert "multipart/form-data" in captured["content_type"]
     body = captured["body"]
-    # requests encodes multipart as bytes or PreparedRequest body
-    if isinstance(body, bytes):
-        body = body.decode("utf-8", errors="replace")
-    else:
-        body = str(body)
     # Filenames should be preserved in Content-Disposition headers
     assert "data.csv" in body
     assert "config.json" in body
@@ -733,7 +753,7 @@ def test_job_run_single_file(requests_mock, tmp_path):
 
     def handler(request, context):
         captured["content_type"] = request.headers.get("Content-Type", "")
-        captured["body"] = request.body
+        captured["body"] = _body_text(request.body)
         return ""
 
     requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
@@ -742,10 +762,6 @@ def test_job_run_single_file(requests_mock, tmp_path):
 
     assert "multipart/form-data" in captured["content_type"]
     body = captured["body"]
-    if isinstance(body, bytes):
-        body = body.decode("utf-8", errors="replace")
-    else:
-        body = str(body)
     assert "file_0" in body
     assert "report.xlsx" in body
 
@@ -786,7 +802,7 @@ def test_job_run_with_input_dir_preserves_subpaths(requests_mock, tmp_path):
 
     def handler(request, context):
         captured["content_type"] = request.headers.get("Content-Type", "")
-        captured["body"] = request.body
+        captured["body"] = _body_text(request.body)
         return ""
 
     requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
@@ -795,8 +811,6 @@ def test_job_run_with_input_dir_preserves_subpaths(requests_mock, tmp_path):
 
     assert "multipart/form-data" in captured["content_type"]
     body = captured["body"]
-    if isinstance(body, bytes):
-        body = body.decode("utf-8", errors="replace")
     # Relative path with forward slash must reach the wire
     assert "sub/nested.json" in body
     assert "top.csv" in body
@@ -818,7 +832,7 @@ def test_job_run_input_dir_skips_dotfiles(requests_mock, tmp_path):
     captured = {}
 
     def handler(request, context):
-        captured["body"] = request.body
+        captured["body"] = _body_text(request.body)
         return ""
 
     requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
@@ -826,8 +840,6 @@ def test_job_run_input_dir_skips_dotfiles(requests_mock, tmp_path):
     j.run(input_dir=str(indir))
 
     body = captured["body"]
-    if isinstance(body, bytes):
-        body = body.decode("utf-8", errors="replace")
     assert "data.csv" in body
     assert "sub/ok.json" in body
     # dotfiles and contents of hidden dirs must not appear
@@ -861,7 +873,7 @@ def test_job_run_files_override_input_dir(requests_mock, tmp_path, capsys):
     captured = {}
 
     def handler(request, context):
-        captured["body"] = request.body
+        captured["body"] = _body_text(request.body)
         return ""
 
     requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
@@ -869,8 +881,6 @@ def test_job_run_files_override_input_dir(requests_mock, tmp_path, capsys):
     j.run(files=[f"@{explicit}"], input_dir=str(indir))
 
     body = captured["body"]
-    if isinstance(body, bytes):
-        body = body.decode("utf-8", errors="replace")
     # Only the -R version's content should be present
     assert "from-R" in body
     assert "from-input" not in body
@@ -879,6 +889,183 @@ def test_job_run_files_override_input_dir(requests_mock, tmp_path, capsys):
     assert "overrides" in err
 
 
+# ---------------------------------------------------------------------------
+# streamed multipart body
+# ---------------------------------------------------------------------------
+
+
+def test_multipart_upload_matches_requests_encoding(tmp_path):
+    """MultipartUpload emits the same bytes requests/urllib3 would build in memory."""
+    a = tmp_path / "a.csv"
+    a.write_bytes(b"x,y\n" * 1000)
+    b = tmp_path / "b.bin"
+    b.write_bytes(bytes(range(256)))
+
+    body = MultipartUpload([("file_0", "sub/a.csv", str(a)), ("file_1", 'we"ird.bin', str(b))], block_size=100)
+
+    fields = []
+    for name, filename, data in [("file_0", "sub/a.csv", a.read_bytes()), ("file_1", 'we"ird.bin', b.read_bytes())]:
+        rf = RequestField(name=name, data=data, filename=filename)
+        rf.make_multipart(content_type=None)
+        fields.append(rf)
+    expected, _ = encode_multipart_formdata(fields, boundary=body.boundary)
+
+    streamed = b"".join(body)
+    assert streamed == expected
+    assert len(body) == len(expected)
+    assert body.content_type == f"multipart/form-data; boundary={body.boundary}"
+
+
+def test_job_run_streams_body_and_reports_progress(requests_mock, tmp_path):
+    """run() sends a streamed body with a Content-Length and reports progress."""
+    j, api_root = _make_job(requests_mock)
+
+    indir = tmp_path / "in"
+    indir.mkdir()
+    for n in range(5):
+        (indir / f"f{n}.dat").write_bytes(os.urandom(1024))
+
+    captured = {}
+
+    def handler(request, context):
+        captured["stream"] = request.body
+        captured["length"] = request.headers.get("Content-Length")
+        captured["body"] = b"".join(request.body)
+        return ""
+
+    requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
+
+    seen = []
+    j.run(input_dir=str(indir), progress=lambda sent, total: seen.append((sent, total)))
+
+    assert isinstance(captured["stream"], MultipartUpload)
+    assert int(captured["length"]) == len(captured["body"])
+    assert seen[-1] == (len(captured["body"]), len(captured["body"]))
+    assert [s for s, _ in seen] == sorted(s for s, _ in seen)
+    # the last part's handle is released once the body is drained
+    assert captured["stream"]._handle is None
+
+
+def test_job_run_closes_handles_on_error(requests_mock, tmp_path):
+    """A request that dies mid-body still releases the open input file."""
+    j, api_root = _make_job(requests_mock)
+    f1 = tmp_path / "big.dat"
+    f1.write_bytes(b"x" * 10_000)
+
+    captured = {}
+
+    def handler(request, context):
+        captured["stream"] = request.body
+        it = iter(request.body)
+        next(it)  # part header
+        next(it)  # first block: the file is now open
+        assert request.body._handle is not None
+        raise ConnectionError("link dropped")
+
+    requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
+
+    with pytest.raises(ConnectionError):
+        j.run(files=[f"@{f1}"])
+    assert isinstance(captured["stream"], MultipartUpload)
+    assert captured["stream"]._handle is None
+
+
+def _archive_part(body, content_type):
+    """The payload of the single part in a multipart body."""
+    msg = email.message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    (part,) = msg.get_payload()
+    return part.get_filename(), part.get_content_type(), part.get_payload(decode=True)
+
+
+def test_job_run_archive_tar_gz(requests_mock, tmp_path):
+    """run(archive="tar.gz") sends one compressed tarball with the usual skipping rules."""
+    j, api_root = _make_job(requests_mock)
+
+    indir = tmp_path / "in"
+    (indir / "sub").mkdir(parents=True)
+    (indir / ".git").mkdir()
+    (indir / "top.csv").write_text("x\n")
+    (indir / "sub" / "nested.json").write_text("{}")
+    (indir / ".secret").write_text("nope")
+    (indir / ".git" / "HEAD").write_text("ref")
+    big = os.urandom(700_000)
+    extra = tmp_path / "big.bin"
+    extra.write_bytes(big)
+
+    captured = {}
+
+    def handler(request, context):
+        captured["content_type"] = request.headers["Content-Type"]
+        captured["chunked"] = request.headers.get("Transfer-Encoding")
+        captured["body"] = b"".join(request.body)
+        return ""
+
+    requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
+
+    j.run(input_dir=str(indir), files=[f"@{extra}"], archive="tar.gz")
+
+    # size unknown up front: chunked transfer rather than a Content-Length
+    assert captured["chunked"] == "chunked"
+    filename, ctype, payload = _archive_part(captured["body"], captured["content_type"])
+    assert filename == "input.tar.gz"
+    assert ctype == "application/gzip"
+
+    with tarfile.open(fileobj=io.BytesIO(payload), mode="r:gz") as tar:
+        assert sorted(tar.getnames()) == ["big.bin", "sub/nested.json", "top.csv"]
+        assert tar.extractfile("sub/nested.json").read() == b"{}"
+        assert tar.extractfile("big.bin").read() == big
+
+
+def test_archive_upload_iterates_again(tmp_path):
+    """A second pass over the body (a retry or redirect) sends the whole archive again."""
+    f1 = tmp_path / "data.csv"
+    f1.write_bytes(os.urandom(300_000))
+    body = ArchiveUpload([("data.csv", str(f1))], "tar.gz", block_size=65536)
+
+    first = b"".join(body)
+    second = b"".join(body)
+    payloads = [_archive_part(raw, body.content_type)[2] for raw in (first, second)]
+    for payload in payloads:
+        with tarfile.open(fileobj=io.BytesIO(payload), mode="r:gz") as tar:
+            assert tar.extractfile("data.csv").read() == f1.read_bytes()
+    assert payloads[0] == payloads[1]
+
+
+def test_job_run_archive_tar_zst(requests_mock, tmp_path):
+    """run(archive="tar.zst") compresses with zstd when a backend is available."""
+    zstd = pytest.importorskip("zstandard")
+    j, api_root = _make_job(requests_mock)
+
+    f1 = tmp_path / "data.csv"
+    f1.write_text("a,b\n1,2\n")
+
+    captured = {}
+
+    def handler(request, context):
+        captured["content_type"] = request.headers["Content-Type"]
+        captured["body"] = b"".join(request.body)
+        return ""
+
+    requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text=handler)
+
+    j.run(files=[f"@{f1}"], archive="tar.zst")
+
+    filename, _, payload = _archive_part(captured["body"], captured["content_type"])
+    assert filename == "input.tar.zst"
+    raw = zstd.ZstdDecompressor().decompressobj().decompress(payload)
+    with tarfile.open(fileobj=io.BytesIO(raw)) as tar:
+        assert tar.extractfile("data.csv").read() == b"a,b\n1,2\n"
+
+
+def test_job_run_archive_unknown_format(requests_mock, tmp_path):
+    """run() exits on an archive format it cannot produce."""
+    j, api_root = _make_job(requests_mock)
+    requests_mock.register_uri("post", f"{api_root}code/jobs/{j.id}/data", text="")
+
+    with pytest.raises(SystemExit):
+        j.run(input_dir=str(tmp_path), archive="zip")
+
+
 # ---------------------------------------------------------------------------
 # run() output tests (-o)
 # ---------------------------------------------------------------------------
@@ -979,6 +1166,324 @@ def test_job_run_output_creates_dir(requests_mock, tmp_path):
     assert os.path.isfile(os.path.join(out_dir, "out.txt"))
 
 
+class _BrokenBody(io.BytesIO):
+    """A response body whose connection drops after ``cut`` bytes."""
+
+    def __init__(self, data, cut):
+        super().__init__(data[:cut])
+
+    def read(self, *args, **kwargs):
+        block = super().read(*args, **kwargs)
+        if not block:
+            raise ConnectionResetError("connection reset by peer")
+        return block
+
+    read1 = read
+
+
+def _digest_header(data):
+    return f"sha-256=:{base64.b64encode(hashlib.sha256(data).digest()).decode()}:"
+
+
+def test_job_run_output_resumes_interrupted_download(requests_mock, tmp_path):
+    """A dropped download is picked up with a Range request, not a new run."""
+    j, api_root = _make_job(requests_mock)
+    out_dir = str(tmp_path / "out")
+    data = os.urandom(300_000)
+    artefact = f"{api_root}code/jobs/{j.id}/runs/1/output"
+
+    requests_mock.register_uri(
+        "post",
+        f"{api_root}code/jobs/{j.id}/data",
+        body=_BrokenBody(data, 100_000),
+        headers={
+            "Content-Disposition": 'attachment; filename="out.bin"',
+            "Content-Length": str(len(data)),
+            "Content-Location": artefact,
+            "Accept-Ranges": "bytes",
+            "ETag": '"v1"',
+            "Repr-Digest": _digest_header(data),
+        },
+    )
+    resume = requests_mock.register_uri(
+        "get",
+        artefact,
+        status_code=206,
+        content=data[100_000:],
+        headers={"Content-Range": f"bytes 100000-{len(data) - 1}/{len(data)}"},
+    )
+    seen = []
+
+    j.run(output=out_dir, download_progress=lambda done, total: seen.append((done, total)))
+
+    assert open(os.path.join(out_dir, "out.bin"), "rb").read() == data
+    assert resume.last_request.headers["Range"] == "bytes=100000-"
+    assert resume.last_request.headers["If-Range"] == '"v1"'
+    assert j.last_download.resumed == 1
+    assert j.last_download.verified == "sha-256"
+    assert j.last_download.bytes == len(data)
+    assert seen[-1] == (len(data), len(data))
+    assert [d for d, _ in seen] == sorted(d for d, _ in seen)
+
+
+def test_job_run_output_restarts_when_artefact_changed(requests_mock, tmp_path):
+    """A 200 to the resume request (If-Range mismatch) rewrites the file from scratch."""
+    j, api_root = _make_job(requests_mock)
+    out_dir = str(tmp_path / "out")
+    data = b"x" * 50_000
+    artefact = f"{api_root}code/jobs/{j.id}/runs/1/output"
+
+    requests_mock.register_uri(
+        "post",
+        f"{api_root}code/jobs/{j.id}/data",
+        body=_BrokenBody(b"stale" * 10_000, 20_000),
+        headers={
+            "Content-Disposition": 'attachment; filename="out.bin"',
+            "Content-Length": str(len(data)),
+            "Content-Location": artefact,
+            "Accept-Ranges": "bytes",
+        },
+    )
+    requests_mock.register_uri("get", artefact, content=data)
+
+    j.run(output=out_dir)
+
+    assert open(os.path.join(out_dir, "out.bin"), "rb").read() == data
+
+
+def test_job_run_output_restart_checks_the_new_artefact(requests_mock, tmp_path):
+    """After a restart the length and digest come from the new response."""
+    j, api_root = _make_job(requests_mock)
+    out_dir = str(tmp_path / "out")
+    stale = b"stale" * 12_000
+    data = b"fresh" * 8_000
+    artefact = f"{api_root}code/jobs/{j.id}/runs/1/output"
+
+    requests_mock.register_uri(
+        "post",
+        f"{api_root}code/jobs/{j.id}/data",
+        body=_BrokenBody(stale, 20_000),
+        headers={
+            "Content-Disposition": 'attachment; filename="out.bin"',
+            "Content-Length": str(len(stale)),
+            "Content-Location": artefact,
+            "Accept-Ranges": "bytes",
+            "ETag": '"v1"',
+            "Repr-Digest": _digest_header(stale),
+        },
+    )
+    requests_mock.register_uri(
+        "get",
+        artefact,
+        content=data,
+        headers={"Content-Length": str(len(data)), "ETag": '"v2"', "Repr-Digest": _digest_header(data)},
+    )
+
+    j.run(output=out_dir)
+
+    assert open(os.path.join(out_dir, "out.bin"), "rb").read() == data
+    assert j.last_download.resumed == 1
+    assert j.last_download.verified == "sha-256"
+
+
+def test_job_run_output_gzip_encoded(requests_mock, tmp_path):
+    """A gzip-encoded body is written decoded; its length and digest cover the encoded bytes."""
+    j, api_root = _make_job(requests_mock)
+    data = b"novem " * 20_000
+    encoded = gzip.compress(data)
+
+    requests_mock.register_uri(
+        "post",
+        f"{api_root}code/jobs/{j.id}/data",
+        body=io.BytesIO(encoded),
+        headers={
+            "Content-Disposition": 'attachment; filename="out.txt"',
+            "Content-Encoding": "gzip",
+            "Content-Length": str(len(encoded)),
+            "Repr-Digest": _digest_header(encoded),
+        },
+    )
+
+    j.run(output=str(tmp_path / "out"))
+
+    assert (tmp_path / "out" / "out.txt").read_bytes() == data
+    assert j.last_download.bytes == len(data)
+    assert j.last_download.verified is None
+
+
+def test_job_run_output_not_resumable_fails(requests_mock, tmp_path, capsys):
+    """Without Content-Location the download cannot resume and run() reports it."""
+    j, api_root = _make_job(requests_mock)
+    data = b"y" * 10_000
+
+    requests_mock.register_uri(
+        "post",
+        f"{api_root}code/jobs/{j.id}/data",
+        body=_BrokenBody(data, 4_000),
+        headers={"Content-Length": str(len(data)), "Accept-Ranges": "bytes"},
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        j.run(output=str(tmp_path / "out"))
+
+    assert exc.value.code == 1
+    assert "download interrupted after 4000 bytes" in capsys.readouterr().out
+
+
+def test_job_run_output_digest_mismatch_fails(requests_mock, tmp_path, capsys):
+    """A body that does not match the advertised digest is an error."""
+    j, api_root = _make_job(requests_mock)
+
+    requests_mock.register_uri(
+        "post",
+        f"{api_root}code/jobs/{j.id}/data",
+        content=b"tampered",
+        headers={"Repr-Digest": _digest_header(b"original")},
+    )
+
+    with pytest.raises(SystemExit):
+        j.run(output=str(tmp_path / "out"))
+
+    assert "sha-256 verification" in capsys.readouterr().out
+
+
+class _FullDisk(io.BytesIO):
+    def write(self, block):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+def test_download_write_errors_are_not_resumed(requests_mock):
+    """A failing local write propagates instead of triggering a Range resume."""
+    url = "https://example.com/artefact"
+    requests_mock.register_uri(
+        "get",
+        url,
+        content=b"z" * 1000,
+        headers={"Content-Length": "1000", "Content-Location": url, "Accept-Ranges": "bytes"},
+    )
+    session = Session()
+    r = session.get(url, stream=True)
+
+    with pytest.raises(OSError, match="No space left"):
+        download(session, r, _FullDisk())
+    assert requests_mock.call_count == 1
+
+
+def test_download_prefers_strongest_digest():
+    headers = {
+        "Content-MD5": base64.b64encode(hashlib.md5(b"a").digest()).decode(),
+        "Digest": f"SHA-256={base64.b64encode(hashlib.sha256(b'a').digest()).decode()}",
+    }
+    assert _expected_digest(headers) == ("sha-256", hashlib.sha256(b"a").digest())
+    assert _expected_digest({}) is None
+
+
+# ---------------------------------------------------------------------------
+# JobRunner
+# ---------------------------------------------------------------------------
+
+
+def test_job_runner_runs_jobs_concurrently(monkeypatch):
+    """max_workers runs are in flight at the same time."""
+    names = ["a", "b", "c"]
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def fake_run(self, **kwargs):
+        barrier.wait()  # only passes if every job is running at once
+        return None
+
+    monkeypatch.setattr(_Job, "_run", fake_run)
+    results = JobRunner([_Job(n, create=False, config_path=CONFIG_FILE) for n in names], max_workers=3).run()
+    assert [(r.job, r.ok) for r in results] == [(n, True) for n in names]
+
+
+def test_job_runner_per_job_inputs_outputs_and_manifest(requests_mock, tmp_path):
+    """Each job gets its own inputs and output folder; a manifest sums it up."""
+    api_root = _make_job(requests_mock)[1]
+    names = ["a", "b", "c"]
+    seen = {}
+
+    for name in names:
+        (tmp_path / "in" / name).mkdir(parents=True)
+        (tmp_path / "in" / name / f"{name}.csv").write_text(name)
+
+        def handler(request, context, name=name):
+            seen[name] = _body_text(request.body)
+            context.headers["Content-Disposition"] = f'attachment; filename="{name}.out"'
+            return f"result {name}"
+
+        requests_mock.register_uri("post", f"{api_root}code/jobs/{name}/data", text=handler)
+
+    out = tmp_path / "out"
+    finished = []
+    runner = JobRunner(
+        names,
+        input_dir=str(tmp_path / "in" / "{job}"),
+        output_dir=str(out),
+        on_result=lambda r: finished.append(r.job),
+        config_path=CONFIG_FILE,
+    )
+    results = runner.run()
+
+    assert [r.job for r in results] == names
+    assert runner.ok and all(r.ok for r in results)
+    assert sorted(finished) == names
+    for name, result in zip(names, results):
+        assert f'filename="{name}.csv"' in seen[name]
+        assert result.output == str(out / name / f"{name}.out")
+        assert open(result.output).read() == f"result {name}"
+
+    manifest = json.loads((out / "manifest.json").read_text())
+    assert manifest["ok"] is True
+    assert [j["job"] for j in manifest["jobs"]] == names
+    assert all(j["seconds"] >= 0 and j["started"] and j["finished"] for j in manifest["jobs"])
+
+
+def test_job_runner_rejects_repeated_names_with_output_dir(tmp_path):
+    """Two runs of one job would write to the same output folder."""
+    with pytest.raises(ValueError, match="repeated: a"):
+        JobRunner(["a", "b", "a"], output_dir=str(tmp_path), config_path=CONFIG_FILE)
+    with pytest.raises(ValueError, match="repeated: b"):
+        JobRunner(["b", _Job("b", create=False, config_path=CONFIG_FILE)], output_dir=str(tmp_path))
+    # without outputs a job may run more than once
+    assert len(JobRunner(["a", "a"], config_path=CONFIG_FILE).jobs) == 2
+
+
+def test_job_runner_collects_failures_without_exiting(requests_mock, tmp_path):
+    """A failed run is recorded in its result instead of exiting the process."""
+    api_root = _make_job(requests_mock)[1]
+    requests_mock.register_uri("post", f"{api_root}code/jobs/good/data", text="")
+    requests_mock.register_uri(
+        "post", f"{api_root}code/jobs/bad/data", json={"error": "quota exceeded"}, status_code=402
+    )
+
+    runner = JobRunner(["good", "bad"], config_path=CONFIG_FILE)
+    good, bad = runner.run()
+
+    assert good.ok and good.error is None
+    assert not bad.ok and bad.error == "quota exceeded"
+    assert not runner.ok
+
+
+def test_job_runner_reports_error_bodies_that_are_not_objects(requests_mock):
+    """A JSON error body without an error field is reported as text."""
+    api_root = _make_job(requests_mock)[1]
+    requests_mock.register_uri("post", f"{api_root}code/jobs/a/data", text="500", status_code=500)
+    requests_mock.register_uri("post", f"{api_root}code/jobs/b/data", text='"busy"', status_code=503)
+
+    a, b = JobRunner(["a", "b"], config_path=CONFIG_FILE).run()
+    assert (a.ok, a.error) == (False, "500")
+    assert (b.ok, b.error) == (False, '"busy"')
+
+
+def test_job_runner_reports_missing_inputs(requests_mock):
+    """Input errors that would exit Job.run become per-job errors."""
+    _make_job(requests_mock)
+    (result,) = JobRunner(["a"], input_dir="/nope/{job}", config_path=CONFIG_FILE).run()
+    assert not result.ok
+    assert "input directory not found: /nope/a" in result.error
+
+
 # ---------------------------------------------------------------------------
 # _parse_filename / _dedup_path unit tests
 # ---------------------------------------------------------------------------
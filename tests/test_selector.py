@@ -3,6 +3,8 @@ import os
 import pandas as pd
 
 from novem.table import Selector as S
+from novem.table import SelectorSet
+from novem.table.selector import compress_positions
 
 # from novem.colors import StaticColor as SC,
 # UseDataset as _
@@ -33,7 +35,7 @@ def test_dataframe_selector():
 
     # tst rows selectors
     for f in flt:
-        ixs = ",".join([str(x + 1) for x in df[f].index.values])
+        ixs = compress_positions(df[f].index.values + 1)
         inst = str(S(df[f], "", df))
         # assert our index instructions match
         assert inst.split(" ")[0] == ixs
@@ -41,8 +43,8 @@ def test_dataframe_selector():
     # test our column selectors
     test = [
         [df.loc[:, ["NAV", "YTD"]], "2,7"],
-        [df.loc[:, "NAV":], "2,3,4,5,6,7,8"],
-        [df.loc[:, :], "1,2,3,4,5,6,7,8"],
+        [df.loc[:, "NAV":], "2:8"],
+        [df.loc[:, :], "1:8"],
     ]
 
     for t in test:
@@ -52,8 +54,8 @@ def test_dataframe_selector():
     # test our combined selectors
     cmb = [
         [df.loc[df.level == 1, ["NAV", "YTD"]], "2,7"],
-        [df.loc[df.level == 2, "NAV":], "2,3,4,5,6,7,8"],
-        [df.loc[df.level == 3, :], "1,2,3,4,5,6,7,8"],
+        [df.loc[df.level == 2, "NAV":], "2:8"],
+        [df.loc[df.level == 3, :], "1:8"],
     ]
 
     for c in cmb:
@@ -63,7 +65,7 @@ def test_dataframe_selector():
         inst = str(S(cf, "", df))
         cand = " ".join(inst.split(" ")[:2])
 
-        ixs = ",".join([str(x + 1) for x in cf.index.values])
+        ixs = compress_positions(cf.index.values + 1)
 
         # assert combined instructions match
         assert cand == f"{ixs} {cxs}"
@@ -93,8 +95,8 @@ def test_dataframe_selector():
     # test our c offset
     test = [
         [df.loc[:, ["NAV", "YTD"]], 1, "3,8"],
-        [df.loc[:, "NAV":], -1, "1,2,3,4,5,6,7"],
-        [df.loc[:, :], -2, "0,1,2,3,4,5,6"],
+        [df.loc[:, "NAV":], -1, "1:7"],
+        [df.loc[:, :], -2, "0:6"],
     ]
 
     for t in test:
@@ -103,9 +105,9 @@ def test_dataframe_selector():
 
     # test our i offset
     test = [
-        [df.loc[1:5, ["NAV", "YTD"]], 1, "3,4,5,6,7"],
-        [df.loc[5:10, "NAV":], -1, "5,6,7,8,9,10"],
-        [df.loc[4:10, :], -2, "3,4,5,6,7,8,9"],
+        [df.loc[1:5, ["NAV", "YTD"]], 1, "3:7"],
+        [df.loc[5:10, "NAV":], -1, "5:10"],
+        [df.loc[4:10, :], -2, "3:9"],
     ]
 
     for t in test:
@@ -115,8 +117,8 @@ def test_dataframe_selector():
     # test our c offset range
     test = [
         [df.loc[:, ["NAV", "YTD"]], 1, "2,7,8"],
-        [df.loc[:, :"QTD"], -1, "0,1,2,3,4,5,6"],
-        [df.loc[:, "WTD":"QTD"], -2, "2,3,4,5,6"],
+        [df.loc[:, :"QTD"], -1, "0:6"],
+        [df.loc[:, "WTD":"QTD"], -2, "2:6"],
     ]
 
     for t in test:
@@ -125,9 +127,9 @@ def test_dataframe_selector():
 
     # test our i offset range
     test = [
-        [df.loc[1:5, ["NAV", "YTD"]], 1, "2,3,4,5,6,7"],
-        [df.loc[5:10, "NAV":], -1, "5,6,7,8,9,10,11"],
-        [df.loc[4:10, :], -2, "3,4,5,6,7,8,9,10,11"],
+        [df.loc[1:5, ["NAV", "YTD"]], 1, "2:7"],
+        [df.loc[5:10, "NAV":], -1, "5:11"],
+        [df.loc[4:10, :], -2, "3:11"],
     ]
 
     for t in test:
@@ -144,11 +146,11 @@ def test_2d_selector():
 
     df = pd.DataFrame(data, index=["AAA", "BBB", "CCC", "DDD"])
     format = S(df.iloc[:, :], ",.1%", r=df).get_selector_string()
-    assert format == "1,2,3,4 1,2,3"
+    assert format == "1:4 1:3"
 
     df = df.transpose()
     format = S(df.iloc[:, :], ",.1%", r=df).get_selector_string()
-    assert format == "1,2,3 1,2,3,4"
+    assert format == "1:3 1:4"
 
 
 def test_empty_selector():
@@ -180,7 +182,7 @@ def test_empty_selector():
     # But should honor explicit i override
     sel_with_i = S(empty_df, "test", r=df, i=":")
     result_with_i = sel_with_i.get_selector_string()
-    assert result_with_i == ": 1,2,3"
+    assert result_with_i == ": 1:3"
 
     # Same logic applies to columns - empty columns without c override returns ""
     empty_cols_df = df.loc[:, []]  # No columns
@@ -190,4 +192,75 @@ def test_empty_selector():
     # But should honor explicit c override
     sel_with_c_override = S(empty_cols_df, "test", r=df, c=":")
     result_with_c = sel_with_c_override.get_selector_string()
-    assert result_with_c == "1,2,3 :"
+    assert result_with_c == "1:3 :"
+
+
+def test_duplicate_labels_resolve_in_order():
+    """
+    The n-th occurrence of a repeated label maps to the n-th row carrying it
+    in the reference frame, whether or not the index is sorted
+    """
+    df = pd.DataFrame({"A": range(6)}, index=["b", "a", "b", "c", "a", "b"])
+
+    # b, c, a, b resolve to the first b, the c, the first a and the second b
+    assert S(df[df.A > 1], "", r=df).get_selector_string() == "1,4,2,3 1"
+    assert S(df.loc[["a"]], "", r=df).get_selector_string() == "2,5 1"
+    # more occurrences than the frame holds are dropped
+    doubled = pd.concat([df.loc[["c"]], df.loc[["c"]]])
+    assert S(doubled, "", r=df).get_selector_string() == "4 1"
+
+    ordered = df.sort_index()
+    assert S(ordered.loc[["b"]], "", r=ordered).get_selector_string() == "3:5 1"
+
+    # labels the frame does not carry still fail like get_loc
+    try:
+        S(pd.DataFrame({"A": [1]}, index=["z"]), "", r=df).get_selector_string()
+        raise AssertionError("expected a KeyError")
+    except KeyError:
+        pass
+
+
+def test_compact_ranges():
+    """
+    Consecutive runs of three or more positions are written as ranges,
+    unless compact is switched off
+    """
+    assert compress_positions([1, 2, 3, 4, 9, 6, 7]) == "1:4,9,6,7"
+    assert compress_positions([5, 4, 3]) == "5,4,3"
+    assert compress_positions([0]) == "0"
+    assert compress_positions([]) == ""
+
+    df = pd.DataFrame({"A": range(100), "B": range(100), "C": range(100)})
+    flt = df.loc[(df.A < 40) | (df.A >= 60), ["A", "C"]]
+    assert S(flt, "", r=df).get_selector_string() == "1:40,61:100 1,3"
+    plain = S(flt, "", r=df, compact=False).get_selector_string()
+    assert plain == ",".join(str(x + 1) for x in flt.index) + " 1,3"
+
+
+def test_selector_set():
+    cpath = os.path.abspath(os.path.dirname(__file__))
+    df = pd.read_csv(f"{cpath}/files/hier.csv")
+
+    ss = SelectorSet(df)
+    ss.add("align", df.loc[:, "NAV":], ">")
+    ss.add("align", df.loc[:, ["level"]], "<", compact=False)
+    ss.add("format", df.loc[df.level == 1, ["NAV", "YTD"]], ",.1%")
+    ss.add("format", df[df.level > 10], ",.0f")  # nothing selected
+    ss.add("border", ": 0", "l 1 gray-300")
+
+    # the same lines the selectors produce on their own
+    align = [str(S(df.loc[:, "NAV":], ">", r=df)), str(S(df.loc[:, ["level"]], "<", r=df, compact=False))]
+    assert ss.get_config("align") == "\n".join(align)
+    assert ss.get_config("format") == str(S(df.loc[df.level == 1, ["NAV", "YTD"]], ",.1%", r=df))
+    assert ss.get_configs() == {
+        "align": ss.get_config("align"),
+        "format": ss.get_config("format"),
+        "border": ": 0 l 1 gray-300",
+    }
+    assert ss.get_config("width") == ""
+
+    try:
+        ss.add("colour", ": :", "red")
+        raise AssertionError("expected a ValueError")
+    except ValueError:
+        pass
@@ -0,0 +1,198 @@
+import configparser
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from novem import Plot
+from novem.vis.serialize import is_chunked, stream_csv, to_csv
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {"f": [1.23456, 2.0, np.nan], "n": [1, 2, 3], "s": ["a", "b,c", None]},
+        index=pd.date_range("2020-01-01", periods=3, name="day"),
+    )
+
+
+def test_pandas_engine_matches_to_csv(frame):
+    # the default payload is DataFrame.to_csv's, whether pyarrow is installed or not
+    mixed = pd.DataFrame(
+        {"a": [0.1, 1.0], "b": [True, False], "s": ["x", "y"], "t": pd.to_datetime(["2024-01-01 10:00:00.5", None])}
+    )
+    assert to_csv(mixed) == mixed.to_csv()
+    assert to_csv(frame) == frame.to_csv()
+    assert to_csv(frame, engine="pandas") == frame.to_csv()
+    assert to_csv(frame["f"], engine="pandas") == frame["f"].to_csv()
+    assert to_csv(frame, 2, "%d.%m.%Y", index=False, engine="pandas") == ('f,n,s\n1.23,1,a\n2.00,2,"b,c"\n,3,\n')
+    assert to_csv(frame.reset_index(), date_format="%Y", index=False, engine="pandas").splitlines()[1] == (
+        "2020,1.23456,1,a"
+    )
+
+
+def test_other_inputs():
+    assert to_csv("a,b\n1,2\n") == "a,b\n1,2\n"
+    assert to_csv(np.arange(4).reshape(2, 2)) == "0,1\n0,1\n2,3\n"
+    assert to_csv(np.array([1.25, 2.5]), float_precision=1) == "0\n1.2\n2.5\n"
+
+    class Custom:
+        def to_csv(self):
+            return "x\n1\n"
+
+    assert to_csv(Custom()) == "x\n1\n"
+    assert to_csv(42) == "42"
+
+    with pytest.raises(ValueError, match="engine must be one of"):
+        to_csv(pd.DataFrame(), engine="fast")
+    with pytest.raises(ValueError, match="dimensional"):
+        to_csv(np.zeros((2, 2, 2)))
+
+
+def test_pyarrow_engine(frame):
+    pytest.importorskip("pyarrow")
+
+    parsed = pd.read_csv(pd.io.common.StringIO(to_csv(frame, engine="pyarrow")), index_col=0, parse_dates=True)
+    pd.testing.assert_frame_equal(parsed, frame, check_freq=False)
+
+    rounded = to_csv(frame, 2, "%d.%m.%Y", engine="pyarrow").splitlines()
+    assert rounded[0] == '"day","f","n","s"'
+    assert rounded[1] == '"01.01.2020",1.23,1,"a"'
+
+    # frames arrow cannot hold are written by pandas
+    wide = pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([("a", "x"), ("a", "y")]))
+    assert to_csv(wide, engine="pyarrow") == wide.to_csv()
+
+    # %S in a date_format is whole seconds, as with pandas
+    times = pd.DataFrame({"t": pd.to_datetime(["2024-01-01 10:00:00.5"])})
+    assert to_csv(times, date_format="%H:%M:%S", index=False, engine="pyarrow") == '"t"\n"10:00:00"\n'
+
+
+def test_plot_serialization_options(requests_mock, frame):
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    api_root = config["general"]["api_root"]
+
+    posted = []
+    requests_mock.register_uri("put", f"{api_root}vis/plots/p", text="")
+    requests_mock.register_uri(
+        "post", f"{api_root}vis/plots/p/data", text=lambda request, context: posted.append(request.text) or ""
+    )
+
+    p = Plot("p", float_precision=1, index=False, config_path=config_file)
+    p.data = frame[["f", "n"]]
+    p(frame[["f"]], float_precision=3)
+
+    assert posted == [
+        to_csv(frame[["f", "n"]], float_precision=1, index=False),
+        to_csv(frame[["f"]], float_precision=3, index=False),
+    ]
+    assert p.csv_options["float_precision"] == 1
+
+
+def test_stream_csv_matches_to_csv(frame, tmp_path):
+    chunks = [frame.iloc[i : i + 1] for i in range(len(frame))]
+    # a stream always writes times, a later chunk may have one
+    assert b"".join(stream_csv(iter(chunks), block_size=1)).decode() == to_csv(frame, date_format="%Y-%m-%d %H:%M:%S")
+    assert len(list(stream_csv(iter(chunks), block_size=1))) == 3
+    assert len(list(stream_csv(iter(chunks)))) == 1
+    assert to_csv(frame, header=False, engine="pandas") == frame.to_csv(header=False)
+
+    path = tmp_path / "big.csv"
+    big = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) / 3})
+    big.to_csv(path, index=False)
+    with pd.read_csv(path, chunksize=128) as reader:
+        assert b"".join(stream_csv(reader, index=False)).decode() == to_csv(pd.read_csv(path), index=False)
+
+    rows = [[("a", "b")], [(1, "x,y"), (2, None)]]
+    assert b"".join(stream_csv(iter(rows))) == b'a,b\n1,"x,y"\n2,\n'
+    assert b"".join(stream_csv(iter(["a\n", b"1\n"]))) == b"a\n1\n"
+
+    assert is_chunked(iter([])) and is_chunked([frame, frame]) and is_chunked(rows)
+    assert not is_chunked([]) and not is_chunked(rows[1]) and not is_chunked(frame)
+    assert to_csv(rows[1]) == '1,"x,y"\n2,\n'
+    with pytest.raises(TypeError, match="list of int"):
+        to_csv([1, 2])
+
+
+def test_stream_csv_from_a_cursor():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("create table t (a integer, b text)")
+    conn.executemany("insert into t values (?, ?)", [(1, "xy"), (2, "z,w")])
+
+    # iterating a cursor yields one row at a time
+    cursor = conn.execute("select a, b from t order by a")
+    assert is_chunked(cursor)
+    assert b"".join(stream_csv(cursor)) == b'1,xy\n2,"z,w"\n'
+    assert b"".join(stream_csv(conn.execute("select b from t order by a"))) == b'xy\n"z,w"\n'
+
+    cursor = conn.execute("select a, b from t order by a")
+    batches = iter(lambda: cursor.fetchmany(1), [])
+    assert b"".join(stream_csv(batches)) == b'1,xy\n2,"z,w"\n'
+
+
+def test_stream_csv_keeps_the_first_chunks_format():
+    days = pd.DataFrame({"t": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+    times = pd.DataFrame({"t": pd.to_datetime(["2024-01-03 10:00", "2024-01-04 00:00"])}, index=[2, 3])
+    fraction = pd.DataFrame({"t": pd.to_datetime(["2024-01-03 10:00:00.5"])})
+
+    # midnight alone in the first chunk does not drop later times
+    out = b"".join(stream_csv([days, times])).decode().splitlines()
+    assert out[1:] == [
+        "0,2024-01-01 00:00:00",
+        "1,2024-01-02 00:00:00",
+        "2,2024-01-03 10:00:00",
+        "3,2024-01-04 00:00:00",
+    ]
+    assert b"".join(stream_csv([fraction, days])).decode().splitlines()[1:] == [
+        "0,2024-01-03 10:00:00.500000",
+        "0,2024-01-01 00:00:00.000000",
+        "1,2024-01-02 00:00:00.000000",
+    ]
+    assert b"".join(stream_csv([days, times], date_format="%d")).decode() == ",t\n0,01\n1,02\n2,03\n3,04\n"
+
+    pytest.importorskip("pyarrow")
+    wide = pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([("a", "x"), ("a", "y")]))
+    assert b"".join(stream_csv([wide, wide], engine="pyarrow")) == (wide.to_csv() + wide.to_csv(header=False)).encode()
+    with pytest.raises(ValueError, match="chunk 1 cannot be written with the pyarrow engine"):
+        b"".join(stream_csv([days, wide], engine="pyarrow"))
+
+
+def test_plot_streams_iterators(requests_mock, frame):
+    base = os.path.dirname(os.path.abspath(__file__))
+    config_file = f"{base}/test.conf"
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    api_root = config["general"]["api_root"]
+
+    posted = []
+
+    def capture(request, context):
+        body = request.body if isinstance(request.body, bytes) else b"".join(request.body)
+        posted.append((request.headers.get("Transfer-Encoding"), body.decode()))
+        return ""
+
+    requests_mock.register_uri("put", f"{api_root}vis/plots/s", text="")
+    requests_mock.register_uri("post", f"{api_root}vis/plots/s/data", text=capture)
+
+    p = Plot("s", index=False, skip_unchanged=True, config_path=config_file)
+    p.data = frame
+    p.data = (frame.iloc[i : i + 2] for i in range(0, len(frame), 2))
+    # the stream replaced the data, so the frame is sent again
+    p.data = frame
+    assert [encoding for encoding, _ in posted] == [None, "chunked", None]
+    assert {body for _, body in posted} == {to_csv(frame, index=False)}
+
+    # lists of chunks stream too
+    p.data = [frame.iloc[:1], frame.iloc[1:]]
+    assert posted[-1] == ("chunked", to_csv(frame, index=False))
+
+    p.freeze()
+    p.data = iter([frame])
+    assert p.data == to_csv(frame, index=False)
+    p.run()
+    assert posted[-1] == (None, to_csv(frame, index=False))
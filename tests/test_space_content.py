@@ -1,6 +1,7 @@
 """Library tests for the native space content API (Space.content)."""
 
 import configparser
+import hashlib
 import json
 import os
 
@@ -223,6 +224,72 @@ def test_write_conflict_raises(requests_mock):
         s.content.write("state.json", "{}", if_match="stale")
 
 
+def test_write_skip_if_unchanged_uses_one_listing_per_folder(requests_mock):
+    s, base = _space(requests_mock)
+    same = b"a,b\n1,2\n"
+    listing = requests_mock.register_uri(
+        "get",
+        f"{base}/reports",
+        json=[
+            {"name": "q3.csv", "type": "file", "ETag": hashlib.sha1(same).hexdigest()},
+            {"name": "q4.csv", "type": "file", "ETag": hashlib.sha1(b"old").hexdigest()},
+        ],
+    )
+    puts = []
+
+    def on_put(request, context):
+        puts.append(request.url.rsplit("/", 1)[-1])
+        context.status_code = 201
+        return ""
+
+    requests_mock.register_uri("put", f"{base}/reports/q3.csv", text=on_put)
+    requests_mock.register_uri("put", f"{base}/reports/q4.csv", text=on_put)
+    requests_mock.register_uri("put", f"{base}/reports/q5.csv", text=on_put)
+
+    assert s.content.write("reports/q3.csv", same.decode(), skip_if_unchanged=True) is False
+    assert s.content.write_bytes("reports/q4.csv", b"new", skip_if_unchanged=True) is True
+    assert s.content.write("reports/q5.csv", "fresh", skip_if_unchanged=True) is True
+    assert puts == ["q4.csv", "q5.csv"]
+    assert listing.call_count == 1
+
+    # without the flag the body is always sent
+    assert s.content.write("reports/q3.csv", same.decode()) is True
+    assert puts[-1] == "q3.csv"
+
+
+def test_write_skip_if_unchanged_still_checks_preconditions(requests_mock):
+    s, base = _space(requests_mock)
+    same = b"{}"
+    requests_mock.register_uri(
+        "get", base, json=[{"name": "state.json", "type": "file", "ETag": hashlib.sha1(same).hexdigest()}]
+    )
+    requests_mock.register_uri("put", f"{base}/state.json", status_code=412, json={"message": "precondition failed"})
+
+    # an unchanged body is not a reason to skip a stale If-Match
+    with pytest.raises(NovemException, match="precondition failed"):
+        s.content.write("state.json", "{}", if_match="stale", skip_if_unchanged=True)
+    with pytest.raises(NovemException, match="precondition failed"):
+        s.content.write("state.json", "{}", no_clobber=True, skip_if_unchanged=True)
+    assert s.content.write("state.json", "{}", skip_if_unchanged=True) is False
+
+
+def test_write_skip_if_unchanged_tracks_own_writes(requests_mock):
+    s, base = _space(requests_mock)
+    requests_mock.register_uri("get", f"{base}/new", status_code=404)
+    etag = '"d3b07384d113edec49eaa6238ad5ff00"'  # md5 of "foo\n"
+    put = requests_mock.register_uri("put", f"{base}/new/a.txt", status_code=201, headers={"ETag": etag})
+
+    # a missing folder means a missing file: upload
+    assert s.content.write("new/a.txt", "foo\n", skip_if_unchanged=True) is True
+    # the PUT's ETag updates the cached listing, so a repeat is skipped
+    assert s.content.write("new/a.txt", "foo\n", skip_if_unchanged=True) is False
+    assert put.call_count == 1
+
+    s.content.clear_cache()
+    assert s.content.write("new/a.txt", "foo\n", skip_if_unchanged=True) is True
+    assert put.call_count == 2
+
+
 def test_write_rejects_folder_path(requests_mock):
     s, base = _space(requests_mock)
     with pytest.raises(NovemException, match="mkdir"):
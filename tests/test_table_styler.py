@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from novem.colors import StaticColor as SC
+from novem.table import Selector as S
+from novem.table import compile_ctx, compile_masks, compile_styler
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"A": [1, -2, 3, -4, -5], "B": [4, -5, 6, -7, -8], "C": [1, 1, 1, 1, 1]})
+
+
+def test_masks_match_selectors(frame):
+    negative = frame[["A", "B"]] < 0
+    configs = compile_masks([("colors", SC("bg", "red"), negative), ("align", ">", frame[["C"]] > 0)], frame)
+
+    assert configs["colors"] == str(S(frame.loc[frame.A < 0, ["A", "B"]], SC("bg", "red"), r=frame))
+    assert configs == {"colors": "2,4,5 1,2 bg red", "align": "1:5 3 >"}
+
+
+def test_masks_group_columns_by_rows(frame):
+    mask = np.zeros(frame.shape, dtype=bool)
+    mask[0:4, 0] = True
+    mask[1, 1] = True
+    mask[0:4, 2] = True
+
+    assert compile_masks([("format", ",.1%", mask)], frame) == {"format": "1:4 1,3 ,.1%\n2 2 ,.1%"}
+    assert compile_masks([("format", ",.1%", np.zeros(frame.shape, dtype=bool))], frame) == {}
+
+    with pytest.raises(ValueError, match="leaf must be one of"):
+        compile_masks([("colour", "red", mask)], frame)
+    with pytest.raises(ValueError, match="does not match"):
+        compile_masks([("format", ",.1%", mask[:2])], frame)
+
+
+def test_masks_offset_by_header_levels():
+    df = pd.DataFrame(
+        np.arange(8).reshape(4, 2),
+        index=pd.MultiIndex.from_product([["P", "Q"], ["1", "2"]]),
+        columns=pd.MultiIndex.from_arrays([["A", "A"], ["X", "Y"]]),
+    )
+    assert compile_masks([("colors", "fg blue", df > 5)], df) == {"colors": "5 2,3 fg blue"}
+
+
+def test_ctx_last_declaration_wins(frame):
+    ctx = {
+        (1, 0): [("color", "red"), ("color", "blue")],
+        (2, 0): [("color", "blue")],
+        (0, 2): [("text-align", "right"), ("font-weight", "bold")],
+        (1, 2): [("text-align", "right")],
+        (3, 1): [("background-color", "#eee")],
+    }
+    assert compile_ctx(ctx, frame) == {"colors": "2,3 1 fg blue\n4 2 bg #eee", "align": "1,2 3 >"}
+
+
+def test_styler(frame):
+    pytest.importorskip("jinja2")
+
+    styler = frame.style.map(lambda v: "color: red" if v < 0 else "").set_properties(
+        subset=["C"], **{"text-align": "center"}
+    )
+    assert compile_styler(styler) == {"colors": "2,4,5 1,2 fg red", "align": "1:5 3 -"}
@@ -2,7 +2,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from novem.table.utils import merge_from_index, merge_from_index_first_rows, merge_from_index_last_rows
+from novem.table.utils import (
+    find_all_index_breaks,
+    merge_from_index,
+    merge_from_index_first_rows,
+    merge_from_index_last_rows,
+)
 
 
 @pytest.fixture
@@ -377,5 +382,20 @@ def test_single_row_with_offset():
     assert merge_from_index_last_rows(df, io=3, level=0) == "3,4,5"
 
 
+def test_all_index_breaks(complex_multiindex):
+    """Test that every level's break points come back from one call"""
+    df = pd.DataFrame(index=complex_multiindex)
+    assert find_all_index_breaks(df) == ([[0, 3, 5], [0, 2, 3, 5], [0, 1, 2, 3, 4, 5]], 1, 6)
+    assert find_all_index_breaks(df, io=4) == ([[0, 3, 5], [0, 2, 3, 5], [0, 1, 2, 3, 4, 5]], 4, 6)
+    assert find_all_index_breaks(pd.Index([])) == ([[]], 1, 0)
+
+
+def test_missing_labels_break_every_row():
+    """Test that consecutive missing labels are never merged, as they never compare equal"""
+    index = pd.MultiIndex.from_arrays([["A", "A", "A", "A"], [None, None, "X", "X"]])
+    assert merge_from_index(index) == "1:4 0 lbl1\n3:4 1 lbl2"
+    assert merge_from_index_first_rows(index, level=1) == "1,2,3"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])